@@ -0,0 +1,28 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+
+class BatchGetRequest(BaseModel):
+    """
+    Model representing the request body of a batch berry lookup.
+
+    Attributes:
+        names (List[str]): The names of the berries to retrieve.
+    """
+    names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_SIZE,
+        description="Names of the berries to retrieve. Names are lowercased, stripped and deduplicated."
+    )
+
+    class Config:
+        """Configuration for the BatchGetRequest model."""
+        json_schema_extra = {
+            "example": {
+                "names": ["cheri", " Chesto", "cheri"]
+            }
+        }
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -58,3 +58,420 @@ class BerryStatsResponse(BaseModel):
                 ]
             }
         }
+
+
+class ValueFrequencyItem(BaseModel):
+    """
+    Model representing the frequency of a specific value of a berry field.
+
+    Attributes:
+        value (Union[int, float]): The value of the field.
+        frequency (int): The number of berries with that value.
+    """
+    value: Union[int, float]
+    frequency: int
+
+
+class HistogramBin(BaseModel):
+    """
+    Model representing the number of values of a berry field falling into a bin.
+
+    Attributes:
+        start (float): The lowest value of the bin.
+        end (float): The highest value of the bin.
+        count (int): The number of berries with a value in the bin.
+    """
+    start: float
+    end: float
+    count: int
+
+
+class FieldStats(BaseModel):
+    """
+    Model representing the statistics of a single numeric berry field.
+
+    Attributes:
+        min (float): The minimum value of the field.
+        median (float): The median value of the field.
+        max (float): The maximum value of the field.
+        variance (float): The variance of the field.
+        mean (float): The average value of the field.
+        frequency (List[ValueFrequencyItem]): The frequency of each value of the field.
+        quantiles (Optional[Dict[str, float]]): The requested quantiles of the field, by percentile label.
+        iqr (Optional[float]): The interquartile range of the field, if requested.
+        histogram (Optional[List[HistogramBin]]): The histogram of the field, if requested.
+    """
+    min: float = Field(..., description="Minimum value")
+    median: float = Field(..., description="Median value")
+    max: float = Field(..., description="Maximum value")
+    variance: float = Field(..., description="Variance of the values")
+    mean: float = Field(..., description="Average value")
+    frequency: List[ValueFrequencyItem] = Field(..., description="Frequency of the values")
+    quantiles: Optional[Dict[str, float]] = Field(None, description="Requested quantiles, such as p90")
+    iqr: Optional[float] = Field(None, description="Interquartile range, the 75th minus the 25th percentile")
+    histogram: Optional[List[HistogramBin]] = Field(None, description="Counts of values in equal-width bins")
+
+
+class MultiFieldStatsResponse(BaseModel):
+    """
+    Model representing the response structure for the statistics of several berry fields.
+
+    Attributes:
+        count (int): The number of berries the statistics were calculated from.
+        fields (Dict[str, FieldStats]): The statistics of each requested field.
+    """
+    count: int = Field(..., description="Number of berries")
+    fields: Dict[str, FieldStats] = Field(..., description="Statistics of each requested field")
+
+    class Config:
+        """Configuration for the MultiFieldStatsResponse model."""
+        json_schema_extra = {
+            "example": {
+                "count": 64,
+                "fields": {
+                    "size": {
+                        "min": 20,
+                        "median": 98.5,
+                        "max": 300,
+                        "variance": 3850.2,
+                        "mean": 107.3,
+                        "frequency": [
+                            {"value": 20, "frequency": 1},
+                            {"value": 28, "frequency": 2}
+                        ],
+                        "quantiles": {"p10": 32.0, "p90": 200.0},
+                        "iqr": 88.5
+                    }
+                }
+            }
+        }
+
+
+class GroupStats(BaseModel):
+    """
+    Model representing the growth time statistics of one group of berries.
+
+    Attributes:
+        group (str): The value of the grouping field shared by the berries.
+        berries_names (List[str]): The names of the berries in the group.
+        min_growth_time (float): The minimum growth time in the group.
+        median_growth_time (float): The median growth time in the group.
+        max_growth_time (float): The maximum growth time in the group.
+        variance_growth_time (float): The variance of the growth times in the group.
+        mean_growth_time (float): The average growth time in the group.
+        frequency_growth_time (List[FrequencyItem]): The frequency of each growth time in the group.
+    """
+    group: str = Field(..., description="Value of the grouping field")
+    berries_names: List[str] = Field(..., description="List of berry names in the group")
+    min_growth_time: float = Field(..., description="Minimum growth time")
+    median_growth_time: float = Field(..., description="Median growth time")
+    max_growth_time: float = Field(..., description="Maximum growth time")
+    variance_growth_time: float = Field(..., description="Variance of growth times")
+    mean_growth_time: float = Field(..., description="Average growth time")
+    frequency_growth_time: List[FrequencyItem] = Field(..., description="Frequency of growth times")
+
+
+class GroupByStatsResponse(BaseModel):
+    """
+    Model representing the response structure for growth time statistics grouped by a berry field.
+
+    Attributes:
+        dimension (str): The field the berries are grouped by.
+        groups (List[GroupStats]): The statistics of each group.
+    """
+    dimension: str = Field(..., description="Field the berries are grouped by")
+    groups: List[GroupStats] = Field(..., description="Statistics of each group")
+
+    class Config:
+        """Configuration for the GroupByStatsResponse model."""
+        json_schema_extra = {
+            "example": {
+                "dimension": "firmness",
+                "groups": [
+                    {
+                        "group": "hard",
+                        "berries_names": ["wiki", "mago"],
+                        "min_growth_time": 5,
+                        "median_growth_time": 5,
+                        "max_growth_time": 5,
+                        "variance_growth_time": 0,
+                        "mean_growth_time": 5,
+                        "frequency_growth_time": [{"growth_time": 5, "frequency": 2}]
+                    }
+                ]
+            }
+        }
+
+
+class CrawlStats(BaseModel):
+    """
+    Model representing how many PokeAPI calls resolving the linked resources took and saved.
+
+    Attributes:
+        references (int): The number of links followed, duplicates included.
+        fetched (int): The number of distinct resources requested.
+        saved (int): The number of upstream calls avoided by requesting each distinct resource once.
+        errors (int): The number of distinct resources that could not be fetched.
+    """
+    references: int = Field(..., description="Links followed, duplicates included")
+    fetched: int = Field(..., description="Distinct resources requested")
+    saved: int = Field(..., description="Upstream calls avoided by deduplication")
+    errors: int = Field(..., description="Distinct resources that could not be fetched")
+
+
+class FlavorStats(BaseModel):
+    """
+    Model representing the potency statistics of one berry flavor.
+
+    Attributes:
+        flavor (str): The flavor.
+        display_name (Optional[str]): The English name of the flavor.
+        contest_type (Optional[str]): The contest type the flavor is associated with.
+        berries (int): The number of berries with a non-zero potency of the flavor.
+        min_potency (Optional[float]): The minimum non-zero potency.
+        median_potency (Optional[float]): The median non-zero potency.
+        max_potency (Optional[float]): The maximum non-zero potency.
+        mean_potency (Optional[float]): The average non-zero potency.
+        variance_potency (Optional[float]): The variance of the non-zero potencies.
+    """
+    flavor: str = Field(..., description="Flavor")
+    display_name: Optional[str] = Field(None, description="English name of the flavor")
+    contest_type: Optional[str] = Field(None, description="Contest type of the flavor")
+    berries: int = Field(..., description="Number of berries with this flavor")
+    min_potency: Optional[float] = Field(None, description="Minimum potency")
+    median_potency: Optional[float] = Field(None, description="Median potency")
+    max_potency: Optional[float] = Field(None, description="Maximum potency")
+    mean_potency: Optional[float] = Field(None, description="Average potency")
+    variance_potency: Optional[float] = Field(None, description="Variance of potencies")
+
+
+class FlavorStatsResponse(BaseModel):
+    """
+    Model representing the response structure for the potency statistics of every berry flavor.
+
+    Attributes:
+        flavors (List[FlavorStats]): The statistics of each flavor.
+        crawl (CrawlStats): The PokeAPI calls made and saved to resolve the linked resources.
+    """
+    flavors: List[FlavorStats] = Field(..., description="Statistics of each flavor")
+    crawl: CrawlStats = Field(..., description="PokeAPI calls made and saved")
+
+    class Config:
+        """Configuration for the FlavorStatsResponse model."""
+        json_schema_extra = {
+            "example": {
+                "flavors": [
+                    {
+                        "flavor": "spicy",
+                        "display_name": "Spicy",
+                        "contest_type": "cool",
+                        "berries": 28,
+                        "min_potency": 10,
+                        "median_potency": 10,
+                        "max_potency": 40,
+                        "mean_potency": 16.4,
+                        "variance_potency": 93.1
+                    }
+                ],
+                "crawl": {"references": 448, "fetched": 74, "saved": 374, "errors": 0}
+            }
+        }
+
+
+class FirmnessStats(BaseModel):
+    """
+    Model representing the berries of one firmness and the cost of their items.
+
+    Attributes:
+        firmness (str): The firmness.
+        display_name (Optional[str]): The English name of the firmness.
+        berries_names (List[str]): The names of the berries with this firmness.
+        min_item_cost (Optional[float]): The minimum cost of their items.
+        median_item_cost (Optional[float]): The median cost of their items.
+        max_item_cost (Optional[float]): The maximum cost of their items.
+        mean_item_cost (Optional[float]): The average cost of their items.
+        variance_item_cost (Optional[float]): The variance of the cost of their items.
+    """
+    firmness: str = Field(..., description="Firmness")
+    display_name: Optional[str] = Field(None, description="English name of the firmness")
+    berries_names: List[str] = Field(..., description="List of berry names with this firmness")
+    min_item_cost: Optional[float] = Field(None, description="Minimum item cost")
+    median_item_cost: Optional[float] = Field(None, description="Median item cost")
+    max_item_cost: Optional[float] = Field(None, description="Maximum item cost")
+    mean_item_cost: Optional[float] = Field(None, description="Average item cost")
+    variance_item_cost: Optional[float] = Field(None, description="Variance of item costs")
+
+
+class FirmnessStatsResponse(BaseModel):
+    """
+    Model representing the response structure for the berries and item costs of every firmness.
+
+    Attributes:
+        firmness (List[FirmnessStats]): The statistics of each firmness.
+        crawl (CrawlStats): The PokeAPI calls made and saved to resolve the linked resources.
+    """
+    firmness: List[FirmnessStats] = Field(..., description="Statistics of each firmness")
+    crawl: CrawlStats = Field(..., description="PokeAPI calls made and saved")
+
+    class Config:
+        """Configuration for the FirmnessStatsResponse model."""
+        json_schema_extra = {
+            "example": {
+                "firmness": [
+                    {
+                        "firmness": "soft",
+                        "display_name": "Soft",
+                        "berries_names": ["cheri", "rawst"],
+                        "min_item_cost": 80,
+                        "median_item_cost": 80,
+                        "max_item_cost": 200,
+                        "mean_item_cost": 120,
+                        "variance_item_cost": 3200
+                    }
+                ],
+                "crawl": {"references": 448, "fetched": 74, "saved": 374, "errors": 0}
+            }
+        }
+
+
+class ResourceStatsResponse(BaseModel):
+    """
+    Model representing the statistics of a numeric field over every entry of a PokeAPI resource.
+
+    Attributes:
+        resource (str): The PokeAPI resource.
+        field (str): The dotted path of the field.
+        entries (int): The number of entries of the resource.
+        missing (int): The number of entries without a numeric value at the field path.
+        errors (int): The number of entries that could not be fetched.
+        count (int): The number of values the statistics were calculated from.
+        min (float): The minimum value.
+        median (float): The median value.
+        max (float): The maximum value.
+        variance (float): The variance of the values.
+        mean (float): The average value.
+        frequency (List[ValueFrequencyItem]): The frequency of each value.
+    """
+    resource: str = Field(..., description="PokeAPI resource")
+    field: str = Field(..., description="Dotted path of the field")
+    entries: int = Field(..., description="Number of entries of the resource")
+    missing: int = Field(..., description="Number of entries without a numeric value at the field path")
+    errors: int = Field(..., description="Number of entries that could not be fetched")
+    count: int = Field(..., description="Number of values")
+    min: float = Field(..., description="Minimum value")
+    median: float = Field(..., description="Median value")
+    max: float = Field(..., description="Maximum value")
+    variance: float = Field(..., description="Variance of the values")
+    mean: float = Field(..., description="Average value")
+    frequency: List[ValueFrequencyItem] = Field(..., description="Frequency of the values")
+
+    class Config:
+        """Configuration for the ResourceStatsResponse model."""
+        json_schema_extra = {
+            "example": {
+                "resource": "pokemon",
+                "field": "base_experience",
+                "entries": 1302,
+                "missing": 0,
+                "errors": 0,
+                "count": 1302,
+                "min": 36,
+                "median": 161,
+                "max": 608,
+                "variance": 6215.4,
+                "mean": 156.2,
+                "frequency": [
+                    {"value": 36, "frequency": 1},
+                    {"value": 39, "frequency": 3}
+                ]
+            }
+        }
+
+
+class BerryRecord(BaseModel):
+    """
+    Model representing the fields of a berry used by this API.
+
+    Attributes:
+        name (str): The berry name.
+        growth_time (Optional[int]): Hours the tree takes to grow one stage.
+        size (Optional[int]): The size of the berry, in millimeters.
+        smoothness (Optional[int]): The smoothness of the berry.
+        soil_dryness (Optional[int]): How fast the berry dries the soil.
+        max_harvest (Optional[int]): The maximum number of berries a tree yields.
+        natural_gift_power (Optional[int]): The power of Natural Gift with this berry.
+        firmness (Optional[str]): The firmness of the berry.
+        natural_gift_type (Optional[str]): The type of Natural Gift with this berry.
+        item (Optional[str]): The item corresponding to the berry.
+        flavors (Dict[str, int]): The potency of each flavor of the berry.
+    """
+    name: str = Field(..., description="Berry name")
+    growth_time: Optional[int] = Field(None, description="Hours the tree takes to grow one stage")
+    size: Optional[int] = Field(None, description="Size of the berry in millimeters")
+    smoothness: Optional[int] = Field(None, description="Smoothness of the berry")
+    soil_dryness: Optional[int] = Field(None, description="How fast the berry dries the soil")
+    max_harvest: Optional[int] = Field(None, description="Maximum number of berries a tree yields")
+    natural_gift_power: Optional[int] = Field(None, description="Power of Natural Gift with this berry")
+    firmness: Optional[str] = Field(None, description="Firmness of the berry")
+    natural_gift_type: Optional[str] = Field(None, description="Type of Natural Gift with this berry")
+    item: Optional[str] = Field(None, description="Item corresponding to the berry")
+    flavors: Dict[str, int] = Field(default_factory=dict, description="Potency of each flavor")
+
+
+class BatchGetItem(BaseModel):
+    """
+    Model representing the result of one berry of a batch lookup.
+
+    Attributes:
+        name (str): The normalized berry name.
+        berry (Optional[BerryRecord]): The berry, if it was found.
+        error (Optional[str]): The reason the berry could not be retrieved, if any.
+        status (Optional[int]): The HTTP status of the failure, if any: 400 for an invalid name, 404 for an
+            unknown berry, 502 for a PokeAPI failure.
+    """
+    name: str = Field(..., description="Normalized berry name")
+    berry: Optional[BerryRecord] = Field(None, description="The berry, if it was found")
+    error: Optional[str] = Field(None, description="Why the berry could not be retrieved")
+    status: Optional[int] = Field(None, description="HTTP status of the failure: 400, 404 or 502")
+
+
+class BatchGetResponse(BaseModel):
+    """
+    Model representing the response structure for a batch berry lookup.
+
+    Attributes:
+        berries (List[BatchGetItem]): One result per distinct requested berry, in request order.
+    """
+    berries: List[BatchGetItem] = Field(..., description="One result per distinct requested berry")
+
+    class Config:
+        """Configuration for the BatchGetResponse model."""
+        json_schema_extra = {
+            "example": {
+                "berries": [
+                    {
+                        "name": "cheri",
+                        "berry": {
+                            "name": "cheri",
+                            "growth_time": 3,
+                            "size": 20,
+                            "smoothness": 25,
+                            "soil_dryness": 15,
+                            "max_harvest": 5,
+                            "natural_gift_power": 60,
+                            "firmness": "soft",
+                            "natural_gift_type": "fire",
+                            "item": "cheri-berry",
+                            "flavors": {"spicy": 10, "dry": 0, "sweet": 0, "bitter": 0, "sour": 0}
+                        },
+                        "error": None
+                    },
+                    {
+                        "name": "unknown",
+                        "berry": None,
+                        "error": "Berry unknown not found",
+                        "status": 404
+                    }
+                ]
+            }
+        }
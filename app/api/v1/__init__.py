@@ -1,6 +1,10 @@
 from fastapi import APIRouter
 
+from .endpoints.berries import router as berries_router
 from .endpoints.berry_stats import router as berry_stats_router
+from .endpoints.resource_stats import router as resource_stats_router
 
 router = APIRouter()
 router.include_router(berry_stats_router)
+router.include_router(berries_router)
+router.include_router(resource_stats_router)
@@ -1,3 +1,5 @@
+from .berries import router as berries_router
 from .berry_stats import router as berry_stats_router
+from .resource_stats import router as resource_stats_router
 
-__all__ = ['berry_stats_router']
+__all__ = ['berries_router', 'berry_stats_router', 'resource_stats_router']
@@ -0,0 +1,113 @@
+import json
+from typing import AsyncIterator, Dict
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.api.requests import BatchGetRequest
+from app.api.responses import BatchGetResponse
+from app.core.exceptions import ServiceError
+from app.services.berry_service import berry_service
+
+router = APIRouter(
+    prefix="/v1",
+    tags=["berries"]
+)
+
+
+async def ndjson_lines(items: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+    """
+    Encodes items as newline-delimited JSON, one line per item.
+
+    Args:
+        items (AsyncIterator[Dict]): The items to encode.
+
+    Yields:
+        bytes: One JSON line per item.
+    """
+    async for item in items:
+        yield json.dumps(item, separators=(",", ":")).encode() + b"\n"
+
+
+@router.get(
+    "/berries/stream",
+    response_class=StreamingResponse,
+    response_description="Berry records as newline-delimited JSON",
+    responses={
+        200: {
+            "description": "One line per berry as soon as it is fetched, then a line with the statistics",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"type":"berry","name":"cheri","growth_time":3,...}\n'
+                               '{"type":"error","name":"chesto","error":"Error fetching berry chesto"}\n'
+                               '{"type":"stats","count":1,"errors":1,"min_growth_time":3.0,...}\n'
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def stream_berries() -> StreamingResponse:
+    """
+    Asynchronously streams every berry record as newline-delimited JSON.
+    This function lists the berries, then fetches their details concurrently and writes each projected
+    record as soon as its fetch completes, so the first records arrive after one upstream round trip. The
+    last line holds the growth time statistics of the streamed berries. A berry that could not be fetched
+    is reported in an error line instead of failing the stream.
+
+    Returns:
+        StreamingResponse: The berry records, error lines and statistics, one JSON object per line.
+
+    Raises:
+        HTTPException: If the berry list could not be retrieved.
+    """
+    try:
+        names = await berry_service.list_berry_names()
+    except ServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return StreamingResponse(
+        ndjson_lines(berry_service.stream_berries(names)),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post(
+    "/berries:batchGet",
+    response_model=BatchGetResponse,
+    response_description="Berries retrieved by name",
+    responses={
+        200: {
+            "description": "Berries retrieved, with an error for each berry that could not be retrieved",
+            "content": {
+                "application/json": {
+                    "example": BatchGetResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        422: {
+            "description": "Missing names or too many names"
+        }
+    }
+)
+async def batch_get_berries(request: BatchGetRequest):
+    """
+    Asynchronously retrieves several berries by name in one call.
+    This function normalizes and deduplicates the names, serves cached berries from the PokeAPI response
+    cache and fetches only the others, concurrently. Each berry that cannot be retrieved, for example
+    because it does not exist, is reported with its error while the others are still returned.
+
+    Args:
+        request (BatchGetRequest): The names of the berries to retrieve.
+
+    Returns:
+        The result of each distinct berry, in request order.
+    """
+    return {"berries": await berry_service.get_berries(request.names)}
@@ -1,14 +1,142 @@
-from fastapi import APIRouter, HTTPException
+from typing import Callable, Dict, Hashable, List, Optional
 
-from app.api.responses import BerryStatsResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.api.responses import (
+    BerryStatsResponse,
+    FirmnessStatsResponse,
+    FlavorStatsResponse,
+    GroupByStatsResponse,
+    MultiFieldStatsResponse
+)
+from app.core.config import settings
 from app.core.exceptions import ServiceError
-from app.services.berry_service import berry_service
+from app.core.timing import span
+from app.services.berry_service import (
+    NUMERIC_FIELDS,
+    berry_service,
+    parse_quantiles,
+    validate_dimension,
+    validate_numeric_fields
+)
+from app.services.berry_store import BerryStore, parse_filter
+from app.services.relation_service import relation_service
+from app.services.snapshot_service import StatsSnapshot, snapshot_service
+from app.utils.compression import AVAILABLE_ENCODINGS, IDENTITY, compress
+from app.utils.http import etag_matches, negotiate_encoding
 
 router = APIRouter(
     prefix="/v1",
     tags=["berry-stats"]
 )
 
+MAX_HISTOGRAM_BINS = 100
+
+
+def encode_model(model, stats: Dict) -> bytes:
+    """
+    Validates statistics against a response model and encodes them as JSON.
+
+    Args:
+        model: The pydantic response model.
+        stats (Dict): The statistics.
+
+    Returns:
+        bytes: The JSON response body.
+    """
+    return model.model_validate(stats).model_dump_json().encode()
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    """
+    Derives the entity tag of a compressed representation, which must differ from the uncompressed one.
+
+    Args:
+        etag (str): The strong entity tag of the uncompressed representation.
+        encoding (str): The content coding of the representation.
+
+    Returns:
+        str: The entity tag of the representation.
+    """
+    return etag if encoding == IDENTITY else f'{etag[:-1]}-{encoding}"'
+
+
+def encoded_response(
+        request: Request,
+        snapshot: StatsSnapshot,
+        key: Hashable,
+        encode: Callable[[], bytes],
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None
+) -> Response:
+    """
+    Builds a JSON response whose body, and each compressed variant of it, is produced once per snapshot.
+
+    The content coding is negotiated from ``Accept-Encoding``. The uncompressed body is memoized on the
+    snapshot under ``key`` and each compressed variant under ``(key, encoding)``, so a request only picks
+    the bytes matching its coding.
+
+    Args:
+        request (Request): The incoming request, used to read the Accept-Encoding header.
+        snapshot (StatsSnapshot): The snapshot the body is derived from.
+        key (Hashable): The memoization key of the uncompressed body.
+        encode (Callable[[], bytes]): Produces the uncompressed body.
+        headers (Optional[Dict[str, str]]): Additional response headers.
+        encoding (Optional[str]): The content coding, if it was already negotiated.
+
+    Returns:
+        Response: The encoded response.
+    """
+    encoding = encoding or negotiate_encoding(request.headers.get("accept-encoding"), AVAILABLE_ENCODINGS)
+    headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+
+    with span("serialize"):
+        body = snapshot.memoize(key, encode)
+        if encoding != IDENTITY:
+            body = snapshot.memoize((key, encoding), lambda: compress(body, encoding))
+            headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def get_snapshot() -> StatsSnapshot:
+    """
+    Returns the current snapshot, translating failures into HTTP errors.
+
+    Returns:
+        StatsSnapshot: The current snapshot.
+
+    Raises:
+        HTTPException: If the snapshot is not available.
+    """
+    try:
+        with span("snapshot"):
+            return await snapshot_service.get()
+    except ServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
+def get_berry_store(snapshot: StatsSnapshot) -> BerryStore:
+    """
+    Returns the columnar berry store of a snapshot.
+
+    Args:
+        snapshot (StatsSnapshot): The snapshot.
+
+    Returns:
+        BerryStore: The berry store, built once per snapshot.
+
+    Raises:
+        HTTPException: If the berry catalog of the snapshot is not available.
+    """
+    if snapshot.berries is None:
+        raise HTTPException(status_code=500, detail="Berry catalog is not available yet")
+
+    with span("store"):
+        return snapshot.memoize("store", lambda: BerryStore(snapshot.berries))
+
 
 @router.get(
     "/allBerryStats",
@@ -23,6 +151,9 @@ router = APIRouter(
                 }
             }
         },
+        304: {
+            "description": "The statistics have not changed since the version identified by If-None-Match"
+        },
         500: {
             "description": "Internal server error",
             "content": {
@@ -33,21 +164,319 @@ router = APIRouter(
         }
     }
 )
-async def get_berry_stats():
+async def get_berry_stats(request: Request) -> Response:
     """
     Asynchronously retrieves berry statistics.
-    This function calls the BerryService to obtain statistics related to berries. 
+    This function reads the precomputed statistics snapshot, building it first if none exists yet.
+    The snapshot is identified by a strong ``ETag``; a request whose ``If-None-Match`` matches it gets an
+    empty 304 response. ``Cache-Control`` allows caching for ``CACHE_TTL`` seconds, and the age of the
+    snapshot in seconds is sent in the ``X-Snapshot-Age`` header.
+    The JSON body is validated and encoded once per snapshot and then sent as is, so requests skip
+    response model validation and serialization. Gzip and brotli variants are negotiated from
+    ``Accept-Encoding`` and are also compressed once per snapshot; each has its own ``ETag``.
     It handles potential service errors and raises an HTTPException with a 500 status code if an error occurs.
 
+    Args:
+        request (Request): The incoming request, used to read the If-None-Match and Accept-Encoding headers.
+
+    Returns:
+        Response: The encoded statistics of the current snapshot, or an empty 304 response.
+
+    Raises:
+        HTTPException: If a ServiceError occurs or if an unexpected error arises during the process.
+    """
+    snapshot = await get_snapshot()
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), AVAILABLE_ENCODINGS)
+    etag = variant_etag(snapshot.etag, encoding)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.CACHE_TTL}",
+        "X-Snapshot-Age": str(int(snapshot.age)),
+        "Vary": "Accept-Encoding"
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag) or etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        return encoded_response(
+            request, snapshot, "json", lambda: encode_model(BerryStatsResponse, snapshot.stats), headers, encoding
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
+@router.get(
+    "/berryStats",
+    response_model=MultiFieldStatsResponse,
+    response_model_exclude_none=True,
+    response_description="Berry Field Statistics",
+    responses={
+        200: {
+            "description": "Statistics calculated successfully",
+            "content": {
+                "application/json": {
+                    "example": MultiFieldStatsResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        400: {
+            "description": "Invalid fields or filters",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Invalid fields: color"}
+                }
+            }
+        },
+        404: {
+            "description": "No berries match the filters",
+            "content": {
+                "application/json": {
+                    "example": {"error": "No berries match the given filters"}
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def get_berry_field_stats(
+        fields: str = Query(
+            "growth_time",
+            description=f"Comma-separated numeric berry fields. Valid fields are: {', '.join(NUMERIC_FIELDS)}"
+        ),
+        filter: List[str] = Query(
+            [],
+            description="Filters the berries must satisfy, such as firmness=hard or growth_time>5. "
+                        "Can be repeated."
+        ),
+        quantiles: str = Query(
+            "",
+            description="Comma-separated quantiles to calculate for every field, as percentiles such as p90, "
+                        "quantiles such as 0.9, or iqr for the interquartile range"
+        ),
+        bins: Optional[int] = Query(
+            None,
+            ge=1,
+            le=MAX_HISTOGRAM_BINS,
+            description="Number of equal-width histogram bins to count the values of every field into"
+        )
+):
+    """
+    Asynchronously retrieves statistics for several numeric berry fields.
+    This function queries the columnar berry store of the current snapshot, selects the berries matching
+    every filter, and calculates the min, median, max, variance, mean and frequency of every requested field
+    in one vectorized pass. Requested quantiles, the interquartile range and histogram bins are calculated
+    from a cumulative histogram of each field, without sorting.
+
+    Args:
+        fields (str): Comma-separated names of the numeric fields to calculate statistics for.
+        filter (List[str]): Filter expressions the berries must satisfy.
+        quantiles (str): Comma-separated quantiles to calculate for every field.
+        bins (Optional[int]): The number of histogram bins, or None for no histogram.
+
+    Returns:
+        The statistics of each requested field.
+
+    Raises:
+        ValidationException: If a field or filter is invalid.
+        NotFoundError: If no berry matches the filters.
+        HTTPException: If a ServiceError occurs or if an unexpected error arises during the process.
+    """
+    requested = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    validate_numeric_fields(requested)
+    filters = [parse_filter(expression) for expression in filter]
+    requested_quantiles, iqr = parse_quantiles(quantiles)
+
+    store = get_berry_store(await get_snapshot())
+    try:
+        return berry_service.calculate_field_statistics(store, requested, filters, requested_quantiles, iqr, bins)
+    except ServiceError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get(
+    "/berryStats/groupBy/{dimension}",
+    response_model=GroupByStatsResponse,
+    response_description="Berry Statistics by Group",
+    responses={
+        200: {
+            "description": "Statistics calculated successfully",
+            "content": {
+                "application/json": {
+                    "example": GroupByStatsResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        400: {
+            "description": "Invalid dimension",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Invalid dimension: color"}
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def get_berry_group_stats(dimension: str, request: Request) -> Response:
+    """
+    Asynchronously retrieves growth time statistics grouped by a categorical berry field.
+    This function computes the min, median, max, variance, mean and frequency of the growth times of every
+    group in one pass over the columnar berry store of the current snapshot. The result depends only on the
+    snapshot and the dimension, so it is encoded, and compressed for the negotiated ``Accept-Encoding``,
+    once per snapshot.
+
+    Args:
+        dimension (str): The field to group by, either firmness or natural_gift_type.
+        request (Request): The incoming request, used to read the Accept-Encoding header.
+
     Returns:
-        The result of the berry statistics retrieval.
+        Response: The growth time statistics of each group.
 
     Raises:
+        ValidationException: If the dimension is not a categorical berry field.
         HTTPException: If a ServiceError occurs or if an unexpected error arises during the process.
     """
+    validate_dimension(dimension)
+
+    snapshot = await get_snapshot()
+    store = get_berry_store(snapshot)
     try:
-        return await berry_service.get_all_berry_stats()
+        return encoded_response(
+            request,
+            snapshot,
+            ("groupBy", dimension),
+            lambda: encode_model(
+                GroupByStatsResponse, berry_service.calculate_group_statistics(store, dimension)
+            )
+        )
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+async def relation_response(request: Request, aggregate: str, model) -> Response:
+    """
+    Builds the response of a flavor or firmness aggregate of the current snapshot.
+
+    Args:
+        request (Request): The incoming request, used to read the Accept-Encoding header.
+        aggregate (str): The aggregate, either ``flavors`` or ``firmness``.
+        model: The response model of the aggregate.
+
+    Returns:
+        Response: The encoded aggregate.
+
+    Raises:
+        HTTPException: If the berry catalog is not available or the aggregate could not be computed.
+    """
+    snapshot = await get_snapshot()
+    if snapshot.berries is None:
+        raise HTTPException(status_code=500, detail="Berry catalog is not available yet")
+
+    try:
+        aggregates = await relation_service.get_aggregates(snapshot)
+        return encoded_response(
+            request, snapshot, ("relations", aggregate), lambda: encode_model(model, aggregates[aggregate])
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
+@router.get(
+    "/berryStats/flavors",
+    response_model=FlavorStatsResponse,
+    response_description="Berry Statistics by Flavor",
+    responses={
+        200: {
+            "description": "Statistics calculated successfully",
+            "content": {
+                "application/json": {
+                    "example": FlavorStatsResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def get_berry_flavor_stats(request: Request) -> Response:
+    """
+    Asynchronously retrieves the potency statistics of every berry flavor.
+    This function resolves the flavor, firmness and item resources the berries of the current snapshot link
+    to, requesting each distinct resource once and concurrently, and aggregates the non-zero potencies of
+    each flavor with its English name and contest type. The aggregates are computed once per snapshot and
+    report how many PokeAPI calls deduplicating the links saved.
+
+    Args:
+        request (Request): The incoming request, used to read the Accept-Encoding header.
+
+    Returns:
+        Response: The statistics of each flavor and the crawl counters.
+
+    Raises:
+        HTTPException: If a ServiceError occurs or if an unexpected error arises during the process.
+    """
+    return await relation_response(request, "flavors", FlavorStatsResponse)
+
+
+@router.get(
+    "/berryStats/firmness",
+    response_model=FirmnessStatsResponse,
+    response_description="Berry Statistics by Firmness",
+    responses={
+        200: {
+            "description": "Statistics calculated successfully",
+            "content": {
+                "application/json": {
+                    "example": FirmnessStatsResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def get_berry_firmness_stats(request: Request) -> Response:
+    """
+    Asynchronously retrieves the berries of every firmness and the cost statistics of their items.
+    This function resolves the linked resources of the berries of the current snapshot like the flavor
+    statistics, sharing the same crawl, and aggregates the berries of each firmness with its English name
+    and the costs of their items.
+
+    Args:
+        request (Request): The incoming request, used to read the Accept-Encoding header.
+
+    Returns:
+        Response: The berries and item cost statistics of each firmness and the crawl counters.
+
+    Raises:
+        HTTPException: If a ServiceError occurs or if an unexpected error arises during the process.
+    """
+    return await relation_response(request, "firmness", FirmnessStatsResponse)
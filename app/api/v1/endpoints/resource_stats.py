@@ -0,0 +1,71 @@
+from fastapi import APIRouter
+
+from app.api.responses import ResourceStatsResponse
+from app.services.resource_stats_service import resource_stats_service
+
+router = APIRouter(
+    prefix="/v1",
+    tags=["resource-stats"]
+)
+
+
+@router.get(
+    "/stats/{resource}/{field}",
+    response_model=ResourceStatsResponse,
+    response_description="Statistics of a field over a PokeAPI resource",
+    responses={
+        200: {
+            "description": "Statistics calculated successfully",
+            "content": {
+                "application/json": {
+                    "example": ResourceStatsResponse.Config.json_schema_extra["example"]
+                }
+            }
+        },
+        400: {
+            "description": "Malformed resource or field, or resource too large",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Invalid resource: Pokemon!"}
+                }
+            }
+        },
+        404: {
+            "description": "Unknown resource, or no numeric value at the field path",
+            "content": {
+                "application/json": {
+                    "example": {"error": "No numeric values of name found in pokemon"}
+                }
+            }
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"error": "Internal server error"}
+                }
+            }
+        }
+    }
+)
+async def get_resource_field_stats(resource: str, field: str):
+    """
+    Asynchronously retrieves statistics of a numeric field over every entry of any PokeAPI list resource.
+    This function lists the resource, such as pokemon or item, fetches its entries concurrently and adds the
+    values found at the dotted field path, such as base_experience or stats.base_stat, to a streaming
+    aggregator as they arrive. Entries that cannot be fetched or have no value are counted, not fatal.
+    The statistics are cached, and concurrent requests for the same resource and field share one crawl.
+
+    Args:
+        resource (str): The PokeAPI list resource.
+        field (str): The dotted path of a numeric field in each entry.
+
+    Returns:
+        The count, min, median, max, variance, mean and frequency of the values.
+
+    Raises:
+        ValidationException: If the resource or field is malformed, or the resource is too large.
+        NotFoundError: If the resource does not exist or has no numeric value at the field path.
+        ServiceError: If the resource could not be listed.
+    """
+    return await resource_stats_service.get_field_stats(resource, field)
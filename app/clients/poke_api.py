@@ -1,68 +1,419 @@
-from typing import Dict, List, Union
+import asyncio
+import re
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
-import requests
+import httpx
 
+from app.clients.resilience import CircuitBreaker, LatencyTracker, backoff_delay
 from app.core.config import settings
 from app.core.exceptions import PokeAPIException
+from app.core.metrics import (
+    UPSTREAM_ATTEMPTS,
+    UPSTREAM_REQUEST_SECONDS,
+    UPSTREAM_REQUESTS_IN_FLIGHT,
+    endpoint_label,
+    register_cache
+)
+from app.core.timing import record
+from app.utils.cache import TTLCache
+
+
+BERRY_NAME = re.compile(r"^[a-z0-9-]+$")
+
+
+class RetriableError(PokeAPIException):
+    """
+    Exception raised for PokeAPI failures that are worth retrying: network errors, timeouts, 429 and 5xx.
+    """
+
+
+def normalize_berry_name(berry_name: str) -> str:
+    """
+    Normalizes a berry name the way the PokeAPI expects it.
+
+    Args:
+        berry_name (str): The berry name.
+
+    Returns:
+        str: The lowercased name without surrounding whitespace.
+    """
+    return berry_name.lower().strip()
+
+
+class UpstreamResponse(NamedTuple):
+    """
+    A parsed PokeAPI response and the validators used to revalidate it.
+
+    Attributes:
+        data (Dict): The JSON body of the response.
+        etag (Optional[str]): The ``ETag`` header of the response, if any.
+        last_modified (Optional[str]): The ``Last-Modified`` header of the response, if any.
+    """
+    data: Dict
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class PokeAPIClient:
     """
-    Client for interacting with the PokeAPI.
+    Asynchronous client for interacting with the PokeAPI.
 
     This class provides methods to fetch data from the PokeAPI, including retrieving a list of all berries
-    and obtaining details for a specific berry. It manages the session and handles pagination for berry requests.
+    and obtaining details for a specific berry. It keeps a pooled keep-alive ``httpx.AsyncClient`` and
+    bounds how many detail requests run at the same time. When caching is enabled, responses are kept
+    in a TTL cache keyed by endpoint, together with their ``ETag`` and ``Last-Modified`` validators. An
+    expired entry is revalidated with a conditional request, and a 304 answer extends it without
+    downloading or parsing the body again.
+
+    Requests go through a resilience layer: each attempt has a short deadline, transient failures are
+    retried with jittered exponential backoff, a circuit breaker fails fast while the PokeAPI is down,
+    and a duplicate (hedged) request is sent when an attempt is slower than the recent p95 latency.
+    When a request fails or the breaker is open, a stale cached response is served if there is one.
 
     Attributes:
         base_url (str): The base URL for the PokeAPI.
-        timeout (int): The timeout duration for API requests.
-        session (requests.Session): The session used for making requests to the API.
+        timeout (int): The overall deadline of a request, including retries, in seconds.
+        request_timeout (float): The deadline of a single attempt in seconds.
+        retries (int): The number of retries after a transient failure.
+        backoff_base (float): The backoff ceiling of the first retry in seconds.
+        backoff_max (float): The largest backoff ceiling in seconds.
+        hedge_enabled (bool): Whether slow attempts are hedged.
+        max_concurrency (int): The maximum number of concurrent detail requests.
+        page_size (int): The number of entries requested per page of a list resource.
+        cache (Optional[TTLCache]): The response cache of UpstreamResponse entries, or None if caching
+            is disabled.
+        breaker (CircuitBreaker): The circuit breaker guarding the PokeAPI.
+        latency (LatencyTracker): The recent latencies used to decide when to hedge.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
         """
-        Initializes the PokeAPIClient with base URL and timeout settings.
+        Initializes the PokeAPIClient with base URL, timeout and concurrency settings.
+
+        Args:
+            transport (Optional[httpx.AsyncBaseTransport]): Custom transport for the HTTP client,
+                mainly useful for tests.
         """
         self.base_url: str = settings.POKEAPI_BASE_URL
         self.timeout: int = settings.POKEAPI_TIMEOUT
-        self.session: requests.Session = requests.Session()
+        self.request_timeout: float = settings.POKEAPI_REQUEST_TIMEOUT
+        self.retries: int = settings.POKEAPI_RETRIES
+        self.backoff_base: float = settings.POKEAPI_BACKOFF_BASE
+        self.backoff_max: float = settings.POKEAPI_BACKOFF_MAX
+        self.hedge_enabled: bool = settings.POKEAPI_HEDGE_ENABLED
+        self.max_concurrency: int = settings.POKEAPI_MAX_CONCURRENCY
+        self.page_size: int = settings.POKEAPI_PAGE_SIZE
+        self.cache: Optional[TTLCache] = (
+            TTLCache(settings.CACHE_MAX_SIZE, settings.CACHE_TTL) if settings.CACHE_ENABLED else None
+        )
+        self.breaker = CircuitBreaker(
+            settings.POKEAPI_CIRCUIT_FAILURE_THRESHOLD,
+            settings.POKEAPI_CIRCUIT_RESET_TIMEOUT
+        )
+        self.latency = LatencyTracker(settings.POKEAPI_HEDGE_QUANTILE, settings.POKEAPI_HEDGE_MIN_SAMPLES)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client bound to the running event loop, creating it if needed.
+
+        The connection pool and the semaphore are tied to the event loop they were first used in,
+        so they are rebuilt when the client is used from a different loop.
+
+        Returns:
+            httpx.AsyncClient: The pooled HTTP client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                transport=self._transport
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client
 
-    def __del__(self) -> None:
+    async def aclose(self) -> None:
         """
-        Closes the session when the client is deleted.
+        Closes the underlying HTTP client and its connection pool.
         """
-        self.session.close()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+            self._loop = None
 
-    def _make_request(self, endpoint: str) -> Dict:
+    async def _make_request(self, endpoint: str, use_cache: bool = True) -> Dict:
         """
         Makes a request to the specified endpoint of the PokeAPI.
 
         This method handles the request and response, raising an exception if the request fails.
+        Successful responses are served from the cache while they are fresh. Transient failures are
+        retried within the overall deadline, and while the circuit breaker is open the call fails fast.
+        If the call cannot be completed, a stale cached response is returned when available. The latency
+        of every call is recorded with its outcome: ok, cache_hit, revalidated, stale, timeout, circuit_open
+        or error.
 
         Args:
             endpoint (str): The API endpoint to request data from.
+            use_cache (bool): Whether to read and store the response in the cache. Bulk crawls that read each
+                response once pass False, so they neither evict the cached berries nor keep their payloads.
 
         Returns:
             Dict: The JSON response from the API.
 
         Raises:
-            PokeAPIException: If there is an error during the request.
+            PokeAPIException: If there is an error during the request and no cached response is available.
         """
+        start = time.perf_counter()
+        status = "error"
+        try:
+            cache = self.cache if use_cache else None
+            cached: Optional[UpstreamResponse] = None
+            if cache is not None:
+                cached = cache.get(endpoint)
+                if cached is not None:
+                    status = "cache_hit"
+                    return cached.data
+                cached = cache.get_stale(endpoint)
+
+            if not self.breaker.allow_request():
+                status = "circuit_open"
+                data = self._stale_or_raise(endpoint, PokeAPIException("PokeAPI is unavailable", 503), cache)
+                status = "stale"
+                return data
+
+            try:
+                response = await asyncio.wait_for(self._get_with_retries(endpoint, cached), self.timeout)
+            except RetriableError as e:
+                self.breaker.record_failure()
+                data = self._stale_or_raise(endpoint, e, cache)
+                status = "stale"
+                return data
+            except asyncio.TimeoutError:
+                self.breaker.record_failure()
+                status = "timeout"
+                data = self._stale_or_raise(
+                    endpoint, PokeAPIException("Error calling PokeAPI: deadline exceeded"), cache
+                )
+                status = "stale"
+                return data
+            except PokeAPIException:
+                self.breaker.record_success()
+                raise
+            except BaseException:
+                self.breaker.release()
+                raise
+
+            self.breaker.record_success()
+            if response is cached:
+                cache.touch(endpoint)
+                status = "revalidated"
+            else:
+                if cache is not None:
+                    cache.set(endpoint, response)
+                status = "ok"
+            return response.data
+        finally:
+            elapsed = time.perf_counter() - start
+            UPSTREAM_REQUEST_SECONDS.labels(endpoint_label(endpoint), status).observe(elapsed)
+            record("pokeapi", elapsed)
+
+    @staticmethod
+    def _stale_or_raise(endpoint: str, error: PokeAPIException, cache: Optional[TTLCache]) -> Dict:
+        """
+        Returns the stale cached response for an endpoint, or raises the given error if there is none.
+
+        Args:
+            endpoint (str): The API endpoint.
+            error (PokeAPIException): The error to raise when nothing is cached.
+            cache (Optional[TTLCache]): The cache to look in, or None if the response is not cached.
+
+        Returns:
+            Dict: The stale cached response.
+
+        Raises:
+            PokeAPIException: If there is no cached response for the endpoint.
+        """
+        stale = cache.get_stale(endpoint) if cache is not None else None
+        if stale is None:
+            raise error
+        return stale.data
+
+    async def _get_with_retries(self, endpoint: str, cached: Optional[UpstreamResponse] = None) -> UpstreamResponse:
+        """
+        Requests an endpoint, retrying transient failures with jittered exponential backoff.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cached (Optional[UpstreamResponse]): An expired cached response to revalidate.
+
+        Returns:
+            UpstreamResponse: The response, or ``cached`` itself if the PokeAPI reported it unchanged.
+
+        Raises:
+            RetriableError: If every attempt failed with a transient error.
+            PokeAPIException: If the PokeAPI answered with a non-retriable error.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                return await self._get_hedged(endpoint, cached)
+            except RetriableError:
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+
+    async def _get_hedged(self, endpoint: str, cached: Optional[UpstreamResponse] = None) -> UpstreamResponse:
+        """
+        Requests an endpoint, sending a duplicate request if the first one is slower than usual.
+
+        When hedging is enabled and enough latencies have been recorded, a second request is started once
+        the first has been running for longer than the hedging threshold. The first successful response
+        wins and the other request is cancelled.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cached (Optional[UpstreamResponse]): An expired cached response to revalidate.
+
+        Returns:
+            UpstreamResponse: The response, or ``cached`` itself if the PokeAPI reported it unchanged.
+
+        Raises:
+            PokeAPIException: If every request failed.
+        """
+        threshold = self.latency.threshold() if self.hedge_enabled else None
+        if threshold is None:
+            return await self._get_once(endpoint, cached)
+
+        pending = {asyncio.ensure_future(self._get_once(endpoint, cached))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=threshold)
+            if not done:
+                pending.add(asyncio.ensure_future(self._get_once(endpoint, cached)))
+
+            error: Optional[BaseException] = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_once(self, endpoint: str, cached: Optional[UpstreamResponse] = None) -> UpstreamResponse:
+        """
+        Makes a single request attempt to an endpoint.
+
+        When an expired cached response is given, its validators are sent as ``If-None-Match`` and
+        ``If-Modified-Since``, and a 304 answer returns the cached response without reading a body.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cached (Optional[UpstreamResponse]): An expired cached response to revalidate.
+
+        Returns:
+            UpstreamResponse: The response, or ``cached`` itself if the PokeAPI reported it unchanged.
+
+        Raises:
+            RetriableError: On network errors, timeouts, 429 and 5xx responses.
+            PokeAPIException: On other error responses or an invalid JSON body.
+        """
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        start = time.perf_counter()
+        UPSTREAM_ATTEMPTS.labels(endpoint_label(endpoint)).inc()
+        try:
+            with UPSTREAM_REQUESTS_IN_FLIGHT.track_inprogress():
+                response = await self._ensure_client().get(f"{self.base_url}/{endpoint}", headers=headers)
+        except httpx.TransportError as e:
+            raise RetriableError(f"Error calling PokeAPI: {str(e)}")
+
+        if response.status_code == 304 and cached is not None:
+            self.latency.record(time.perf_counter() - start)
+            return cached
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetriableError(f"Error calling PokeAPI: {response.status_code} for {endpoint}")
+
         try:
-            response = self.session.get(
-                f"{self.base_url}/{endpoint}",
-                timeout=self.timeout
-            )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise PokeAPIException(f"Error calling PokeAPI: {str(e)}")
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise PokeAPIException(f"Error calling PokeAPI: {str(e)}", 404 if response.status_code == 404 else 500)
+
+        self.latency.record(time.perf_counter() - start)
+        return UpstreamResponse(data, response.headers.get("etag"), response.headers.get("last-modified"))
 
-    def get_all_berries(self) -> List[Dict[str, str]]:
+    async def get_paginated(
+            self,
+            resource: str,
+            page_size: Optional[int] = None,
+            max_count: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Retrieves every entry of a paginated PokeAPI list resource.
+
+        The first page tells how many entries the resource has; the remaining pages are then requested
+        concurrently by offset instead of following the ``next`` links one after another.
+
+        Args:
+            resource (str): The list resource, such as ``berry`` or ``pokemon``.
+            page_size (Optional[int]): The number of entries per page. Defaults to ``POKEAPI_PAGE_SIZE``.
+            max_count (Optional[int]): The largest resource to list. A larger one is rejected after the first
+                page, before the other pages are requested.
+
+        Returns:
+            List[Dict[str, str]]: The entries of the resource, in upstream order.
+
+        Raises:
+            PokeAPIException: If there is an error fetching any page, or with a 413 status code if the
+                resource has more than ``max_count`` entries.
+        """
+        page_size = page_size or self.page_size
+        first_page = await self._make_request(f"{resource}?offset=0&limit={page_size}")
+        results = list(first_page['results'])
+        count = first_page.get('count', len(results))
+        if max_count is not None and count > max_count:
+            raise PokeAPIException(f"Resource {resource} has {count} entries, more than the limit of {max_count}", 413)
+
+        self._ensure_client()
+        semaphore = self._semaphore
+
+        async def fetch_page(offset: int) -> List[Dict[str, str]]:
+            async with semaphore:
+                page = await self._make_request(f"{resource}?offset={offset}&limit={page_size}")
+            return page['results']
+
+        pages = await asyncio.gather(*(
+            fetch_page(offset) for offset in range(len(results), count, page_size)
+        ))
+        for page in pages:
+            results.extend(page)
+        return results
+
+    async def get_all_berries(self) -> List[Dict[str, str]]:
         """
         Retrieves a complete list of berries from the PokeAPI.
 
-        This method handles pagination automatically to gather all berry data.
+        This method fetches all pages of the berry list concurrently.
 
         Returns:
             List[Dict[str, str]]: A list of dictionaries containing berry information.
@@ -70,23 +421,12 @@ class PokeAPIClient:
         Raises:
             PokeAPIException: If there is an error fetching the berries list.
         """
-        berries = []
-        endpoint = "berry"
-
         try:
-            while endpoint:
-                data = self._make_request(endpoint)
-                berries.extend(data['results'])
-                if data.get('next'):
-                    endpoint = data['next'].replace(f"{self.base_url}/", "")
-                else:
-                    endpoint = None
-
-            return berries
+            return await self.get_paginated("berry")
         except Exception as e:
             raise PokeAPIException(f"Error fetching berries list: {str(e)}")
 
-    def get_berry_details(self, berry_name: str) -> Dict[str, Union[str, int, dict]]:
+    async def get_berry_details(self, berry_name: str) -> Dict[str, Union[str, int, dict]]:
         """
         Fetches details for a specific berry.
 
@@ -106,9 +446,200 @@ class PokeAPIClient:
             raise ValueError("Berry name cannot be empty")
 
         try:
-            return self._make_request(f"berry/{berry_name.lower().strip()}")
+            return await self._make_request(f"berry/{normalize_berry_name(berry_name)}")
         except Exception as e:
-            raise PokeAPIException(f"Error fetching berry {berry_name}: {str(e)}")
+            raise PokeAPIException(f"Error fetching berry {berry_name}: {str(e)}", getattr(e, "status_code", 500))
+
+    async def get_berries_details(self, berry_names: List[str]) -> List[Dict[str, Union[str, int, dict]]]:
+        """
+        Fetches details for several berries concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once. The results keep the order of
+        ``berry_names``. If any request fails, the pending ones are cancelled and the error is raised.
+
+        Args:
+            berry_names (List[str]): The names of the berries.
+
+        Returns:
+            List[Dict[str, Union[str, int, dict]]]: The details of each berry, in the given order.
+
+        Raises:
+            PokeAPIException: If there is an error fetching any of the berries.
+        """
+        self._ensure_client()
+        semaphore = self._semaphore
+
+        async def fetch(name: str) -> Dict[str, Union[str, int, dict]]:
+            async with semaphore:
+                return await self.get_berry_details(name)
+
+        tasks = [asyncio.create_task(fetch(name)) for name in berry_names]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def iter_berries_details(
+            self,
+            berry_names: List[str]
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Union[str, int, dict]], PokeAPIException]]]:
+        """
+        Fetches details for several berries concurrently and yields each one as soon as it arrives.
+
+        At most ``max_concurrency`` requests are in flight at once. Results are yielded in completion order,
+        and a failed fetch is yielded as its error instead of ending the iteration. Closing the iterator
+        cancels the pending requests.
+
+        Args:
+            berry_names (List[str]): The names of the berries.
+
+        Yields:
+            Tuple[str, Union[Dict[str, Union[str, int, dict]], PokeAPIException]]: The berry name, and its
+            details or the error raised while fetching them.
+        """
+        async for result in self._iter_concurrently(berry_names, self.get_berry_details):
+            yield result
+
+    async def get_resource_details(self, resource: str, identifier: str, use_cache: bool = True) -> Dict:
+        """
+        Fetches one entry of any PokeAPI resource.
+
+        Args:
+            resource (str): The resource, such as ``pokemon`` or ``item``.
+            identifier (str): The name or id of the entry.
+            use_cache (bool): Whether to read and store the entry in the response cache.
+
+        Returns:
+            Dict: The entry.
+
+        Raises:
+            PokeAPIException: If there is an error during the API request. A missing entry keeps its 404
+                status code.
+        """
+        try:
+            return await self._make_request(f"{resource}/{identifier}", use_cache)
+        except Exception as e:
+            raise PokeAPIException(
+                f"Error fetching {resource} {identifier}: {str(e)}", getattr(e, "status_code", 500)
+            )
+
+    async def iter_resource_details(
+            self,
+            resource: str,
+            identifiers: List[str],
+            use_cache: bool = True
+    ) -> AsyncIterator[Tuple[str, Union[Dict, PokeAPIException]]]:
+        """
+        Fetches several entries of any PokeAPI resource concurrently and yields each one as soon as it arrives.
+
+        At most ``max_concurrency`` requests are in flight at once. Results are yielded in completion order,
+        and a failed fetch is yielded as its error instead of ending the iteration. Closing the iterator
+        cancels the pending requests.
+
+        Args:
+            resource (str): The resource, such as ``pokemon`` or ``item``.
+            identifiers (List[str]): The names or ids of the entries.
+            use_cache (bool): Whether to read and store the entries in the response cache.
+
+        Yields:
+            Tuple[str, Union[Dict, PokeAPIException]]: The identifier, and the entry or the error raised
+            while fetching it.
+        """
+        async def fetch(identifier: str) -> Dict:
+            return await self.get_resource_details(resource, identifier, use_cache)
+
+        async for result in self._iter_concurrently(identifiers, fetch):
+            yield result
+
+    async def iter_endpoints(self, endpoints: List[str]) -> AsyncIterator[Tuple[str, Union[Dict, PokeAPIException]]]:
+        """
+        Fetches several PokeAPI endpoints concurrently and yields each response as soon as it arrives.
+
+        This is used to resolve the resources a payload links to, which may belong to different resources. At
+        most ``max_concurrency`` requests are in flight at once, and a failed fetch is yielded as its error.
+
+        Args:
+            endpoints (List[str]): The endpoints, such as ``berry-flavor/spicy``.
+
+        Yields:
+            Tuple[str, Union[Dict, PokeAPIException]]: The endpoint, and its response or the error raised
+            while fetching it.
+        """
+        async for result in self._iter_concurrently(endpoints, self._make_request):
+            yield result
+
+    async def _iter_concurrently(
+            self,
+            keys: List[str],
+            fetch: Callable[[str], Awaitable[Dict]]
+    ) -> AsyncIterator[Tuple[str, Union[Dict, PokeAPIException]]]:
+        """
+        Runs ``fetch`` for every key with at most ``max_concurrency`` calls at once, in completion order.
+
+        Args:
+            keys (List[str]): The keys to fetch.
+            fetch (Callable[[str], Awaitable[Dict]]): Fetches the value of a key.
+
+        Yields:
+            Tuple[str, Union[Dict, PokeAPIException]]: The key, and its value or the error raised by ``fetch``.
+        """
+        self._ensure_client()
+        semaphore = self._semaphore
+
+        async def run(key: str) -> Tuple[str, Union[Dict, PokeAPIException]]:
+            async with semaphore:
+                try:
+                    return key, await fetch(key)
+                except PokeAPIException as e:
+                    return key, e
+
+        tasks = [asyncio.create_task(run(key)) for key in keys]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_berries_details_batch(
+            self,
+            berry_names: List[str]
+    ) -> Dict[str, Union[Dict[str, Union[str, int, dict]], Exception]]:
+        """
+        Fetches details for a batch of berries, reporting failures per berry.
+
+        The names are normalized and deduplicated. A name that is not a PokeAPI slug, made of lowercase
+        letters, digits and dashes, is reported as a ValueError without calling the PokeAPI, so user input
+        cannot reach other upstream paths or add query strings. Berries with a fresh cache entry are
+        answered from the cache right away, and only the others are fetched, concurrently.
+
+        Args:
+            berry_names (List[str]): The names of the berries, possibly repeated or not normalized.
+
+        Returns:
+            Dict[str, Union[Dict[str, Union[str, int, dict]], Exception]]: The details of each distinct
+            normalized name, or the error raised while fetching them, in the order the names were given.
+        """
+        results: Dict[str, Union[Dict[str, Union[str, int, dict]], Exception]] = {}
+        misses = []
+        for name in dict.fromkeys(normalize_berry_name(berry_name) for berry_name in berry_names):
+            endpoint = f"berry/{name}"
+            if not name:
+                results[name] = ValueError("Berry name cannot be empty")
+            elif not BERRY_NAME.match(name):
+                results[name] = ValueError(f"Invalid berry name: {name}")
+            elif self.cache is not None and endpoint in self.cache:
+                results[name] = self.cache.get(endpoint).data
+            else:
+                results[name] = None
+                misses.append(name)
+
+        async for name, result in self.iter_berries_details(misses):
+            results[name] = result
+        return results
 
 
 poke_api_client = PokeAPIClient()
+register_cache("pokeapi", lambda: poke_api_client.cache.stats() if poke_api_client.cache is not None else None)
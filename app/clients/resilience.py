@@ -0,0 +1,153 @@
+import math
+import random
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """
+    Computes a jittered exponential backoff delay.
+
+    Uses "full jitter": the delay is drawn uniformly between zero and ``base * 2 ** attempt``, capped at
+    ``maximum``, so that clients retrying at the same time spread out.
+
+    Args:
+        attempt (int): The number of the retry, starting at 0.
+        base (float): The delay ceiling of the first retry in seconds.
+        maximum (float): The largest delay ceiling in seconds.
+
+    Returns:
+        float: The delay before the retry in seconds.
+    """
+    return random.uniform(0, min(maximum, base * 2 ** attempt))  # nosec B311
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that stops calling an upstream service after repeated failures.
+
+    The breaker starts closed. After ``failure_threshold`` consecutive failures it opens and rejects calls
+    for ``reset_timeout`` seconds. It then lets a single trial call through (half-open): a success closes
+    it again and a failure opens it for another ``reset_timeout``. A trial call that ends without an
+    outcome, for example because it was cancelled, is released so that the next call becomes the trial.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the breaker.
+        reset_timeout (float): Seconds the breaker stays open before a trial call.
+        failures (int): The current number of consecutive failures.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+            self,
+            failure_threshold: int,
+            reset_timeout: float,
+            timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initializes a closed circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a trial call.
+            timer (Callable[[], float]): Clock used to time the open state.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._timer = timer
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Returns the state of the breaker: closed, open or half_open."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Checks whether a call may go through, moving an expired open breaker to half-open.
+
+        Returns:
+            bool: True if the call may be made.
+        """
+        if self._state == self.CLOSED:
+            return True
+        if self._state == self.OPEN and self._timer() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """
+        Records a successful call and closes the breaker.
+        """
+        self.failures = 0
+        self._state = self.CLOSED
+
+    def release(self) -> None:
+        """
+        Gives up the trial call of a half-open breaker without recording an outcome.
+
+        The breaker goes back to open with its reset timeout already elapsed, so the next call is let through
+        as a new trial.
+        """
+        if self._state == self.HALF_OPEN:
+            self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        """
+        Records a failed call, opening the breaker if the threshold is reached or the trial call failed.
+        """
+        self.failures += 1
+        if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._timer()
+
+
+class LatencyTracker:
+    """
+    Tracks recent call latencies to derive a hedging threshold.
+
+    Attributes:
+        quantile (float): The latency quantile used as the hedging threshold, such as 0.95.
+        min_samples (int): The number of samples needed before a threshold is reported.
+    """
+
+    def __init__(self, quantile: float, min_samples: int, window: int = 256) -> None:
+        """
+        Initializes an empty tracker.
+
+        Args:
+            quantile (float): The latency quantile used as the hedging threshold.
+            min_samples (int): The number of samples needed before a threshold is reported.
+            window (int): The number of most recent samples kept.
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        """
+        Records the latency of a successful call.
+
+        Args:
+            latency (float): The latency in seconds.
+        """
+        self._samples.append(latency)
+
+    def threshold(self) -> Optional[float]:
+        """
+        Returns the configured latency quantile of the recent samples.
+
+        Returns:
+            Optional[float]: The threshold in seconds, or None if there are not enough samples yet.
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)]
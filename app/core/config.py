@@ -6,6 +6,17 @@ from pydantic_settings import BaseSettings
 
 load_dotenv()
 
+POKEAPI_RESOURCES = frozenset({
+    "ability", "berry", "berry-firmness", "berry-flavor", "characteristic", "contest-effect", "contest-type",
+    "egg-group", "encounter-condition", "encounter-condition-value", "encounter-method", "evolution-chain",
+    "evolution-trigger", "gender", "generation", "growth-rate", "item", "item-attribute", "item-category",
+    "item-fling-effect", "item-pocket", "language", "location", "location-area", "machine", "move",
+    "move-ailment", "move-battle-style", "move-category", "move-damage-class", "move-learn-method",
+    "move-target", "nature", "pal-park-area", "pokeathlon-stat", "pokedex", "pokemon", "pokemon-color",
+    "pokemon-form", "pokemon-habitat", "pokemon-shape", "pokemon-species", "region", "stat",
+    "super-contest-effect", "type", "version", "version-group"
+})
+
 
 class Settings(BaseSettings):
     """Configuration settings for the application.
@@ -19,9 +30,35 @@ class Settings(BaseSettings):
         API_VERSION (str): The version of the API.
         DEBUG (bool): Flag to enable or disable debug mode.
         POKEAPI_BASE_URL (str): The base URL for the PokeAPI.
-        POKEAPI_TIMEOUT (int): The timeout duration for PokeAPI requests.
+        POKEAPI_TIMEOUT (int): The overall deadline of a PokeAPI request, including retries, in seconds.
+        POKEAPI_REQUEST_TIMEOUT (float): The deadline of a single PokeAPI request attempt in seconds.
+        POKEAPI_RETRIES (int): The number of retries after a transient PokeAPI failure.
+        POKEAPI_BACKOFF_BASE (float): The backoff ceiling of the first retry in seconds.
+        POKEAPI_BACKOFF_MAX (float): The largest backoff ceiling in seconds.
+        POKEAPI_CIRCUIT_FAILURE_THRESHOLD (int): Consecutive PokeAPI failures that open the circuit breaker.
+        POKEAPI_CIRCUIT_RESET_TIMEOUT (float): Seconds the circuit breaker stays open before a trial request.
+        POKEAPI_HEDGE_ENABLED (bool): Flag to enable or disable hedged PokeAPI requests.
+        POKEAPI_HEDGE_QUANTILE (float): The latency quantile after which a request is hedged.
+        POKEAPI_HEDGE_MIN_SAMPLES (int): The number of latency samples needed before hedging.
+        POKEAPI_MAX_CONCURRENCY (int): The maximum number of concurrent PokeAPI detail requests.
+        POKEAPI_PAGE_SIZE (int): The number of entries requested per page of a PokeAPI list resource.
         CACHE_ENABLED (bool): Flag to enable or disable caching.
         CACHE_TTL (int): Time-to-live for cached items in seconds.
+        CACHE_MAX_SIZE (int): The maximum number of cached upstream responses.
+        BATCH_MAX_SIZE (int): The maximum number of berry names in a batch lookup.
+        RESOURCE_STATS_MAX_ENTRIES (int): The largest PokeAPI list resource the generic statistics endpoint
+            crawls.
+        RESOURCE_STATS_CRAWL_CACHE_SIZE (int): The number of crawled resources whose numeric values are kept
+            for the generic statistics endpoint.
+        SNAPSHOT_REFRESH_INTERVAL (int): Seconds between background refreshes of the stats snapshot.
+        SNAPSHOT_PATH (str): File where the stats snapshot is persisted and shared between workers. Empty to
+            disable persistence.
+        SNAPSHOT_POLL_INTERVAL (float): Seconds between checks for a new snapshot by non-publishing workers.
+        SNAPSHOT_WAIT_TIMEOUT (float): Seconds a non-publishing worker waits for the first snapshot.
+        SERVER_TIMING_ENABLED (bool): Flag to report request phase timings in a Server-Timing header.
+        PROFILING_ENABLED (bool): Flag to allow profiling requests sent with an ``X-Profile: 1`` header.
+        PROFILING_DIR (str): Directory where request profiles are written.
+        PROFILING_INTERVAL (float): Seconds between profiler samples.
         GRAPH_DPI (int): The DPI setting for generated graphs.
         GRAPH_FORMAT (str): The format for generated graphs.
 
@@ -33,9 +70,32 @@ class Settings(BaseSettings):
     ENV: str = os.getenv("ENV", "development")
 
     POKEAPI_BASE_URL: str = os.getenv("POKEAPI_BASE_URL", "https://pokeapi.co/api/v2")
-    POKEAPI_TIMEOUT: int = int(os.getenv("POKEAPI_TIMEOUT", "30"))
-    CACHE_ENABLED: bool = bool(os.getenv("CACHE_ENABLED", "False"))
+    POKEAPI_TIMEOUT: int = int(os.getenv("POKEAPI_TIMEOUT", "10"))
+    POKEAPI_REQUEST_TIMEOUT: float = float(os.getenv("POKEAPI_REQUEST_TIMEOUT", "3"))
+    POKEAPI_RETRIES: int = int(os.getenv("POKEAPI_RETRIES", "2"))
+    POKEAPI_BACKOFF_BASE: float = float(os.getenv("POKEAPI_BACKOFF_BASE", "0.2"))
+    POKEAPI_BACKOFF_MAX: float = float(os.getenv("POKEAPI_BACKOFF_MAX", "2"))
+    POKEAPI_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("POKEAPI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    POKEAPI_CIRCUIT_RESET_TIMEOUT: float = float(os.getenv("POKEAPI_CIRCUIT_RESET_TIMEOUT", "30"))
+    POKEAPI_HEDGE_ENABLED: bool = os.getenv("POKEAPI_HEDGE_ENABLED", "True").lower() in ("1", "true", "yes")
+    POKEAPI_HEDGE_QUANTILE: float = float(os.getenv("POKEAPI_HEDGE_QUANTILE", "0.95"))
+    POKEAPI_HEDGE_MIN_SAMPLES: int = int(os.getenv("POKEAPI_HEDGE_MIN_SAMPLES", "20"))
+    POKEAPI_MAX_CONCURRENCY: int = int(os.getenv("POKEAPI_MAX_CONCURRENCY", "16"))
+    POKEAPI_PAGE_SIZE: int = int(os.getenv("POKEAPI_PAGE_SIZE", "100"))
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "True").lower() in ("1", "true", "yes")
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "3600"))
+    CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+    BATCH_MAX_SIZE: int = int(os.getenv("BATCH_MAX_SIZE", "100"))
+    RESOURCE_STATS_MAX_ENTRIES: int = int(os.getenv("RESOURCE_STATS_MAX_ENTRIES", "5000"))
+    RESOURCE_STATS_CRAWL_CACHE_SIZE: int = int(os.getenv("RESOURCE_STATS_CRAWL_CACHE_SIZE", "4"))
+    SNAPSHOT_REFRESH_INTERVAL: int = int(os.getenv("SNAPSHOT_REFRESH_INTERVAL", "3600"))
+    SNAPSHOT_PATH: str = os.getenv("SNAPSHOT_PATH", "")
+    SNAPSHOT_POLL_INTERVAL: float = float(os.getenv("SNAPSHOT_POLL_INTERVAL", "1"))
+    SNAPSHOT_WAIT_TIMEOUT: float = float(os.getenv("SNAPSHOT_WAIT_TIMEOUT", "30"))
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "True").lower() in ("1", "true", "yes")
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "False").lower() in ("1", "true", "yes")
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "profiles")
+    PROFILING_INTERVAL: float = float(os.getenv("PROFILING_INTERVAL", "0.001"))
     GRAPH_DPI: int = int(os.getenv("GRAPH_DPI", "300"))
     GRAPH_FORMAT: str = os.getenv("GRAPH_FORMAT", "png")
 
@@ -0,0 +1,149 @@
+import time
+from typing import Callable, Dict, Iterator, Optional
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from app.core.config import POKEAPI_RESOURCES
+
+registry = CollectorRegistry()
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Latency of API requests.",
+    ["method", "route", "status"],
+    registry=registry
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "API requests currently being served.",
+    registry=registry
+)
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "pokeapi_request_duration_seconds",
+    "Latency of PokeAPI calls, including cache lookups, retries and stale fallbacks.",
+    ["endpoint", "status"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    registry=registry
+)
+UPSTREAM_REQUESTS_IN_FLIGHT = Gauge(
+    "pokeapi_requests_in_flight",
+    "HTTP requests to the PokeAPI currently in flight.",
+    registry=registry
+)
+UPSTREAM_ATTEMPTS = Counter(
+    "pokeapi_attempts",
+    "HTTP requests sent to the PokeAPI, including retries and hedged duplicates.",
+    ["endpoint"],
+    registry=registry
+)
+STATS_COMPUTE_SECONDS = Histogram(
+    "stats_compute_duration_seconds",
+    "Time spent computing statistics.",
+    ["operation"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=registry
+)
+
+def endpoint_label(endpoint: str) -> str:
+    """
+    Turns a PokeAPI endpoint into a low-cardinality label, such as ``berry/{name}`` for ``berry/cheri``.
+
+    Endpoints of resources the PokeAPI does not list are labelled ``other``, so names sent by clients
+    cannot create new series.
+
+    Args:
+        endpoint (str): The API endpoint, possibly with a query string.
+
+    Returns:
+        str: The endpoint template, or ``other``.
+    """
+    resource, _, name = endpoint.split("?", 1)[0].strip("/").partition("/")
+    if resource not in POKEAPI_RESOURCES:
+        return "other"
+    return f"{resource}/{{name}}" if name else resource
+
+
+class CacheCollector(Collector):
+    """
+    Exposes the counters of a TTL cache, read from ``TTLCache.stats`` at scrape time.
+
+    Attributes:
+        name (str): The value of the ``cache`` label.
+    """
+
+    def __init__(self, name: str, stats: Callable[[], Optional[Dict[str, int]]]) -> None:
+        """
+        Initializes the collector.
+
+        Args:
+            name (str): The value of the ``cache`` label.
+            stats (Callable[[], Optional[Dict[str, int]]]): Returns the cache counters, or None when the
+                cache is disabled.
+        """
+        self.name = name
+        self._stats = stats
+
+    def collect(self) -> Iterator[Metric]:
+        stats = self._stats()
+        if stats is None:
+            return
+
+        for counter in ("hits", "misses", "evictions"):
+            family = CounterMetricFamily(f"cache_{counter}", f"Cache {counter}.", labels=["cache"])
+            family.add_metric([self.name], stats[counter])
+            yield family
+        size = GaugeMetricFamily("cache_size", "Entries currently cached.", labels=["cache"])
+        size.add_metric([self.name], stats["size"])
+        yield size
+
+
+def register_cache(name: str, stats: Callable[[], Optional[Dict[str, int]]]) -> None:
+    """
+    Registers a cache so its counters are exposed on ``/metrics``.
+
+    Args:
+        name (str): The value of the ``cache`` label.
+        stats (Callable[[], Optional[Dict[str, int]]]): Returns the cache counters, or None when the
+            cache is disabled.
+    """
+    registry.register(CacheCollector(name, stats))
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records the latency of every HTTP request.
+
+    Requests are labelled with their route template, such as ``/v1/berryStats/groupBy/{dimension}``,
+    so path parameters do not create new series. Requests that match no route are labelled ``unmatched``.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status)
+            ).observe(time.perf_counter() - start)
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+
+def collapse_stack(frame: Optional[FrameType]) -> str:
+    """
+    Collapses a call stack into a single ``root;...;leaf`` line, as used by flame graph tools.
+
+    Args:
+        frame (Optional[FrameType]): The innermost frame of the stack.
+
+    Returns:
+        str: The frames from the outermost to the innermost, as ``module:function`` separated by ``;``.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.splitext(os.path.basename(code.co_filename))[0]}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that samples the call stack of one thread at a fixed interval.
+
+    A background thread reads the stack of the profiled thread every ``interval`` seconds, so the overhead
+    does not depend on how many functions are called. For an asyncio server the profiled thread is the event
+    loop thread, so samples taken while the request awaits I/O show whatever else the loop was running.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        samples (Counter): The number of samples of each collapsed stack.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None) -> None:
+        """
+        Initializes the profiler.
+
+        Args:
+            interval (float): Seconds between samples.
+            thread_id (Optional[int]): The thread to profile. Defaults to the calling thread.
+        """
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        """
+        Starts sampling in a background thread.
+
+        Returns:
+            SamplingProfiler: The profiler itself.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops sampling and waits for the background thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.samples[collapse_stack(frame)] += 1
+
+    def collapsed(self) -> str:
+        """
+        Returns the samples in collapsed stack format, one ``stack count`` line per distinct stack.
+
+        The output can be rendered with flamegraph.pl or loaded into speedscope.
+
+        Returns:
+            str: The collapsed stacks, most sampled first.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles requests sent with an ``X-Profile`` header.
+
+    Profiling is only available when enabled with a setting, because sampling adds overhead and the profiles
+    are written to disk. Each profile is saved in collapsed stack format in ``directory`` and its file name is
+    returned in the ``X-Profile-File`` response header.
+
+    Attributes:
+        directory (str): The directory profiles are written to.
+        interval (float): Seconds between samples.
+    """
+
+    HEADER = b"x-profile"
+
+    def __init__(self, app, directory: str, interval: float = 0.001) -> None:
+        self.app = app
+        self.directory = directory
+        self.interval = interval
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{time.perf_counter_ns()}-{_slug(scope['path'])}.folded"
+        profiler = SamplingProfiler(self.interval)
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-file", name.encode())]
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            await asyncio.to_thread(self._save, name, profiler.collapsed())
+
+    def _save(self, name: str, content: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, name), "w") as profile:
+            profile.write(content)
+
+    def _requested(self, scope) -> bool:
+        return any(
+            key == self.HEADER and value.lower() in (b"1", b"true", b"yes")
+            for key, value in scope.get("headers", [])
+        )
+
+
+def _slug(path: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_") or "root"
@@ -0,0 +1,102 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+_spans: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("server_timing_spans", default=None)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Times a phase of the current request for the ``Server-Timing`` header.
+
+    Durations of spans with the same name are added up, so a phase made of many concurrent calls, such as
+    the PokeAPI detail fetches, reports its cumulative time and its number of calls. Outside of a timed
+    request, the span does nothing. It can also be used as a decorator of synchronous functions.
+
+    Args:
+        name (str): The name of the phase. It must be a valid HTTP token, such as ``list`` or ``stats``.
+    """
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _add(spans, name, time.perf_counter() - start)
+
+
+def record(name: str, duration: float) -> None:
+    """
+    Adds an already measured duration to a span of the current request.
+
+    Args:
+        name (str): The name of the phase.
+        duration (float): The duration in seconds.
+    """
+    spans = _spans.get()
+    if spans is not None:
+        _add(spans, name, duration)
+
+
+def _add(spans: Dict[str, List[float]], name: str, duration: float) -> None:
+    entry = spans.setdefault(name, [0.0, 0])
+    entry[0] += duration
+    entry[1] += 1
+
+
+def format_server_timing(spans: Dict[str, List[float]], total: float) -> str:
+    """
+    Formats request spans as a ``Server-Timing`` header value.
+
+    Args:
+        spans (Dict[str, List[float]]): The cumulative duration in seconds and the call count of each span.
+        total (float): The time from the start of the request to its response headers, in seconds.
+
+    Returns:
+        str: The header value, with durations in milliseconds.
+    """
+    metrics = []
+    for name, (duration, calls) in spans.items():
+        metric = f"{name};dur={duration * 1000:.2f}"
+        if calls > 1:
+            metric += f';desc="{int(calls)} calls"'
+        metrics.append(metric)
+    metrics.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that collects the spans of each request and reports them in a ``Server-Timing`` header.
+
+    Browsers show the header in their developer tools, so a slow request can be broken down into listing,
+    detail fetches, statistics computation and serialization without server access.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans: Dict[str, List[float]] = {}
+        start = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                value = format_server_timing(spans, time.perf_counter() - start)
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", value.encode())]
+            await send(message)
+
+        token = _spans.set(spans)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _spans.reset(token)
@@ -1,19 +1,46 @@
-from typing import Dict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api.v1 import router as v1_router
+from app.clients.poke_api import poke_api_client
 from app.core.config import settings
 from app.core.exceptions import BaseAPIException
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.profiling import ProfilingMiddleware
+from app.core.timing import ServerTimingMiddleware
+from app.services.snapshot_service import snapshot_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manages the application lifespan.
+
+    On startup, starts the background task that builds and refreshes the berry stats snapshot, without
+    waiting for the first build, so the server accepts connections as soon as it is up. ``/ready`` reports
+    when the snapshot is available. On shutdown, stops the refresh task and closes the PokeAPI client.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    await snapshot_service.start(wait=False)
+    yield
+    await snapshot_service.stop()
+    await poke_api_client.aclose()
+
 
 app = FastAPI(
     title="Poke Berry Stats API",
     description="API for getting statistics on Pokémon berries",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -23,6 +50,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, directory=settings.PROFILING_DIR, interval=settings.PROFILING_INTERVAL)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(v1_router)
 
@@ -114,6 +146,32 @@ async def health_check() -> Dict[str, str]:
     }
 
 
+@app.get("/ready", tags=["health"])
+async def readiness_check() -> JSONResponse:
+    """
+    Endpoint for readiness check, ready once the berry stats snapshot is available
+    """
+    snapshot = snapshot_service.current
+    if snapshot is None:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "warming", "error": snapshot_service.last_error}
+        )
+    return JSONResponse(content={
+        "status": "ready",
+        "generation": snapshot_service.generation,
+        "snapshot_age": round(snapshot.age, 3)
+    })
+
+
+@app.get("/metrics", tags=["health"])
+async def metrics() -> Response:
+    """
+    Endpoint for Prometheus metrics
+    """
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,4 +1,5 @@
 from .berry_service import berry_service
+from .snapshot_service import snapshot_service
 from .stats_service import StatsService
 
-__all__ = ['berry_service', 'StatsService']
+__all__ = ['berry_service', 'snapshot_service', 'StatsService']
@@ -1,8 +1,129 @@
-from typing import Dict
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 
 from app.clients.poke_api import poke_api_client
-from app.core.exceptions import ServiceError
-from app.services.stats_service import StatsService
+from app.core.exceptions import NotFoundError, ServiceError, ValidationException
+from app.core.timing import span
+from app.services.berry_store import CATEGORICAL_FIELDS, NUMERIC_FIELDS, BerryFilter, BerryStore
+from app.services.stats_service import StatsService, StreamingStats
+from app.utils.singleflight import SingleFlight
+
+
+def project_berry(berry_detail: Dict) -> Dict[str, Union[str, int, None, Dict[str, int]]]:
+    """
+    Projects a PokeAPI berry detail payload onto the fields this API uses.
+
+    Args:
+        berry_detail (Dict): The berry detail payload returned by the PokeAPI.
+
+    Returns:
+        Dict[str, Union[str, int, None, Dict[str, int]]]: The berry name, its numeric fields, the names of
+        its firmness, natural gift type and item, and the potency of each of its flavors.
+    """
+    record = {"name": berry_detail['name']}
+    for field in NUMERIC_FIELDS:
+        record[field] = berry_detail.get(field)
+    for field in ("firmness", "natural_gift_type", "item"):
+        record[field] = (berry_detail.get(field) or {}).get('name')
+    record["flavors"] = {
+        flavor['flavor']['name']: flavor['potency']
+        for flavor in berry_detail.get('flavors', [])
+    }
+    return record
+
+
+def validate_numeric_fields(fields: Sequence[str]) -> None:
+    """
+    Checks that every field is one of the numeric berry fields.
+
+    Args:
+        fields (Sequence[str]): The field names to check.
+
+    Raises:
+        ValidationException: If no field is given or a field is not a numeric berry field.
+    """
+    unknown = [field for field in fields if field not in NUMERIC_FIELDS]
+    if unknown or not fields:
+        raise ValidationException(
+            f"Invalid fields: {', '.join(unknown) or 'none given'}. "
+            f"Valid fields are: {', '.join(NUMERIC_FIELDS)}"
+        )
+
+
+def validate_dimension(dimension: str) -> None:
+    """
+    Checks that a dimension is one of the categorical berry fields.
+
+    Args:
+        dimension (str): The field name to check.
+
+    Raises:
+        ValidationException: If the dimension is not a categorical berry field.
+    """
+    if dimension not in CATEGORICAL_FIELDS:
+        raise ValidationException(
+            f"Invalid dimension: {dimension}. Valid dimensions are: {', '.join(CATEGORICAL_FIELDS)}"
+        )
+
+
+def parse_quantiles(expression: str) -> Tuple[Dict[str, float], bool]:
+    """
+    Parses a comma-separated list of quantiles, such as ``p10,p90,iqr`` or ``0.25,0.75``.
+
+    Percentiles are written ``p`` followed by a number between 0 and 100, and quantiles as a number between
+    0 and 1. ``iqr`` requests the interquartile range, the difference between the 75th and 25th percentiles.
+
+    Args:
+        expression (str): The quantile list.
+
+    Returns:
+        Tuple[Dict[str, float], bool]: Each requested quantile, between 0 and 1, by its percentile label such
+        as ``p10``, and whether the interquartile range was requested.
+
+    Raises:
+        ValidationException: If an item is not a valid percentile, quantile or ``iqr``.
+    """
+    quantiles: Dict[str, float] = {}
+    iqr = False
+    for item in (item.strip().lower() for item in expression.split(",")):
+        if not item:
+            continue
+        if item == "iqr":
+            iqr = True
+            continue
+        try:
+            quantile = float(item[1:]) / 100 if item.startswith("p") else float(item)
+        except ValueError:
+            quantile = -1.0
+        if not 0 <= quantile <= 1:
+            raise ValidationException(
+                f"Invalid quantile: {item}. Use a percentile such as p90, a quantile such as 0.9, or iqr"
+            )
+        quantiles[f"p{quantile * 100:g}"] = quantile
+    return quantiles, iqr
+
+
+def batch_item(name: str, result: Union[Dict, Exception]) -> Dict:
+    """
+    Builds the batch lookup result of one berry.
+
+    Args:
+        name (str): The normalized berry name.
+        result (Union[Dict, Exception]): The berry details, or the error raised while fetching them.
+
+    Returns:
+        Dict: The ``name``, the projected ``berry`` record or None, and the ``error`` and ``status`` or None.
+    """
+    if isinstance(result, ValueError):
+        return {"name": name, "berry": None, "error": str(result), "status": 400}
+    if isinstance(result, Exception):
+        if getattr(result, "status_code", None) == 404:
+            return {"name": name, "berry": None, "error": f"Berry {name} not found", "status": 404}
+        return {"name": name, "berry": None, "error": f"Error fetching berry {name}", "status": 502}
+
+    try:
+        return {"name": name, "berry": project_berry(result), "error": None, "status": None}
+    except (KeyError, TypeError, AttributeError):
+        return {"name": name, "berry": None, "error": f"Unexpected PokeAPI payload for berry {name}", "status": 502}
 
 
 class BerryService:
@@ -11,22 +132,57 @@ class BerryService:
 
     This class interacts with the PokeAPI to fetch details about berries and their growth times. 
     It utilizes the StatsService to compute statistical metrics based on the growth times of the berries.
+    Concurrent requests for the statistics share a single in-flight computation, and the projected berry
+    records of the last computation are kept in ``berries``.
 
     Methods:
         get_all_berry_stats() -> Dict:
             Asynchronously retrieves all berry statistics, including names and growth time metrics.
+
+        list_berry_names() -> List[str]:
+            Asynchronously retrieves the names of all berries.
+
+        get_berries(berry_names: List[str]) -> List[Dict]:
+            Asynchronously retrieves a batch of berries, reporting failures per berry.
+
+        stream_berries(berry_names: List[str]) -> AsyncIterator[Dict]:
+            Asynchronously yields each berry record as soon as it is fetched, followed by the growth time statistics.
+
+        calculate_field_statistics(store: BerryStore, fields: Sequence[str], filters: Sequence[BerryFilter]) -> Dict:
+            Calculates statistics for several numeric berry fields at once, over the berries matching the filters.
+
+        calculate_group_statistics(store: BerryStore, dimension: str) -> Dict:
+            Calculates growth time statistics for each value of a categorical berry field.
     """
 
     def __init__(self):
         """Initializes the BerryService and its dependency on StatsService."""
         self.stats_service = StatsService()
+        self.berries: Optional[List[Dict]] = None
+        self._single_flight = SingleFlight()
 
     async def get_all_berry_stats(self) -> Dict:
         """
         Retrieves statistics for all berries.
 
-        This method fetches all berries from the PokeAPI, collects their growth times, and calculates 
-        statistical metrics such as minimum, median, maximum, variance, and mean growth times. 
+        Callers that arrive while a computation is already running await that computation instead of
+        starting a new crawl, and all of them receive the same result or the same error.
+
+        Returns:
+            Dict: A dictionary containing berry names and their corresponding growth time statistics.
+
+        Raises:
+            ServiceError: If an error occurs while retrieving berry stats or calculating statistics.
+        """
+        return await self._single_flight.do("all_berry_stats", self._compute_all_berry_stats)
+
+    async def _compute_all_berry_stats(self) -> Dict:
+        """
+        Computes statistics for all berries.
+
+        This method fetches all berries from the PokeAPI, fetches their details concurrently, collects their
+        growth times, and calculates statistical metrics such as minimum, median, maximum, variance, and
+        mean growth times.
         It raises a ServiceError if an error occurs during the data retrieval or calculation process.
 
         Returns:
@@ -36,15 +192,18 @@ class BerryService:
             ServiceError: If an error occurs while retrieving berry stats or calculating statistics.
         """
         try:
-            berries = poke_api_client.get_all_berries()
+            with span("list"):
+                berries = await poke_api_client.get_all_berries()
+            with span("details"):
+                berry_details = await poke_api_client.get_berries_details(
+                    [berry['name'] for berry in berries]
+                )
 
-            growth_times = []
-            berries_names = []
+            with span("project"):
+                self.berries = [project_berry(berry_detail) for berry_detail in berry_details]
 
-            for berry in berries:
-                berry_detail = poke_api_client.get_berry_details(berry['name'])
-                growth_times.append(berry_detail['growth_time'])
-                berries_names.append(berry_detail['name'])
+            growth_times = [berry['growth_time'] for berry in self.berries]
+            berries_names = [berry['name'] for berry in self.berries]
 
             stats = self.stats_service.calculate_statistics(growth_times)
 
@@ -61,5 +220,194 @@ class BerryService:
         except Exception as e:
             raise ServiceError(f"Error getting berry stats: {str(e)}") from e
 
+    async def list_berry_names(self) -> List[str]:
+        """
+        Retrieves the names of all berries.
+
+        Returns:
+            List[str]: The berry names, in upstream order.
+
+        Raises:
+            ServiceError: If the berry list could not be retrieved.
+        """
+        try:
+            return [berry['name'] for berry in await poke_api_client.get_all_berries()]
+        except Exception as e:
+            raise ServiceError(f"Error getting berry list: {str(e)}") from e
+
+    async def get_berries(self, berry_names: List[str]) -> List[Dict]:
+        """
+        Retrieves a batch of berries by name.
+
+        Names are normalized and deduplicated, cached berries are served from the cache and the others are
+        fetched concurrently. A berry that cannot be retrieved is reported with its error and status instead
+        of failing the whole batch: 400 for an invalid name, 404 for an unknown berry and 502 for a PokeAPI
+        failure or an unexpected payload.
+
+        Args:
+            berry_names (List[str]): The names of the berries.
+
+        Returns:
+            List[Dict]: One item per distinct normalized name, in request order, with the ``name``, the
+            projected ``berry`` record or None, and the ``error`` and ``status`` or None.
+        """
+        results = await poke_api_client.get_berries_details_batch(berry_names)
+        return [batch_item(name, result) for name, result in results.items()]
+
+    async def stream_berries(self, berry_names: List[str]) -> AsyncIterator[Dict]:
+        """
+        Fetches berries concurrently and yields each projected record as soon as its details arrive.
+
+        Growth time statistics are accumulated incrementally while the records are yielded, so the records
+        are never held in memory together. A berry whose details could not be fetched, or whose payload could
+        not be projected, is reported in an error item and left out of the statistics.
+
+        Args:
+            berry_names (List[str]): The names of the berries to fetch.
+
+        Yields:
+            Dict: A ``berry`` item per fetched berry with its projected record, an ``error`` item per failed
+            berry, and a final ``stats`` item with the number of berries and errors and the growth time
+            statistics.
+        """
+        stats = StreamingStats()
+        errors = 0
+        async for name, result in poke_api_client.iter_berries_details(berry_names):
+            if isinstance(result, Exception):
+                errors += 1
+                yield {"type": "error", "name": name, "error": result.message}
+                continue
+
+            item = batch_item(name, result)
+            if item['berry'] is None:
+                errors += 1
+                yield {"type": "error", "name": name, "error": item['error']}
+                continue
+
+            record = item['berry']
+            if record['growth_time'] is not None:
+                stats.add(record['growth_time'])
+            yield {"type": "berry", **record}
+
+        summary = {"type": "stats", "count": stats.count, "errors": errors}
+        if stats.count:
+            growth_time = stats.to_dict()
+            summary.update({
+                "min_growth_time": growth_time['min'],
+                "median_growth_time": growth_time['median'],
+                "max_growth_time": growth_time['max'],
+                "variance_growth_time": growth_time['variance'],
+                "mean_growth_time": growth_time['mean'],
+                "frequency_growth_time": growth_time['frequency']
+            })
+        yield summary
+
+    def calculate_field_statistics(
+            self,
+            store: BerryStore,
+            fields: Sequence[str],
+            filters: Sequence[BerryFilter] = (),
+            quantiles: Optional[Dict[str, float]] = None,
+            iqr: bool = False,
+            bins: Optional[int] = None
+    ) -> Dict:
+        """
+        Calculates statistics for several numeric berry fields at once.
+
+        The berries matching every filter are selected with a boolean mask over the store's columns. Their
+        requested fields are arranged as the columns of a 2-D matrix, and the statistics of all columns
+        are computed in one vectorized pass. Quantiles and histogram bins are calculated per field from a
+        cumulative histogram of its values.
+
+        Args:
+            store (BerryStore): The columnar berry store.
+            fields (Sequence[str]): The numeric fields to calculate statistics for.
+            filters (Sequence[BerryFilter]): The filters the berries must satisfy.
+            quantiles (Optional[Dict[str, float]]): Quantiles to calculate, by label, as returned by
+                parse_quantiles.
+            iqr (bool): Whether to calculate the interquartile range.
+            bins (Optional[int]): The number of histogram bins, or None for no histogram.
+
+        Returns:
+            Dict: The number of matching berries and the statistics of each requested field.
+
+        Raises:
+            ValidationException: If a field is not one of the numeric berry fields.
+            NotFoundError: If no berry matches the filters.
+            ServiceError: If an error occurs while calculating the statistics.
+        """
+        validate_numeric_fields(fields)
+
+        mask = store.mask(filters)
+        count = int(mask.sum())
+        if count == 0:
+            raise NotFoundError("No berries match the given filters")
+
+        matrix = store.matrix(fields, mask)
+        try:
+            stats = self.stats_service.calculate_matrix_statistics(matrix)
+            requested = {**({"p25": 0.25, "p75": 0.75} if iqr else {}), **(quantiles or {})}
+            for column, field_stats in enumerate(stats):
+                if requested:
+                    values = self.stats_service.calculate_quantiles(matrix[:, column], list(requested.values()))
+                    by_label = dict(zip(requested, values))
+                    if quantiles:
+                        field_stats["quantiles"] = {label: by_label[label] for label in quantiles}
+                    if iqr:
+                        field_stats["iqr"] = by_label["p75"] - by_label["p25"]
+                if bins is not None:
+                    field_stats["histogram"] = self.stats_service.calculate_histogram(matrix[:, column], bins)
+        except Exception as e:
+            raise ServiceError(f"Error getting berry stats: {str(e)}") from e
+
+        return {
+            "count": count,
+            "fields": dict(zip(fields, stats))
+        }
+
+    def calculate_group_statistics(self, store: BerryStore, dimension: str) -> Dict:
+        """
+        Calculates growth time statistics for each value of a categorical berry field.
+
+        The statistics of all groups are computed in one pass over the growth time column, using the
+        dictionary codes of the categorical column as group keys.
+
+        Args:
+            store (BerryStore): The columnar berry store.
+            dimension (str): The categorical field to group by.
+
+        Returns:
+            Dict: The dimension and, for each group, its berry names and growth time statistics.
+
+        Raises:
+            ValidationException: If the dimension is not a categorical berry field.
+            ServiceError: If an error occurs while calculating the statistics.
+        """
+        validate_dimension(dimension)
+
+        groups = self.stats_service.calculate_grouped_statistics(
+            store.codes[dimension],
+            store.column("growth_time"),
+            len(store.categories[dimension])
+        )
+
+        return {
+            "dimension": dimension,
+            "groups": [
+                {
+                    "group": category,
+                    "berries_names": [store.names[row] for row in store.category_index[dimension][category]],
+                    "min_growth_time": stats['min'],
+                    "median_growth_time": stats['median'],
+                    "max_growth_time": stats['max'],
+                    "variance_growth_time": stats['variance'],
+                    "mean_growth_time": stats['mean'],
+                    "frequency_growth_time": stats['frequency']
+                }
+                for category, stats in zip(store.categories[dimension], groups)
+                if stats is not None
+            ]
+        }
+
 
 berry_service = BerryService()
@@ -0,0 +1,202 @@
+import operator
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from app.core.exceptions import ValidationException
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NUMERIC_FIELDS = ("growth_time", "size", "smoothness", "soil_dryness", "max_harvest", "natural_gift_power")
+CATEGORICAL_FIELDS = ("firmness", "natural_gift_type")
+
+_FILTER_PATTERN = re.compile(r"^\s*([a-z_]+)\s*(==|!=|>=|<=|=|>|<)\s*(.+?)\s*$")
+_COMPARISONS: Dict[str, Callable] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le
+}
+
+
+class BerryFilter(NamedTuple):
+    """
+    A single comparison on a berry field, such as ``growth_time>5`` or ``firmness=hard``.
+
+    Attributes:
+        field (str): The field being compared.
+        op (str): The comparison operator.
+        value (Union[str, float]): The value the field is compared with.
+    """
+    field: str
+    op: str
+    value: Union[str, float]
+
+
+def parse_filter(expression: str) -> BerryFilter:
+    """
+    Parses a filter expression of the form ``<field><op><value>``.
+
+    Numeric fields accept ``=``, ``==``, ``!=``, ``>``, ``>=``, ``<`` and ``<=``. Categorical fields accept
+    ``=``, ``==`` and ``!=``.
+
+    Args:
+        expression (str): The filter expression.
+
+    Returns:
+        BerryFilter: The parsed filter.
+
+    Raises:
+        ValidationException: If the expression is malformed or uses an unknown field or operator.
+    """
+    match = _FILTER_PATTERN.match(expression)
+    if match is None:
+        raise ValidationException(f"Invalid filter: {expression}")
+
+    field, op, value = match.groups()
+    if field in NUMERIC_FIELDS:
+        try:
+            return BerryFilter(field, op, float(value))
+        except ValueError:
+            raise ValidationException(f"Invalid filter: {field} must be compared with a number")
+    if field in CATEGORICAL_FIELDS:
+        if op not in ("=", "==", "!="):
+            raise ValidationException(f"Invalid filter: {field} only supports =, == and !=")
+        return BerryFilter(field, op, value.lower())
+
+    raise ValidationException(
+        f"Invalid filter: unknown field {field}. "
+        f"Valid fields are: {', '.join(NUMERIC_FIELDS + CATEGORICAL_FIELDS)}"
+    )
+
+
+class BerryStore:
+    """
+    Columnar in-memory store of berry records.
+
+    Numeric fields are kept as NumPy arrays and categorical fields are dictionary-encoded as integer codes
+    plus a list of distinct values. Hash indexes map berry names to rows and categorical values to the rows
+    that have them, so filtered queries are answered with boolean-mask arithmetic.
+
+    Attributes:
+        names (List[str]): The berry names, in row order.
+        numeric (Dict[str, np.ndarray]): The numeric columns. A field missing from any record has no column.
+        codes (Dict[str, np.ndarray]): The integer codes of each categorical column.
+        categories (Dict[str, List[str]]): The distinct values of each categorical column, indexed by code.
+        name_index (Dict[str, int]): The row of each berry name.
+        category_index (Dict[str, Dict[str, np.ndarray]]): The rows holding each categorical value.
+    """
+
+    def __init__(self, berries: List[Dict]) -> None:
+        """
+        Builds the columns and indexes from projected berry records.
+
+        Args:
+            berries (List[Dict]): The projected berry records.
+        """
+        import numpy as np
+
+        self.names: List[str] = [berry['name'] for berry in berries]
+        self.name_index: Dict[str, int] = {name: row for row, name in enumerate(self.names)}
+
+        self.numeric: Dict[str, np.ndarray] = {}
+        for field in NUMERIC_FIELDS:
+            values = [berry.get(field) for berry in berries]
+            if all(value is not None for value in values):
+                self.numeric[field] = np.array(values, dtype=np.int64)
+
+        self.codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, List[str]] = {}
+        self.category_index: Dict[str, Dict[str, np.ndarray]] = {}
+        for field in CATEGORICAL_FIELDS:
+            values = [berry.get(field) or "" for berry in berries]
+            categories, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+            self.categories[field] = [str(category) for category in categories]
+            self.codes[field] = codes.astype(np.int64)
+            order = np.argsort(self.codes[field], kind="stable")
+            bounds = np.cumsum(np.bincount(self.codes[field], minlength=len(categories)))
+            self.category_index[field] = {
+                category: rows
+                for category, rows in zip(self.categories[field], np.split(order, bounds[:-1]))
+            }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, name: str) -> Optional[int]:
+        """
+        Looks up the row of a berry by name.
+
+        Args:
+            name (str): The berry name.
+
+        Returns:
+            Optional[int]: The row of the berry, or None if it is not in the store.
+        """
+        return self.name_index.get(name.lower().strip())
+
+    def column(self, field: str) -> "np.ndarray":
+        """
+        Returns a numeric column.
+
+        Args:
+            field (str): The numeric field.
+
+        Returns:
+            np.ndarray: The values of the field, in row order.
+
+        Raises:
+            ValidationException: If the field has no column in the store.
+        """
+        if field not in self.numeric:
+            raise ValidationException(f"Field {field} is not available")
+        return self.numeric[field]
+
+    def mask(self, filters: Sequence[BerryFilter] = ()) -> "np.ndarray":
+        """
+        Computes the rows that satisfy every filter.
+
+        Args:
+            filters (Sequence[BerryFilter]): The filters to apply.
+
+        Returns:
+            np.ndarray: A boolean mask with one entry per row.
+
+        Raises:
+            ValidationException: If a filter uses a numeric field that has no column in the store.
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+        for berry_filter in filters:
+            if berry_filter.field in CATEGORICAL_FIELDS:
+                matches = np.zeros(len(self), dtype=bool)
+                rows = self.category_index[berry_filter.field].get(berry_filter.value)
+                if rows is not None:
+                    matches[rows] = True
+                mask &= ~matches if berry_filter.op == "!=" else matches
+            else:
+                mask &= _COMPARISONS[berry_filter.op](self.column(berry_filter.field), berry_filter.value)
+        return mask
+
+    def matrix(self, fields: Sequence[str], mask: "Optional[np.ndarray]" = None) -> "np.ndarray":
+        """
+        Stacks numeric columns into a 2-D matrix.
+
+        Args:
+            fields (Sequence[str]): The numeric fields, one per matrix column.
+            mask (Optional[np.ndarray]): A boolean mask selecting the rows to include.
+
+        Returns:
+            np.ndarray: A matrix with one row per selected berry and one column per field.
+
+        Raises:
+            ValidationException: If a field has no column in the store.
+        """
+        import numpy as np
+
+        matrix = np.column_stack([self.column(field) for field in fields])
+        return matrix if mask is None else matrix[mask]
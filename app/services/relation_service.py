@@ -0,0 +1,208 @@
+import asyncio
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from app.clients.poke_api import poke_api_client
+from app.core.exceptions import PokeAPIException
+from app.core.timing import span
+from app.services.stats_service import StreamingStats
+
+LINKED_RESOURCES = {"firmness": "berry-firmness", "flavors": "berry-flavor", "item": "item"}
+
+
+class CrawlResult(NamedTuple):
+    """
+    The linked resources resolved by a crawl, and how many upstream calls deduplication saved.
+
+    Attributes:
+        resources (Dict[str, Dict]): The payload of each endpoint that was fetched successfully.
+        references (int): The number of links followed, duplicates included.
+        fetched (int): The number of distinct endpoints requested.
+        errors (int): The number of distinct endpoints that could not be fetched.
+    """
+    resources: Dict[str, Dict]
+    references: int
+    fetched: int
+    errors: int
+
+    @property
+    def saved(self) -> int:
+        """Returns the number of upstream calls avoided by fetching each distinct endpoint once."""
+        return self.references - self.fetched
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Returns the crawl counters.
+
+        Returns:
+            Dict[str, int]: The references, fetched endpoints, calls saved and errors.
+        """
+        return {"references": self.references, "fetched": self.fetched, "saved": self.saved, "errors": self.errors}
+
+
+def berry_links(berry: Dict) -> List[str]:
+    """
+    Returns the endpoints of the resources a projected berry record links to.
+
+    Args:
+        berry (Dict): The projected berry record.
+
+    Returns:
+        List[str]: The endpoints of its firmness, its flavors and its item.
+    """
+    links = []
+    if berry.get("firmness"):
+        links.append(f"{LINKED_RESOURCES['firmness']}/{berry['firmness']}")
+    links.extend(f"{LINKED_RESOURCES['flavors']}/{flavor}" for flavor in berry.get("flavors") or {})
+    if berry.get("item"):
+        links.append(f"{LINKED_RESOURCES['item']}/{berry['item']}")
+    return links
+
+
+def english_name(resource: Optional[Dict]) -> Optional[str]:
+    """
+    Returns the English display name of a PokeAPI resource.
+
+    Args:
+        resource (Optional[Dict]): The resource payload.
+
+    Returns:
+        Optional[str]: The English name, or None if the resource or its English name is missing.
+    """
+    for name in (resource or {}).get("names", []):
+        if name.get("language", {}).get("name") == "en":
+            return name.get("name")
+    return None
+
+
+def _stats(aggregate: StreamingStats, suffix: str) -> Dict[str, Optional[float]]:
+    if aggregate.count == 0:
+        return {f"{key}_{suffix}": None for key in ("min", "median", "max", "mean", "variance")}
+    stats = aggregate.to_dict()
+    return {f"{key}_{suffix}": stats[key] for key in ("min", "median", "max", "mean", "variance")}
+
+
+class RelationService:
+    """
+    Service that resolves the resources berries link to and aggregates berries by flavor and firmness.
+
+    Berries share a handful of flavors and firmnesses, so following every link would request the same
+    resources again and again. The crawler keeps a visited set, requests each distinct endpoint once and
+    concurrently through the shared PokeAPI client and its response cache, and reports how many upstream
+    calls the deduplication saved. The aggregates are computed once per stats snapshot, so the linked
+    resources are resolved at most once per refresh.
+
+    Attributes:
+        client: The PokeAPI client.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the RelationService with the shared PokeAPI client.
+        """
+        self.client = poke_api_client
+
+    async def crawl(self, links: Iterable[str]) -> CrawlResult:
+        """
+        Fetches every distinct endpoint among the given links once, concurrently.
+
+        Args:
+            links (Iterable[str]): The endpoints to resolve, duplicates included.
+
+        Returns:
+            CrawlResult: The payload of each resolved endpoint and the crawl counters.
+        """
+        visited = set()
+        distinct = []
+        references = 0
+        for link in links:
+            references += 1
+            if link not in visited:
+                visited.add(link)
+                distinct.append(link)
+
+        resources: Dict[str, Dict] = {}
+        errors = 0
+        with span("relations"):
+            async for endpoint, resource in self.client.iter_endpoints(distinct):
+                if isinstance(resource, PokeAPIException):
+                    errors += 1
+                else:
+                    resources[endpoint] = resource
+        return CrawlResult(resources, references, len(distinct), errors)
+
+    async def get_aggregates(self, snapshot) -> Dict[str, Dict]:
+        """
+        Returns the flavor and firmness aggregates of a snapshot, computing them the first time.
+
+        Concurrent requests for the same snapshot share one crawl. A failed computation is not memoized.
+
+        Args:
+            snapshot (StatsSnapshot): The snapshot whose berries are aggregated.
+
+        Returns:
+            Dict[str, Dict]: The ``flavors`` and ``firmness`` aggregates, each with the crawl counters.
+        """
+        task = snapshot.memoize("relations", lambda: asyncio.ensure_future(self._aggregate(snapshot.berries)))
+        try:
+            return task.result() if task.done() else await asyncio.shield(task)
+        except Exception:
+            snapshot.forget("relations")
+            raise
+
+    async def _aggregate(self, berries: List[Dict]) -> Dict[str, Dict]:
+        """
+        Resolves the links of the berries and aggregates them by flavor and by firmness.
+
+        Args:
+            berries (List[Dict]): The projected berry records.
+
+        Returns:
+            Dict[str, Dict]: The ``flavors`` and ``firmness`` aggregates, each with the crawl counters.
+        """
+        result = await self.crawl(link for berry in berries for link in berry_links(berry))
+        crawl = result.summary()
+
+        potencies: Dict[str, StreamingStats] = {}
+        for berry in berries:
+            for flavor, potency in (berry.get("flavors") or {}).items():
+                aggregate = potencies.setdefault(flavor, StreamingStats())
+                if potency:
+                    aggregate.add(potency)
+
+        flavors = []
+        for flavor in sorted(potencies):
+            resource = result.resources.get(f"{LINKED_RESOURCES['flavors']}/{flavor}")
+            flavors.append({
+                "flavor": flavor,
+                "display_name": english_name(resource),
+                "contest_type": ((resource or {}).get("contest_type") or {}).get("name"),
+                "berries": potencies[flavor].count,
+                **_stats(potencies[flavor], "potency")
+            })
+
+        groups: Dict[str, List[Dict]] = {}
+        for berry in berries:
+            if berry.get("firmness"):
+                groups.setdefault(berry["firmness"], []).append(berry)
+
+        firmness = []
+        for name in sorted(groups):
+            costs = StreamingStats()
+            for berry in groups[name]:
+                item = result.resources.get(f"{LINKED_RESOURCES['item']}/{berry.get('item')}")
+                if item is not None and isinstance(item.get("cost"), (int, float)):
+                    costs.add(item["cost"])
+            firmness.append({
+                "firmness": name,
+                "display_name": english_name(result.resources.get(f"{LINKED_RESOURCES['firmness']}/{name}")),
+                "berries_names": [berry["name"] for berry in groups[name]],
+                **_stats(costs, "item_cost")
+            })
+
+        return {
+            "flavors": {"flavors": flavors, "crawl": crawl},
+            "firmness": {"firmness": firmness, "crawl": crawl}
+        }
+
+
+relation_service = RelationService()
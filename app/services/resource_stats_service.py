@@ -0,0 +1,300 @@
+import re
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional
+
+from app.clients.poke_api import poke_api_client
+from app.core.config import POKEAPI_RESOURCES, settings
+from app.core.exceptions import (
+    BaseAPIException,
+    NotFoundError,
+    PokeAPIException,
+    ServiceError,
+    ValidationException
+)
+from app.core.metrics import register_cache
+from app.core.timing import span
+from app.services.stats_service import Number, StreamingStats
+from app.utils.cache import TTLCache
+from app.utils.singleflight import SingleFlight
+
+_RESOURCE = re.compile(r"^[a-z]+(-[a-z]+)*$")
+_FIELD = re.compile(r"^[A-Za-z0-9_-]+(\.[A-Za-z0-9_-]+)*$")
+
+
+def validate_resource(resource: str, field: str) -> None:
+    """
+    Checks that a resource is a PokeAPI resource and that a field path is well formed.
+
+    Unknown resources are rejected before any PokeAPI call, so clients cannot make the service request,
+    and label metrics with, arbitrary upstream paths.
+
+    Args:
+        resource (str): The PokeAPI list resource, such as ``pokemon``.
+        field (str): The dotted path of a field, such as ``stats.base_stat``.
+
+    Raises:
+        ValidationException: If the resource or the field path is malformed.
+        NotFoundError: If the resource is not a PokeAPI resource.
+    """
+    if not _RESOURCE.match(resource):
+        raise ValidationException(f"Invalid resource: {resource}")
+    if resource not in POKEAPI_RESOURCES:
+        raise NotFoundError(f"Resource not found: {resource}")
+    if not _FIELD.match(field):
+        raise ValidationException(f"Invalid field: {field}")
+
+
+def extract_values(payload: Any, path: str) -> List[Number]:
+    """
+    Collects the numeric values found at a dotted path of a PokeAPI payload.
+
+    Each segment of the path is a key of an object or an index of a list. A segment that is not an index
+    applies to every element of a list, so ``stats.base_stat`` collects the base stat of every stat of a
+    Pokémon. Booleans and missing values are ignored.
+
+    Args:
+        payload (Any): The payload.
+        path (str): The dotted path, such as ``weight`` or ``stats.0.base_stat``.
+
+    Returns:
+        List[Number]: The numeric values at the path, in payload order.
+    """
+    values = [payload]
+    for segment in path.split("."):
+        matches = []
+        for value in values:
+            if isinstance(value, dict):
+                if segment in value:
+                    matches.append(value[segment])
+            elif isinstance(value, list):
+                if segment.isdigit():
+                    if int(segment) < len(value):
+                        matches.append(value[int(segment)])
+                else:
+                    matches.extend(item[segment] for item in value if isinstance(item, dict) and segment in item)
+        values = matches
+    return [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+
+
+def numeric_skeleton(payload: Any) -> Any:
+    """
+    Reduces a PokeAPI payload to the numbers a dotted field path can reach.
+
+    Strings, booleans and branches without numbers are dropped. List elements are replaced by None instead,
+    so list indexes still point at the same elements. ``extract_values`` finds the same values in the
+    skeleton as in the payload, which takes a fraction of the memory.
+
+    Args:
+        payload (Any): The payload.
+
+    Returns:
+        Any: The skeleton, or None if the payload holds no number.
+    """
+    if isinstance(payload, dict):
+        skeleton = {}
+        for key, value in payload.items():
+            pruned = numeric_skeleton(value)
+            if pruned is not None:
+                skeleton[key] = pruned
+        return skeleton or None
+    if isinstance(payload, list):
+        items = [numeric_skeleton(item) for item in payload]
+        return items if any(item is not None for item in items) else None
+    if isinstance(payload, (int, float)) and not isinstance(payload, bool):
+        return payload
+    return None
+
+
+class ResourceCrawl(NamedTuple):
+    """
+    The entries of a crawled resource, reduced to their numbers.
+
+    Attributes:
+        entries (int): The number of entries listed.
+        skeletons (List[Any]): The numeric skeleton of each entry that was fetched.
+        errors (int): The number of entries that could not be fetched.
+    """
+    entries: int
+    skeletons: List[Any]
+    errors: int
+
+
+class ResourceStatsService:
+    """
+    Service that calculates statistics of a numeric field over every entry of any PokeAPI list resource.
+
+    The resource is listed page by page, and a resource with more than ``max_entries`` entries is rejected
+    after the first page. Its entries are fetched concurrently through the PokeAPI client, which bounds the
+    requests in flight, but bypass its response cache so a large crawl does not evict the cached berries.
+    Each entry is reduced to its numeric skeleton as soon as it arrives, and the crawl of the last
+    ``RESOURCE_STATS_CRAWL_CACHE_SIZE`` resources is kept for ``CACHE_TTL`` seconds, so the other fields of a
+    resource are computed without calling the PokeAPI again.
+
+    Results are cached for ``CACHE_TTL`` seconds, and so are unknown resources, resources that are too large
+    and fields without values, so repeating a bad request does not crawl again. Concurrent requests for the
+    same statistics or the same resource share one computation.
+
+    Attributes:
+        client: The PokeAPI client.
+        max_entries (int): The largest resource that is crawled.
+        cache (Optional[TTLCache]): The computed statistics, or the error, by resource and field, or None if
+            caching is disabled.
+        crawls (Optional[TTLCache]): The crawl, or the error, by resource, or None if caching is disabled.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the ResourceStatsService with the shared PokeAPI client.
+        """
+        self.client = poke_api_client
+        self.max_entries: int = settings.RESOURCE_STATS_MAX_ENTRIES
+        self.cache: Optional[TTLCache] = (
+            TTLCache(settings.CACHE_MAX_SIZE, settings.CACHE_TTL) if settings.CACHE_ENABLED else None
+        )
+        self.crawls: Optional[TTLCache] = (
+            TTLCache(settings.RESOURCE_STATS_CRAWL_CACHE_SIZE, settings.CACHE_TTL) if settings.CACHE_ENABLED else None
+        )
+        self._single_flight = SingleFlight()
+
+    async def get_field_stats(self, resource: str, field: str) -> Dict:
+        """
+        Returns the statistics of a field over every entry of a resource.
+
+        Args:
+            resource (str): The PokeAPI list resource, such as ``pokemon``.
+            field (str): The dotted path of a numeric field, such as ``base_experience``.
+
+        Returns:
+            Dict: The resource, the field, the number of entries, values, entries without a value and failed
+            fetches, and the min, max, mean, median, variance and frequency of the values.
+
+        Raises:
+            ValidationException: If the resource or field is malformed, or the resource is too large.
+            NotFoundError: If the resource does not exist or none of its entries has a numeric value at the
+                field path.
+            ServiceError: If the resource could not be listed.
+        """
+        validate_resource(resource, field)
+        return await self._cached(
+            self.cache, ("stats", resource, field), lambda: self._compute_field_stats(resource, field)
+        )
+
+    async def _cached(self, cache: Optional[TTLCache], key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns a cached result, or computes it once for all concurrent callers and caches it.
+
+        A NotFoundError or ValidationException is cached too, and raised again while it is fresh. Other
+        errors, such as PokeAPI failures, are not cached.
+
+        Args:
+            cache (Optional[TTLCache]): The cache, or None if caching is disabled.
+            key (Hashable): The cache and single-flight key.
+            compute (Callable[[], Awaitable[Any]]): Computes the result.
+
+        Returns:
+            Any: The result.
+
+        Raises:
+            BaseAPIException: The error of the computation, or the cached error.
+        """
+        cached = cache.get(key) if cache is not None else None
+        if isinstance(cached, BaseAPIException):
+            raise type(cached)(cached.message, cached.status_code)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self._single_flight.do(key, compute)
+        except (NotFoundError, ValidationException) as e:
+            if cache is not None:
+                cache.set(key, type(e)(e.message, e.status_code))
+            raise
+        if cache is not None:
+            cache.set(key, result)
+        return result
+
+    async def _compute_field_stats(self, resource: str, field: str) -> Dict:
+        """
+        Aggregates the values of a field over the crawled entries of a resource.
+
+        Args:
+            resource (str): The PokeAPI list resource.
+            field (str): The dotted path of the field.
+
+        Returns:
+            Dict: The statistics, as returned by get_field_stats.
+
+        Raises:
+            ValidationException: If the resource has more than ``max_entries`` entries.
+            NotFoundError: If the resource does not exist or has no value at the field path.
+            ServiceError: If the resource could not be listed.
+        """
+        crawl: ResourceCrawl = await self._cached(self.crawls, ("crawl", resource), lambda: self._crawl(resource))
+
+        aggregate = StreamingStats()
+        missing = 0
+        for skeleton in crawl.skeletons:
+            values = extract_values(skeleton, field)
+            if not values:
+                missing += 1
+            for value in values:
+                aggregate.add(value)
+
+        if aggregate.count == 0:
+            raise NotFoundError(f"No numeric values of {field} found in {resource}")
+
+        return {
+            "resource": resource,
+            "field": field,
+            "entries": crawl.entries,
+            "missing": missing,
+            "errors": crawl.errors,
+            "count": aggregate.count,
+            **aggregate.to_dict(frequency_key="value")
+        }
+
+    async def _crawl(self, resource: str) -> ResourceCrawl:
+        """
+        Lists a resource and fetches its entries, keeping only their numeric skeletons.
+
+        Args:
+            resource (str): The PokeAPI list resource.
+
+        Returns:
+            ResourceCrawl: The number of entries, the skeleton of each fetched entry and the failed fetches.
+
+        Raises:
+            ValidationException: If the resource has more than ``max_entries`` entries.
+            NotFoundError: If the resource does not exist.
+            ServiceError: If the resource could not be listed.
+        """
+        try:
+            with span("list"):
+                entries = await self.client.get_paginated(resource, max_count=self.max_entries)
+        except PokeAPIException as e:
+            if e.status_code == 404:
+                raise NotFoundError(f"Resource not found: {resource}") from e
+            if e.status_code == 413:
+                raise ValidationException(e.message) from e
+            raise ServiceError(f"Error listing {resource}: {str(e)}") from e
+
+        identifiers = [entry.get('name') or entry['url'].rstrip("/").rsplit("/", 1)[-1] for entry in entries]
+        skeletons = []
+        errors = 0
+        with span("details"):
+            async for _, detail in self.client.iter_resource_details(resource, identifiers, use_cache=False):
+                if isinstance(detail, PokeAPIException):
+                    errors += 1
+                else:
+                    skeletons.append(numeric_skeleton(detail))
+        return ResourceCrawl(len(entries), skeletons, errors)
+
+
+resource_stats_service = ResourceStatsService()
+register_cache(
+    "resource_stats",
+    lambda: resource_stats_service.cache.stats() if resource_stats_service.cache is not None else None
+)
+register_cache(
+    "resource_crawls",
+    lambda: resource_stats_service.crawls.stats() if resource_stats_service.crawls is not None else None
+)
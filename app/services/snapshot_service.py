@@ -0,0 +1,370 @@
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from app.core.config import settings
+from app.core.exceptions import ServiceError
+from app.services.berry_service import berry_service
+from app.utils.singleflight import SingleFlight
+from app.utils.snapshot_file import read_snapshot_file, read_snapshot_generation, write_snapshot_file
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """
+    Precomputed berry statistics, the berry catalog they were computed from and the time they were built.
+
+    Values derived from the snapshot, such as its encoded response body, can be memoized on it so they
+    are computed once per data version.
+
+    Attributes:
+        stats (Dict): The berry statistics, as returned by BerryService.
+        built_at (float): Unix timestamp of when the snapshot was built.
+        berries (Optional[List[Dict]]): The projected berry records, if known.
+    """
+    stats: Dict
+    built_at: float
+    berries: Optional[List[Dict]] = None
+    _memo: Dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def age(self) -> float:
+        """Returns the age of the snapshot in seconds."""
+        return max(0.0, time.time() - self.built_at)
+
+    @cached_property
+    def etag(self) -> str:
+        """Returns a strong entity tag derived from a hash of the statistics."""
+        canonical = json.dumps(self.stats, sort_keys=True, separators=(",", ":")).encode()
+        return f'"{hashlib.sha256(canonical).hexdigest()[:32]}"'
+
+    def memoize(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Returns the value memoized under a key, computing it with ``factory`` the first time.
+
+        Args:
+            key (Hashable): The key of the derived value.
+            factory (Callable[[], Any]): Computes the value from the snapshot.
+
+        Returns:
+            Any: The memoized value.
+        """
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Drops the value memoized under a key, so the next ``memoize`` call computes it again.
+
+        Args:
+            key (Hashable): The key of the derived value.
+        """
+        self._memo.pop(key, None)
+
+
+class SnapshotService:
+    """
+    Service that keeps a precomputed snapshot of the berry statistics.
+
+    The snapshot is built when the application starts and refreshed by a background task at a fixed
+    interval. Requests read the current snapshot instead of recomputing the statistics. If a refresh
+    fails, the last good snapshot keeps being served.
+
+    When a snapshot path is configured, every refreshed snapshot is saved to disk. On startup, a saved
+    snapshot is loaded and served immediately while a fresh one is computed in the background.
+
+    The snapshot file is also how several worker processes share one snapshot. The worker that holds an
+    exclusive lock on ``<path>.lock`` is the publisher: it is the only one that calls the PokeAPI, and every
+    snapshot it writes carries an increasing generation counter. The other workers never fetch upstream;
+    they poll the generation in the file header and map the file again when it changes. The lock is released
+    when the publisher exits, and the next worker to poll takes over.
+
+    Attributes:
+        refresh_interval (float): Seconds between background refreshes.
+        path (Optional[str]): The snapshot file path, or None to keep snapshots in memory only.
+        poll_interval (float): Seconds between checks of the snapshot file by non-publishing workers.
+        wait_timeout (float): Seconds a non-publishing worker waits for a first snapshot to be published.
+        generation (int): The generation of the current snapshot.
+        last_error (Optional[str]): The error of the last failed refresh, if any.
+    """
+
+    def __init__(
+            self,
+            refresh_interval: float = settings.SNAPSHOT_REFRESH_INTERVAL,
+            path: Optional[str] = settings.SNAPSHOT_PATH or None,
+            poll_interval: float = settings.SNAPSHOT_POLL_INTERVAL,
+            wait_timeout: float = settings.SNAPSHOT_WAIT_TIMEOUT
+    ) -> None:
+        """
+        Initializes the SnapshotService without a snapshot.
+
+        Args:
+            refresh_interval (float): Seconds between background refreshes.
+            path (Optional[str]): The snapshot file path, or None to keep snapshots in memory only.
+            poll_interval (float): Seconds between checks of the snapshot file by non-publishing workers.
+            wait_timeout (float): Seconds a non-publishing worker waits for a first snapshot to be published.
+        """
+        self.refresh_interval = refresh_interval
+        self.path = path
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self.generation = 0
+        self.last_error: Optional[str] = None
+        self._snapshot: Optional[StatsSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock_fd: Optional[int] = None
+        self._single_flight = SingleFlight()
+
+    @property
+    def current(self) -> Optional[StatsSnapshot]:
+        """Returns the current snapshot, or None if none has been built yet."""
+        return self._snapshot
+
+    @property
+    def is_publisher(self) -> bool:
+        """Returns whether this process builds and publishes the snapshots."""
+        return self.path is None or self._lock_fd is not None
+
+    async def get(self) -> StatsSnapshot:
+        """
+        Returns the current snapshot, building it first if there is none yet.
+
+        A worker that does not publish snapshots waits up to ``wait_timeout`` seconds for the publisher
+        instead of building one itself.
+
+        Returns:
+            StatsSnapshot: The current snapshot.
+
+        Raises:
+            ServiceError: If the snapshot has to be built and the computation fails, or if no snapshot was
+                published in time.
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+        if self._acquire_publisher_lock():
+            return await self.refresh()
+
+        deadline = time.monotonic() + self.wait_timeout
+        while self.load() is None:
+            if time.monotonic() >= deadline:
+                raise ServiceError("Berry stats snapshot has not been published yet")
+            await asyncio.sleep(self.poll_interval)
+        return self._snapshot
+
+    async def refresh(self) -> StatsSnapshot:
+        """
+        Recomputes the berry statistics and replaces the current snapshot.
+
+        The new snapshot is also saved to disk, with the next generation number, when a snapshot path is
+        configured. Concurrent refreshes, such as the first requests of a cold worker, share one build, so
+        one computation publishes one generation.
+
+        Returns:
+            StatsSnapshot: The new snapshot.
+
+        Raises:
+            ServiceError: If the statistics could not be computed. The current snapshot is kept.
+        """
+        return await self._single_flight.do("refresh", self._build)
+
+    async def _build(self) -> StatsSnapshot:
+        """
+        Computes, publishes and saves a new snapshot.
+
+        Returns:
+            StatsSnapshot: The new snapshot.
+        """
+        stats = await berry_service.get_all_berry_stats()
+        self._snapshot = StatsSnapshot(stats=stats, built_at=time.time(), berries=berry_service.berries)
+        self.generation += 1
+        self.last_error = None
+
+        if self.path:
+            try:
+                await asyncio.to_thread(self.save, self._snapshot)
+            except OSError as e:
+                logger.warning("Could not save berry stats snapshot to %s: %s", self.path, e)
+        return self._snapshot
+
+    def save(self, snapshot: StatsSnapshot) -> None:
+        """
+        Saves a snapshot to the configured snapshot file.
+
+        Args:
+            snapshot (StatsSnapshot): The snapshot to save.
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        write_snapshot_file(
+            self.path,
+            snapshot.built_at,
+            json.dumps(snapshot.stats, separators=(",", ":")).encode(),
+            json.dumps(snapshot.berries, separators=(",", ":")).encode(),
+            generation=self.generation
+        )
+
+    def load(self) -> Optional[StatsSnapshot]:
+        """
+        Loads the snapshot saved in the configured snapshot file and makes it current.
+
+        Returns:
+            Optional[StatsSnapshot]: The loaded snapshot, or None if there is no valid snapshot file.
+        """
+        if not self.path:
+            return None
+
+        contents = read_snapshot_file(self.path)
+        if contents is None or len(contents.sections) != 2:
+            return None
+
+        try:
+            stats, berries = (json.loads(section) for section in contents.sections)
+        except ValueError as e:
+            logger.warning("Ignoring unreadable berry stats snapshot %s: %s", self.path, e)
+            return None
+
+        self._snapshot = StatsSnapshot(stats=stats, built_at=contents.built_at, berries=berries)
+        self.generation = max(self.generation, contents.generation)
+        return self._snapshot
+
+    def sync(self) -> bool:
+        """
+        Loads the snapshot file if another worker has published a newer generation.
+
+        Returns:
+            bool: True if a newer snapshot was loaded.
+        """
+        if not self.path:
+            return False
+        generation = read_snapshot_generation(self.path)
+        if generation is None or (self._snapshot is not None and generation <= self.generation):
+            return False
+        return self.load() is not None
+
+    def clear(self) -> None:
+        """
+        Drops the current snapshot.
+        """
+        self._snapshot = None
+
+    async def start(self, wait: bool = True) -> None:
+        """
+        Builds the initial snapshot and starts the background refresh task.
+
+        If a saved snapshot can be loaded from disk, it is served right away and revalidated in the
+        background instead. A failed initial build is logged and retried by the background task, so the
+        application can start even when the PokeAPI is unavailable. A worker that does not publish snapshots
+        only loads the saved snapshot and starts polling for new generations.
+
+        Args:
+            wait (bool): Whether to wait for the initial build. When False, the initial build runs in the
+                background task, so the application accepts requests right away and reports ready once the
+                first snapshot is available.
+        """
+        publisher = self._acquire_publisher_lock()
+        if self._snapshot is not None or self.load() is not None or not publisher:
+            initial_delay = 0.0 if publisher else self.poll_interval
+        elif not wait:
+            initial_delay = 0.0
+        else:
+            await self._safe_refresh()
+            initial_delay = self.refresh_interval
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(initial_delay))
+
+    async def stop(self) -> None:
+        """
+        Stops the background refresh task and gives up the publisher role.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._release_publisher_lock()
+
+    async def _refresh_loop(self, initial_delay: float) -> None:
+        """
+        Refreshes the snapshot every ``refresh_interval`` seconds until cancelled.
+
+        A worker that does not publish snapshots checks the snapshot file every ``poll_interval`` seconds
+        instead, and becomes the publisher if the lock has been released.
+
+        Args:
+            initial_delay (float): Seconds to wait before the first refresh.
+        """
+        await asyncio.sleep(initial_delay)
+        while True:
+            if self._acquire_publisher_lock():
+                await self._safe_refresh()
+                await asyncio.sleep(self.refresh_interval)
+            else:
+                await asyncio.to_thread(self.sync)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _safe_refresh(self) -> None:
+        """
+        Refreshes the snapshot, logging failures instead of raising them.
+        """
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning("Berry stats snapshot refresh failed: %s", e)
+
+    def _acquire_publisher_lock(self) -> bool:
+        """
+        Tries to become the process that publishes snapshots, without blocking.
+
+        If the lock file cannot be created, for instance because the snapshot directory is not writable,
+        persistence is disabled and this process publishes its snapshots in memory only.
+
+        Returns:
+            bool: True if this process publishes snapshots.
+        """
+        if self.is_publisher:
+            return True
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.warning("Cannot use berry stats snapshot file %s, keeping snapshots in memory: %s", self.path, e)
+            self.path = None
+            return True
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._lock_fd = fd
+        self.sync()
+        logger.info("Publishing berry stats snapshots to %s", self.path)
+        return True
+
+    def _release_publisher_lock(self) -> None:
+        """
+        Releases the publisher lock, if held.
+        """
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+snapshot_service = SnapshotService()
@@ -1,9 +1,192 @@
 from collections import Counter
-from typing import Dict, List
-
-import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Union
 
 from app.core.exceptions import ServiceError
+from app.core.metrics import STATS_COMPUTE_SECONDS
+from app.core.timing import span
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Number = Union[int, float]
+
+# Integer data spanning more than this many values per element is not worth a dense histogram.
+MAX_HISTOGRAM_SPREAD = 8
+
+
+class StreamingStats:
+    """
+    Incremental, mergeable aggregator for count, min, max, mean, variance, median and frequency.
+
+    Values can be added one at a time or in chunks, and two aggregators can be merged, so partial
+    results computed separately can be combined without the raw data. The mean and variance are
+    tracked with Welford's algorithm, and the median and frequency table are computed exactly from a
+    histogram of the values.
+
+    Attributes:
+        count (int): The number of values seen.
+        min (Optional[Number]): The smallest value seen.
+        max (Optional[Number]): The largest value seen.
+        mean (float): The running mean.
+        m2 (float): The running sum of squared differences from the mean.
+        histogram (Dict[Number, int]): The number of occurrences of each value.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty aggregator."""
+        self.count: int = 0
+        self.min: Optional[Number] = None
+        self.max: Optional[Number] = None
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.histogram: Dict[Number, int] = {}
+
+    def add(self, value: Number) -> "StreamingStats":
+        """
+        Adds a single value.
+
+        Args:
+            value (Number): The value to add.
+
+        Returns:
+            StreamingStats: The aggregator itself.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.histogram[value] = self.histogram.get(value, 0) + 1
+        return self
+
+    def update(self, values: Iterable[Number]) -> "StreamingStats":
+        """
+        Adds a chunk of values.
+
+        The chunk is summarized in one vectorized pass and then merged into the aggregator.
+
+        Args:
+            values (Iterable[Number]): The values to add.
+
+        Returns:
+            StreamingStats: The aggregator itself.
+        """
+        import numpy as np
+
+        arr = np.asarray(list(values))
+        if arr.size == 0:
+            return self
+
+        chunk = StreamingStats()
+        chunk.count = int(arr.size)
+        chunk.mean = float(np.mean(arr))
+        chunk.m2 = float(np.sum((arr - chunk.mean) ** 2))
+        chunk.min = arr.min().item()
+        chunk.max = arr.max().item()
+        unique, counts = np.unique(arr, return_counts=True)
+        chunk.histogram = dict(zip(unique.tolist(), counts.tolist()))
+        return self.merge(chunk)
+
+    def merge(self, other: "StreamingStats") -> "StreamingStats":
+        """
+        Merges another aggregator into this one.
+
+        Args:
+            other (StreamingStats): The aggregator to merge.
+
+        Returns:
+            StreamingStats: The aggregator itself.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            self.histogram = dict(other.histogram)
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for value, frequency in other.histogram.items():
+            self.histogram[value] = self.histogram.get(value, 0) + frequency
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Returns the population variance of the values seen."""
+        return self.m2 / self.count if self.count else 0.0
+
+    def median(self) -> float:
+        """
+        Computes the exact median from the histogram.
+
+        Returns:
+            float: The median of the values seen.
+
+        Raises:
+            ValueError: If no values have been added.
+        """
+        if self.count == 0:
+            raise ValueError("Data list is empty")
+
+        lower_rank = (self.count - 1) // 2
+        upper_rank = self.count // 2
+        lower = upper = None
+        seen = 0
+        for value in sorted(self.histogram):
+            seen += self.histogram[value]
+            if lower is None and seen > lower_rank:
+                lower = value
+            if seen > upper_rank:
+                upper = value
+                break
+        return (lower + upper) / 2
+
+    def frequency(self, key: str = "growth_time") -> List[Dict[str, int]]:
+        """
+        Returns the frequency table sorted by value.
+
+        Args:
+            key (str): The name under which each value is reported.
+
+        Returns:
+            List[Dict[str, int]]: The frequency of each value.
+        """
+        return [
+            {key: value, "frequency": frequency}
+            for value, frequency in sorted(self.histogram.items())
+        ]
+
+    def to_dict(self, frequency_key: str = "growth_time") -> Dict:
+        """
+        Returns the statistics in the format of ``StatsService.calculate_statistics``.
+
+        Args:
+            frequency_key (str): The name under which each value of the frequency table is reported.
+
+        Returns:
+            Dict: The min, max, mean, median, variance and frequency of the values seen.
+
+        Raises:
+            ValueError: If no values have been added.
+        """
+        if self.count == 0:
+            raise ValueError("Data list is empty")
+
+        return {
+            'min': float(self.min),
+            'max': float(self.max),
+            'mean': float(self.mean),
+            'median': float(self.median()),
+            'variance': float(self.variance),
+            'frequency': self.frequency(frequency_key)
+        }
 
 
 class StatsService:
@@ -11,17 +194,35 @@ class StatsService:
     Service for calculating statistical metrics and frequencies.
 
     This class provides methods to calculate various statistical metrics from a list of integers,
-    as well as to determine the frequency of growth times. It handles errors gracefully by raising
+    as well as to determine the frequency of growth times. The calculations are backed by StreamingStats,
+    so partial results can also be aggregated incrementally. It handles errors gracefully by raising
     a ServiceError when exceptions occur during calculations.
 
     Methods:
         calculate_statistics(data: List[int]) -> Dict:
             Calculates statistical metrics such as min, max, mean, median, variance, and frequency of the provided data.
 
+        calculate_matrix_statistics(matrix: "np.ndarray") -> List[Dict]:
+            Calculates the same metrics for every column of a 2-D matrix in one vectorized pass.
+
+        calculate_grouped_statistics(codes: "np.ndarray", values: "np.ndarray", n_groups: int) -> List[Optional[Dict]]:
+            Calculates the same metrics for every group of values in one sort-based pass.
+
+        calculate_column_medians(matrix: "np.ndarray") -> "np.ndarray":
+            Calculates the median of every column of a 2-D matrix from one combined histogram.
+
+        calculate_quantiles(values: "np.ndarray", quantiles: Sequence[float]) -> List[float]:
+            Calculates arbitrary quantiles from a cumulative histogram of integer values.
+
+        calculate_histogram(values: "np.ndarray", bins: int) -> List[Dict]:
+            Counts the values falling into equal-width bins.
+
         calculate_growth_time_frequency(growth_times: List[int]) -> Dict[int, int]:
             Calculates the frequency of growth times from the provided list.
     """
 
+    @STATS_COMPUTE_SECONDS.labels("statistics").time()
+    @span("compute")
     def calculate_statistics(self, data: List[int]) -> Dict:
         """
         Calculates statistical metrics from a list of integers.
@@ -43,26 +244,277 @@ class StatsService:
             if not data:
                 raise ValueError("Data list is empty")
 
-            arr = np.array(data)
+            return StreamingStats().update(data).to_dict()
+
+        except Exception as e:
+            raise ServiceError(f"Error calculating statistics: {str(e)}")
+
+    @STATS_COMPUTE_SECONDS.labels("matrix").time()
+    @span("compute")
+    def calculate_matrix_statistics(self, matrix: "np.ndarray") -> List[Dict]:
+        """
+        Calculates statistical metrics for every column of a 2-D matrix.
 
-            frequency = Counter(data)
+        Each column holds the values of one attribute. The minimum, maximum, mean and variance of all
+        columns are computed with vectorized reductions along the row axis, the medians of all columns come
+        from one combined histogram, and the frequency tables of all columns come from a single
+        ``np.unique`` call over (column, value) pairs.
 
-            frequency_list = [
-                {"growth_time": k, "frequency": v}
-                for k, v in sorted(frequency.items())
+        Args:
+            matrix (np.ndarray): A 2-D array with one row per observation and one column per attribute.
+
+        Returns:
+            List[Dict]: One dictionary per column with its min, max, mean, median, variance and frequency,
+            where each frequency item has a ``value`` and a ``frequency``.
+
+        Raises:
+            ValueError: If the matrix is not 2-D or has no rows.
+            ServiceError: If an error occurs during the calculation.
+        """
+        import numpy as np
+
+        try:
+            if matrix.ndim != 2 or matrix.shape[0] == 0:
+                raise ValueError("Data matrix is empty")
+
+            mins = matrix.min(axis=0)
+            maxs = matrix.max(axis=0)
+            means = matrix.mean(axis=0)
+            medians = self.calculate_column_medians(matrix, mins, maxs)
+            variances = matrix.var(axis=0)
+
+            rows, columns = matrix.shape
+            column_index = np.broadcast_to(np.arange(columns), (rows, columns)).ravel()
+            pairs, counts = np.unique(
+                np.stack([column_index, matrix.ravel()]), axis=1, return_counts=True
+            )
+            frequencies: List[List[Dict]] = [[] for _ in range(columns)]
+            for column, value, count in zip(pairs[0].tolist(), pairs[1].tolist(), counts.tolist()):
+                frequencies[int(column)].append({"value": value, "frequency": count})
+
+            return [
+                {
+                    'min': float(mins[i]),
+                    'max': float(maxs[i]),
+                    'mean': float(means[i]),
+                    'median': float(medians[i]),
+                    'variance': float(variances[i]),
+                    'frequency': frequencies[i]
+                }
+                for i in range(columns)
+            ]
+
+        except Exception as e:
+            raise ServiceError(f"Error calculating statistics: {str(e)}")
+
+    @STATS_COMPUTE_SECONDS.labels("grouped").time()
+    @span("compute")
+    def calculate_grouped_statistics(
+            self,
+            codes: "np.ndarray",
+            values: "np.ndarray",
+            n_groups: int
+    ) -> List[Optional[Dict]]:
+        """
+        Calculates statistical metrics for groups of values.
+
+        The values are sorted once by (group, value). Counts, sums and squared deviations per group come from
+        ``np.bincount``; the minimum, maximum and median of each group are read at its offsets in the sorted
+        array, and the frequency tables come from run-length encoding the sorted (group, value) pairs.
+
+        Args:
+            codes (np.ndarray): The group code of each value, between 0 and ``n_groups - 1``.
+            values (np.ndarray): The values to calculate statistics for.
+            n_groups (int): The number of groups.
+
+        Returns:
+            List[Optional[Dict]]: For each group code, a dictionary with the count, min, max, mean, median,
+            variance and frequency of its values, or None if the group is empty.
+
+        Raises:
+            ServiceError: If an error occurs during the calculation.
+        """
+        import numpy as np
+
+        try:
+            codes = np.asarray(codes, dtype=np.int64)
+            values = np.asarray(values)
+            if values.size == 0:
+                return [None] * n_groups
+
+            order = np.lexsort((values, codes))
+            sorted_codes = codes[order]
+            sorted_values = values[order]
+
+            counts = np.bincount(codes, minlength=n_groups)
+            safe_counts = np.maximum(counts, 1)
+            means = np.bincount(codes, weights=values, minlength=n_groups) / safe_counts
+            variances = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups) / safe_counts
+
+            # Offsets of each group in the sorted array, clipped so empty groups index safely.
+            starts = np.cumsum(counts) - counts
+            first = np.clip(starts, 0, values.size - 1)
+            last = np.clip(starts + counts - 1, 0, values.size - 1)
+            lower = np.clip(starts + (counts - 1) // 2, 0, values.size - 1)
+            upper = np.clip(starts + counts // 2, 0, values.size - 1)
+            mins = sorted_values[first]
+            maxs = sorted_values[last]
+            medians = (sorted_values[lower] + sorted_values[upper]) / 2
+
+            run_starts = np.flatnonzero(np.concatenate((
+                [True],
+                (sorted_codes[1:] != sorted_codes[:-1]) | (sorted_values[1:] != sorted_values[:-1])
+            )))
+            run_lengths = np.diff(np.append(run_starts, values.size))
+            frequencies: List[List[Dict]] = [[] for _ in range(n_groups)]
+            for code, value, count in zip(
+                    sorted_codes[run_starts].tolist(),
+                    sorted_values[run_starts].tolist(),
+                    run_lengths.tolist()
+            ):
+                frequencies[code].append({"growth_time": value, "frequency": count})
+
+            return [
+                {
+                    'count': int(counts[i]),
+                    'min': float(mins[i]),
+                    'max': float(maxs[i]),
+                    'mean': float(means[i]),
+                    'median': float(medians[i]),
+                    'variance': float(variances[i]),
+                    'frequency': frequencies[i]
+                } if counts[i] else None
+                for i in range(n_groups)
             ]
-            return {
-                'min': float(np.min(arr)),
-                'max': float(np.max(arr)),
-                'mean': float(np.mean(arr)),
-                'median': float(np.median(arr)),
-                'variance': float(np.var(arr)),
-                'frequency': frequency_list
-            }
 
         except Exception as e:
             raise ServiceError(f"Error calculating statistics: {str(e)}")
 
+    def calculate_column_medians(
+            self,
+            matrix: "np.ndarray",
+            mins: Optional["np.ndarray"] = None,
+            maxs: Optional["np.ndarray"] = None
+    ) -> "np.ndarray":
+        """
+        Calculates the median of every column of a 2-D matrix, like ``np.median(matrix, axis=0)``.
+
+        Integer columns are shifted to consecutive, non-overlapping ranges and counted with one
+        ``np.bincount`` call. In the cumulative sum of that histogram, column ``i`` starts after
+        ``i * rows`` values, so the middle ranks of every column are found with one binary search. Values
+        that are not integers, or integers spread over a range much wider than their count, use
+        ``np.median``.
+
+        Args:
+            matrix (np.ndarray): A non-empty 2-D array with one row per observation and one column per
+                attribute.
+            mins (Optional[np.ndarray]): The minimum of each column, if already computed.
+            maxs (Optional[np.ndarray]): The maximum of each column, if already computed.
+
+        Returns:
+            np.ndarray: The median of each column.
+        """
+        import numpy as np
+
+        mins = matrix.min(axis=0) if mins is None else mins
+        maxs = matrix.max(axis=0) if maxs is None else maxs
+        spans = (maxs - mins + 1).astype(np.int64) if matrix.dtype.kind in "iu" else None
+        if spans is None or spans.sum() > MAX_HISTOGRAM_SPREAD * matrix.size:
+            return np.median(matrix, axis=0)
+
+        rows, columns = matrix.shape
+        offsets = np.concatenate(([0], np.cumsum(spans)[:-1]))
+        cumulative = np.cumsum(np.bincount((matrix - mins + offsets).ravel()))
+        starts = np.arange(columns, dtype=np.int64) * rows
+        rank = (rows - 1) / 2
+        lower = np.searchsorted(cumulative, starts + int(np.floor(rank)), side="right") - offsets + mins
+        upper = np.searchsorted(cumulative, starts + int(np.ceil(rank)), side="right") - offsets + mins
+        return (lower + upper) / 2
+
+    @STATS_COMPUTE_SECONDS.labels("quantiles").time()
+    def calculate_quantiles(self, values: "np.ndarray", quantiles: Sequence[float]) -> List[float]:
+        """
+        Calculates quantiles of a set of values, interpolating linearly between ranks like ``np.quantile``.
+
+        Integer values are counted into a histogram indexed by ``value - min`` whose cumulative sum gives,
+        for each value, the number of values up to it, so the value at any rank is found by a binary search
+        without sorting the data. This takes O(n + range) time instead of O(n log n). Values that are not
+        integers, or integers spread over a range much wider than their count, use ``np.quantile``.
+
+        Args:
+            values (np.ndarray): The values to calculate quantiles for.
+            quantiles (Sequence[float]): The quantiles to calculate, each between 0 and 1.
+
+        Returns:
+            List[float]: The value of each quantile, in the requested order.
+
+        Raises:
+            ValueError: If there are no values or a quantile is not between 0 and 1.
+        """
+        import numpy as np
+
+        values = np.asarray(values).ravel()
+        positions = np.asarray(quantiles, dtype=float)
+        if values.size == 0:
+            raise ValueError("Data list is empty")
+        if np.any((positions < 0) | (positions > 1)):
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        if values.dtype.kind not in "iu" or np.ptp(values) > MAX_HISTOGRAM_SPREAD * values.size:
+            return np.quantile(values, positions).astype(float).tolist()
+
+        low = values.min()
+        cumulative = np.cumsum(np.bincount(values - low))
+        ranks = (values.size - 1) * positions
+        lower_ranks = np.floor(ranks).astype(np.int64)
+        upper_ranks = np.ceil(ranks).astype(np.int64)
+        lower = np.searchsorted(cumulative, lower_ranks, side="right") + low
+        upper = np.searchsorted(cumulative, upper_ranks, side="right") + low
+        return (lower + (ranks - lower_ranks) * (upper - lower)).astype(float).tolist()
+
+    @STATS_COMPUTE_SECONDS.labels("histogram").time()
+    def calculate_histogram(self, values: "np.ndarray", bins: int) -> List[Dict]:
+        """
+        Counts the values falling into equal-width bins spanning their range.
+
+        Integer values are split into bins of a whole number of values, each covering ``start`` to ``end``
+        inclusive, and counted with one ``np.bincount`` call, so there may be fewer bins than requested when
+        the range is narrow. Other values use ``np.histogram``, whose bins include their start and exclude
+        their end, except the last one.
+
+        Args:
+            values (np.ndarray): The values to bin.
+            bins (int): The maximum number of bins.
+
+        Returns:
+            List[Dict]: The start, end and count of each bin, in increasing order.
+
+        Raises:
+            ValueError: If there are no values or the number of bins is not positive.
+        """
+        import numpy as np
+
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            raise ValueError("Data list is empty")
+        if bins < 1:
+            raise ValueError("The number of bins must be positive")
+
+        if values.dtype.kind not in "iu":
+            counts, edges = np.histogram(values, bins=bins)
+            return [
+                {"start": float(edges[i]), "end": float(edges[i + 1]), "count": int(counts[i])}
+                for i in range(len(counts))
+            ]
+
+        low, high = int(values.min()), int(values.max())
+        width = -(-(high - low + 1) // bins)
+        counts = np.bincount((values - low) // width)
+        return [
+            {"start": low + i * width, "end": min(low + (i + 1) * width - 1, high), "count": int(count)}
+            for i, count in enumerate(counts.tolist())
+        ]
+
     def calculate_growth_time_frequency(self, growth_times: List[int]) -> Dict[int, int]:
         """
         Calculates the frequency of growth times.
@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    In-memory cache with time-to-live expiry and least-recently-used eviction.
+
+    Entries expire ``ttl`` seconds after they are stored. Expired entries are no longer returned by ``get``
+    but are kept, so they can still be read with ``get_stale`` as a fallback, until they are replaced or
+    evicted. When the cache is full, the least recently used entry is evicted to make room for a new one.
+    The cache keeps hit, miss and eviction counters.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept in the cache.
+        ttl (float): Time-to-live for cached entries in seconds.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups not found in the cache or expired.
+        evictions (int): The number of entries evicted because the cache was full.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in the cache.
+            ttl (float): Time-to-live for cached entries in seconds.
+            timer (Callable[[], float]): Clock used to compute expiry times.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > self._timer()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Returns the cached value for a key and marks it as recently used.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Optional[Any]): The value returned when the key is missing or expired.
+
+        Returns:
+            Optional[Any]: The cached value, or ``default``.
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= self._timer():
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def get_stale(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """
+        Returns the cached value for a key even if it has expired.
+
+        The lookup does not update the counters or the recency of the entry.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Optional[Any]): The value returned when the key is missing.
+
+        Returns:
+            Optional[Any]: The cached value, or ``default``.
+        """
+        entry = self._data.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        if key in self._data:
+            self._data.move_to_end(key)
+        elif len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+        self._data[key] = (self._timer() + self.ttl, value)
+
+    def touch(self, key: Hashable) -> bool:
+        """
+        Restarts the time-to-live of an entry, fresh or expired, without replacing its value.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            bool: True if the entry exists, False otherwise.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+
+        self._data[key] = (self._timer() + self.ttl, entry[1])
+        self._data.move_to_end(key)
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache. The counters are kept.
+        """
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: The hits, misses, evictions and current size of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data)
+        }
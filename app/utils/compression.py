@@ -0,0 +1,40 @@
+import gzip
+from typing import Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+
+# Content codings this server can produce, most preferred first
+AVAILABLE_ENCODINGS: Tuple[str, ...] = ((BROTLI,) if brotli is not None else ()) + (GZIP, IDENTITY)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses a response body with a content coding.
+
+    The highest compression levels are used, since bodies are compressed once and then served many times.
+    Gzip output does not embed a timestamp, so the same body always compresses to the same bytes.
+
+    Args:
+        body (bytes): The uncompressed body.
+        encoding (str): The content coding: ``br``, ``gzip`` or ``identity``.
+
+    Returns:
+        bytes: The encoded body.
+
+    Raises:
+        ValueError: If the content coding is not available.
+    """
+    if encoding == IDENTITY:
+        return body
+    if encoding == GZIP:
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(body, quality=11)
+    raise ValueError(f"Unsupported content coding: {encoding}")
@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Sequence
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks whether an ``If-None-Match`` header matches an entity tag.
+
+    The comparison is weak, as required for ``If-None-Match``: the ``W/`` prefix is ignored on both
+    sides. A ``*`` matches any entity tag.
+
+    Args:
+        if_none_match (Optional[str]): The value of the ``If-None-Match`` request header.
+        etag (str): The entity tag of the current representation.
+
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Sequence[str]) -> str:
+    """
+    Chooses the content coding of a response from an ``Accept-Encoding`` header.
+
+    The coding with the highest quality value wins; ties are broken by the order of ``available``. A ``*``
+    gives its quality to every coding not listed, and a quality of 0 excludes a coding. ``identity`` is
+    acceptable unless it is explicitly excluded.
+
+    Args:
+        accept_encoding (Optional[str]): The value of the ``Accept-Encoding`` request header.
+        available (Sequence[str]): The codings the server can produce, most preferred first.
+
+    Returns:
+        str: The chosen coding, or ``identity`` if none of the others is acceptable.
+    """
+    if not accept_encoding:
+        return "identity"
+
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding.strip():
+            qualities[coding.strip().lower()] = quality
+
+    best, best_quality = "identity", 0.0
+    for coding in available:
+        if coding in qualities:
+            quality = qualities[coding]
+        elif "*" in qualities:
+            quality = qualities["*"]
+        else:
+            quality = 1.0 if coding == "identity" else 0.0
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
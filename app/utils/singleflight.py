@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single in-flight computation.
+
+    The first caller for a key starts the computation; every caller that arrives while it is still
+    running awaits the same task and receives the same result or the same exception. Once the task
+    finishes, the next call for that key starts a new computation.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty table of in-flight calls."""
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs ``fn`` for the given key, or joins the call already in flight for it.
+
+        A caller that is cancelled stops waiting, but the shared computation keeps running for the
+        other callers.
+
+        Args:
+            key (Hashable): The key identifying the computation.
+            fn (Callable[[], Awaitable[T]]): Factory for the computation to run.
+
+        Returns:
+            T: The result of the shared computation.
+
+        Raises:
+            Exception: Whatever exception the shared computation raised.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """
+        Removes a finished call and marks its exception as retrieved.
+
+        Args:
+            key (Hashable): The key of the finished computation.
+            task (asyncio.Task[Any]): The finished task.
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
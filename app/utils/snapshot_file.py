@@ -0,0 +1,138 @@
+import mmap
+import os
+import struct
+import tempfile
+from typing import NamedTuple, Optional, Tuple
+
+MAGIC = b"BERRYSNP"
+FORMAT_VERSION = 2
+
+# magic, format version, generation, built_at, number of sections
+_HEADER = struct.Struct("<8sHQdI")
+_SECTION_LENGTH = struct.Struct("<Q")
+
+
+class SnapshotFileContents(NamedTuple):
+    """
+    Contents of a snapshot file.
+
+    Attributes:
+        built_at (float): Unix timestamp of when the snapshot was built.
+        sections (Tuple[bytes, ...]): The payload sections, in the order they were written.
+        generation (int): The generation counter of the snapshot, increased by every publisher write.
+    """
+    built_at: float
+    sections: Tuple[bytes, ...]
+    generation: int = 0
+
+
+def write_snapshot_file(path: str, built_at: float, *sections: bytes, generation: int = 0) -> None:
+    """
+    Writes a versioned snapshot file atomically.
+
+    The file is written next to its destination and then renamed over it, so readers never see a
+    partially written snapshot.
+
+    Args:
+        path (str): The destination path.
+        built_at (float): Unix timestamp of when the snapshot was built.
+        *sections (bytes): The payload sections to store.
+        generation (int): The generation counter of the snapshot.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, generation, built_at, len(sections)))
+            for section in sections:
+                f.write(_SECTION_LENGTH.pack(len(section)))
+            for section in sections:
+                f.write(section)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot_file(path: str) -> Optional[SnapshotFileContents]:
+    """
+    Reads a snapshot file written by ``write_snapshot_file`` through a read-only memory map.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        Optional[SnapshotFileContents]: The snapshot contents, or None if the file does not exist,
+        was written with another format version, or is truncated.
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _parse(mapped)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def read_snapshot_generation(path: str) -> Optional[int]:
+    """
+    Reads only the generation counter of a snapshot file, to check cheaply whether it has changed.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        Optional[int]: The generation of the snapshot, or None if the file does not exist or was written
+        with another format version.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+    except FileNotFoundError:
+        return None
+
+    if len(header) < _HEADER.size:
+        return None
+    magic, version, generation, _, _ = _HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return generation
+
+
+def _parse(buffer: mmap.mmap) -> Optional[SnapshotFileContents]:
+    """
+    Parses the header and sections of a mapped snapshot file.
+
+    Args:
+        buffer (mmap.mmap): The mapped file.
+
+    Returns:
+        Optional[SnapshotFileContents]: The snapshot contents, or None if the file is not valid.
+    """
+    if len(buffer) < _HEADER.size:
+        return None
+
+    magic, version, generation, built_at, count = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+
+    offset = _HEADER.size
+    if len(buffer) < offset + count * _SECTION_LENGTH.size:
+        return None
+    lengths = [
+        _SECTION_LENGTH.unpack_from(buffer, offset + i * _SECTION_LENGTH.size)[0]
+        for i in range(count)
+    ]
+    offset += count * _SECTION_LENGTH.size
+    if len(buffer) != offset + sum(lengths):
+        return None
+
+    sections = []
+    for length in lengths:
+        sections.append(buffer[offset:offset + length])
+        offset += length
+    return SnapshotFileContents(built_at=built_at, sections=tuple(sections), generation=generation)
@@ -0,0 +1,276 @@
+"""
+Offline stand-in for the PokeAPI berry endpoints and the flavor, firmness and item resources they link to.
+
+Serves a deterministic berry catalog of configurable size, with configurable per-request latency and
+error rate, and counts every request it receives so benchmarks can report upstream call counts. Berry
+details carry an ``ETag`` and answer a matching ``If-None-Match`` with 304, like the real PokeAPI CDN.
+
+Run it as a server:
+
+    python -m bench.fake_pokeapi --port 9000 --berries 5000 --latency 0.05
+
+and point the API at it with ``POKEAPI_BASE_URL=http://127.0.0.1:9000/api/v2``.
+"""
+import argparse
+import asyncio
+import os
+import random
+from collections import Counter
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+
+FIRMNESSES = ["very-soft", "soft", "hard", "very-hard", "super-hard"]
+FLAVORS = ["spicy", "dry", "sweet", "bitter", "sour"]
+CONTEST_TYPES = ["cool", "beauty", "cute", "smart", "tough"]
+TYPES = ["fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground", "flying",
+         "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy"]
+GROWTH_TIMES = [2, 3, 4, 5, 6, 8, 12, 15, 18, 24]
+DEFAULT_PAGE_SIZE = 20
+
+
+class FakeCatalog:
+    """
+    Deterministic berry catalog.
+
+    Attributes:
+        base_url (str): The base URL used in the links of the payloads.
+        berries (List[Dict]): The berry detail payloads, in id order.
+        by_name (Dict[str, Dict]): The berry detail payloads by name.
+        linked (Dict[str, Dict[str, Dict]]): The berry-flavor, berry-firmness and item payloads by name.
+    """
+
+    def __init__(self, size: int, seed: int = 0, base_url: str = "http://127.0.0.1:9000/api/v2") -> None:
+        """
+        Generates the catalog.
+
+        Args:
+            size (int): The number of berries.
+            seed (int): Seed of the random generator used for the berry attributes.
+            base_url (str): The base URL used in the links of the payloads.
+        """
+        self.base_url = base_url
+        rng = random.Random(seed)  # nosec B311
+        self.berries: List[Dict] = [self._berry(berry_id, rng) for berry_id in range(1, size + 1)]
+        self.by_name: Dict[str, Dict] = {berry["name"]: berry for berry in self.berries}
+        self.linked: Dict[str, Dict[str, Dict]] = {
+            "berry-flavor": {
+                flavor: {
+                    "id": flavor_id,
+                    "name": flavor,
+                    "contest_type": self._link("contest-type", CONTEST_TYPES[flavor_id - 1]),
+                    "names": _names(flavor)
+                }
+                for flavor_id, flavor in enumerate(FLAVORS, start=1)
+            },
+            "berry-firmness": {
+                firmness: {"id": firmness_id, "name": firmness, "names": _names(firmness)}
+                for firmness_id, firmness in enumerate(FIRMNESSES, start=1)
+            },
+            "item": {
+                berry["item"]["name"]: {
+                    "id": 1000 + berry["id"],
+                    "name": berry["item"]["name"],
+                    "cost": rng.choice([20, 80, 200]),
+                    "names": _names(berry["item"]["name"])
+                }
+                for berry in self.berries
+            }
+        }
+
+    def _link(self, resource: str, name: str) -> Dict[str, str]:
+        return {"name": name, "url": f"{self.base_url}/{resource}/{name}/"}
+
+    def _berry(self, berry_id: int, rng: random.Random) -> Dict:
+        name = f"berry-{berry_id}"
+        return {
+            "id": berry_id,
+            "name": name,
+            "growth_time": rng.choice(GROWTH_TIMES),
+            "max_harvest": rng.choice([5, 10, 15]),
+            "natural_gift_power": rng.choice([60, 70, 80, 100]),
+            "size": rng.randint(20, 300),
+            "smoothness": rng.choice([20, 25, 30, 35, 40, 60]),
+            "soil_dryness": rng.choice([4, 6, 7, 8, 10, 15, 35]),
+            "firmness": self._link("berry-firmness", rng.choice(FIRMNESSES)),
+            "flavors": [
+                {"flavor": self._link("berry-flavor", flavor), "potency": rng.choice([0, 0, 10, 20, 30, 40])}
+                for flavor in FLAVORS
+            ],
+            "item": self._link("item", f"{name}-item"),
+            "natural_gift_type": self._link("type", rng.choice(TYPES))
+        }
+
+
+def _names(name: str) -> List[Dict]:
+    return [{"name": name.replace("-", " ").title(), "language": {"name": "en"}}]
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Labels a request path by resource, such as ``berry`` for the list and ``berry/{name}`` for details.
+
+    Args:
+        path (str): The request path.
+
+    Returns:
+        str: The endpoint label.
+    """
+    parts = path.strip("/").split("/")[2:]
+    if not parts:
+        return path
+    return parts[0] + ("/{name}" if len(parts) > 1 else "")
+
+
+def create_app(
+        catalog_size: int = 64,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        base_url: str = "http://127.0.0.1:9000/api/v2"
+) -> FastAPI:
+    """
+    Creates the fake PokeAPI application.
+
+    Args:
+        catalog_size (int): The number of berries in the catalog.
+        latency (float): Fixed delay added to every request, in seconds.
+        jitter (float): Extra random delay of up to this many seconds.
+        error_rate (float): Probability of answering a request with a 500 error.
+        seed (int): Seed of the catalog and of the latency and error generators.
+        base_url (str): The base URL used in the links of the payloads.
+
+    Returns:
+        FastAPI: The application. Its request counts are exposed at ``/__stats`` and reset with ``/__reset``.
+    """
+    app = FastAPI(title="Fake PokeAPI")
+    catalog = FakeCatalog(catalog_size, seed, base_url)
+    rng = random.Random(seed + 1)  # nosec B311
+    calls: Counter = Counter()
+    not_modified: Counter = Counter()
+
+    @app.middleware("http")
+    async def simulate_upstream(request: Request, call_next):
+        if request.url.path.startswith("/__"):
+            return await call_next(request)
+
+        calls[endpoint_label(request.url.path)] += 1
+        delay = latency + (rng.uniform(0, jitter) if jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse(status_code=500, content={"detail": "Injected failure"})
+        return await call_next(request)
+
+    @app.get("/api/v2/berry")
+    @app.get("/api/v2/berry/")
+    async def list_berries(offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Dict:
+        page = catalog.berries[offset:offset + limit]
+        next_offset = offset + limit
+        return {
+            "count": len(catalog.berries),
+            "next": (
+                f"{base_url}/berry?offset={next_offset}&limit={limit}"
+                if next_offset < len(catalog.berries) else None
+            ),
+            "previous": None,
+            "results": [
+                {"name": berry["name"], "url": f"{base_url}/berry/{berry['id']}/"} for berry in page
+            ]
+        }
+
+    @app.get("/api/v2/berry/{name}")
+    @app.get("/api/v2/berry/{name}/")
+    async def get_berry(name: str, request: Request):
+        berry = catalog.by_name.get(name)
+        if berry is None and name.isdigit() and 0 < int(name) <= len(catalog.berries):
+            berry = catalog.berries[int(name) - 1]
+        if berry is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+
+        etag = f'"{seed}-{berry["id"]}"'
+        if request.headers.get("if-none-match") == etag:
+            not_modified[endpoint_label(request.url.path)] += 1
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(berry, headers={"ETag": etag})
+
+    @app.get("/api/v2/{resource}/{name}")
+    @app.get("/api/v2/{resource}/{name}/")
+    async def get_linked(resource: str, name: str) -> Dict:
+        payload = catalog.linked.get(resource, {}).get(name)
+        if payload is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        return payload
+
+    @app.get("/__stats")
+    async def stats() -> Dict:
+        return {
+            "requests": sum(calls.values()),
+            "by_endpoint": dict(calls),
+            "not_modified": sum(not_modified.values())
+        }
+
+    @app.post("/__reset")
+    async def reset() -> Dict:
+        calls.clear()
+        not_modified.clear()
+        return {"requests": 0}
+
+    return app
+
+
+def app_from_env() -> FastAPI:
+    """
+    Creates the fake PokeAPI application from ``FAKE_POKEAPI_*`` environment variables.
+
+    Returns:
+        FastAPI: The application.
+    """
+    return create_app(
+        catalog_size=int(os.getenv("FAKE_POKEAPI_BERRIES", "64")),
+        latency=float(os.getenv("FAKE_POKEAPI_LATENCY", "0")),
+        jitter=float(os.getenv("FAKE_POKEAPI_JITTER", "0")),
+        error_rate=float(os.getenv("FAKE_POKEAPI_ERROR_RATE", "0")),
+        seed=int(os.getenv("FAKE_POKEAPI_SEED", "0")),
+        base_url=os.getenv("FAKE_POKEAPI_BASE_URL", "http://127.0.0.1:9000/api/v2")
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the fake PokeAPI with uvicorn.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Offline stand-in for the PokeAPI berry endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--berries", type=int, default=64, help="Number of berries in the catalog")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay per request in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 500 response")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    uvicorn.run(
+        create_app(
+            catalog_size=args.berries,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+            base_url=f"http://{args.host}:{args.port}/api/v2"
+        ),
+        host=args.host,
+        port=args.port,
+        log_level="warning"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Load generator for the Poke Berry Stats API.
+
+Drives an endpoint at a fixed concurrency and reports latency percentiles, throughput and the number of
+upstream PokeAPI calls made during the run, so cold and warm paths can be compared across commits.
+
+Against running servers (the API pointed at ``bench.fake_pokeapi``):
+
+    python -m bench.load --target http://127.0.0.1:8000 --upstream http://127.0.0.1:9000 \\
+        --concurrency 32 --requests 2000
+
+Fully in-process, with the fake PokeAPI mounted as the client transport:
+
+    python -m bench.load --in-process --berries 5000 --latency 0.05 --concurrency 32 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+
+@dataclass
+class LoadReport:
+    """
+    Results of a load run.
+
+    Attributes:
+        requests (int): The number of requests sent.
+        errors (int): The number of requests that failed or returned a 5xx status.
+        duration (float): The wall-clock duration of the run in seconds.
+        requests_per_second (float): The throughput of the run.
+        p50_ms (float): The median latency in milliseconds.
+        p95_ms (float): The 95th percentile latency in milliseconds.
+        p99_ms (float): The 99th percentile latency in milliseconds.
+        max_ms (float): The largest latency in milliseconds.
+        statuses (Dict[str, int]): The number of responses per status code.
+        upstream_calls (Optional[int]): The number of upstream PokeAPI calls made during the run, if known.
+    """
+    requests: int
+    errors: int
+    duration: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    statuses: Dict[str, int] = field(default_factory=dict)
+    upstream_calls: Optional[int] = None
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted values.
+
+    Args:
+        ordered (List[float]): The values, sorted in ascending order.
+        q (float): The percentile, between 0 and 1.
+
+    Returns:
+        float: The percentile, or 0 if there are no values.
+    """
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+async def run_load(client: httpx.AsyncClient, path: str, concurrency: int, total: int) -> LoadReport:
+    """
+    Sends ``total`` GET requests to ``path`` with ``concurrency`` requests in flight at a time.
+
+    Args:
+        client (httpx.AsyncClient): The client used to reach the API.
+        path (str): The path to request.
+        concurrency (int): The number of concurrent workers.
+        total (int): The number of requests to send.
+
+    Returns:
+        LoadReport: The results of the run, without upstream call counts.
+    """
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    errors = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                statuses[str(response.status_code)] += 1
+                if response.status_code >= 500:
+                    errors += 1
+            except httpx.HTTPError:
+                statuses["error"] += 1
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    duration = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return LoadReport(
+        requests=total,
+        errors=errors,
+        duration=duration,
+        requests_per_second=total / duration if duration else 0.0,
+        p50_ms=percentile(ordered, 0.50) * 1000,
+        p95_ms=percentile(ordered, 0.95) * 1000,
+        p99_ms=percentile(ordered, 0.99) * 1000,
+        max_ms=(ordered[-1] if ordered else 0.0) * 1000,
+        statuses=dict(statuses)
+    )
+
+
+async def upstream_requests(upstream: httpx.AsyncClient) -> int:
+    """
+    Reads the number of requests the fake PokeAPI has received.
+
+    Args:
+        upstream (httpx.AsyncClient): A client for the fake PokeAPI.
+
+    Returns:
+        int: The number of requests received so far.
+    """
+    response = await upstream.get("/__stats")
+    return response.json()["requests"]
+
+
+async def measure(
+        client: httpx.AsyncClient,
+        upstream: Optional[httpx.AsyncClient],
+        path: str,
+        concurrency: int,
+        total: int
+) -> Dict[str, LoadReport]:
+    """
+    Measures one cold request followed by a warm run at the given concurrency.
+
+    Args:
+        client (httpx.AsyncClient): The client used to reach the API.
+        upstream (Optional[httpx.AsyncClient]): A client for the fake PokeAPI, to count upstream calls.
+        path (str): The path to request.
+        concurrency (int): The number of concurrent workers of the warm run.
+        total (int): The number of requests of the warm run.
+
+    Returns:
+        Dict[str, LoadReport]: The reports of the cold request and of the warm run.
+    """
+    reports = {}
+    for phase, phase_concurrency, phase_total in (("cold", 1, 1), ("warm", concurrency, total)):
+        before = await upstream_requests(upstream) if upstream is not None else None
+        report = await run_load(client, path, phase_concurrency, phase_total)
+        if upstream is not None:
+            report.upstream_calls = await upstream_requests(upstream) - before
+        reports[phase] = report
+    return reports
+
+
+async def measure_in_process(args: argparse.Namespace) -> Dict[str, LoadReport]:
+    """
+    Measures the API in-process, with the fake PokeAPI mounted as the PokeAPI client transport.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        Dict[str, LoadReport]: The reports of the cold request and of the warm run.
+    """
+    from app.clients.poke_api import poke_api_client
+    from app.main import app
+    from app.services.snapshot_service import snapshot_service
+    from bench.fake_pokeapi import create_app
+
+    fake_base_url = "http://fake-pokeapi/api/v2"
+    fake = create_app(
+        catalog_size=args.berries,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        base_url=fake_base_url
+    )
+
+    await poke_api_client.aclose()
+    poke_api_client.base_url = fake_base_url
+    poke_api_client._transport = httpx.ASGITransport(app=fake)
+    if poke_api_client.cache is not None:
+        poke_api_client.cache.clear()
+    snapshot_service.clear()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://api") as client, \
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake-pokeapi") as upstream:
+        try:
+            return await measure(client, upstream, args.path, args.concurrency, args.requests)
+        finally:
+            await poke_api_client.aclose()
+
+
+async def measure_remote(args: argparse.Namespace) -> Dict[str, LoadReport]:
+    """
+    Measures an API running at ``--target``, counting upstream calls at ``--upstream`` if given.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        Dict[str, LoadReport]: The reports of the cold request and of the warm run.
+    """
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.target, limits=limits, timeout=60) as client:
+        if args.upstream is None:
+            return await measure(client, None, args.path, args.concurrency, args.requests)
+        async with httpx.AsyncClient(base_url=args.upstream) as upstream:
+            return await measure(client, upstream, args.path, args.concurrency, args.requests)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs a load test and prints the reports as JSON.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Load generator for the Poke Berry Stats API")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="Base URL of the API")
+    parser.add_argument("--upstream", default=None, help="Base URL of the fake PokeAPI, to count upstream calls")
+    parser.add_argument("--path", default="/v1/allBerryStats")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--in-process", action="store_true", help="Run the API and the fake PokeAPI in-process")
+    parser.add_argument("--berries", type=int, default=64, help="In-process: number of fake berries")
+    parser.add_argument("--latency", type=float, default=0.0, help="In-process: fake PokeAPI latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="In-process: fake PokeAPI jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="In-process: fake PokeAPI error rate")
+    args = parser.parse_args(argv)
+
+    reports = asyncio.run(measure_in_process(args) if args.in_process else measure_remote(args))
+    print(json.dumps({phase: asdict(report) for phase, report in reports.items()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import pytest_asyncio
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services.snapshot_service import snapshot_service
 
 
 @pytest.fixture(scope="session")
@@ -22,6 +23,14 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_snapshot():
+    """Drops the shared stats snapshot so every test starts cold."""
+    snapshot_service.clear()
+    yield
+    snapshot_service.clear()
+
+
 @pytest.fixture
 def client():
     """Client for testing the API"""
@@ -43,3 +52,54 @@ async def mock_berry_data():
             'pecha': {'growth_time': 3, 'name': 'pecha'}
         }
     }
+
+
+@pytest.fixture
+def mock_berry_stats():
+    """Mock statistics returned by the BerryService"""
+    return {
+        "berries_names": ["cheri", "chesto", "pecha"],
+        "min_growth_time": 3.0,
+        "median_growth_time": 3.0,
+        "max_growth_time": 3.0,
+        "variance_growth_time": 0.0,
+        "mean_growth_time": 3.0,
+        "frequency_growth_time": [{"growth_time": 3, "frequency": 3}]
+    }
+
+
+@pytest.fixture
+def mock_berry_records():
+    """Mock projected berry records"""
+    return [
+        {
+            'name': 'cheri', 'growth_time': 3, 'size': 20, 'smoothness': 25, 'soil_dryness': 15,
+            'max_harvest': 5, 'natural_gift_power': 60, 'firmness': 'soft', 'natural_gift_type': 'fire',
+            'item': 'cheri-berry', 'flavors': {'spicy': 10, 'dry': 0}
+        },
+        {
+            'name': 'chesto', 'growth_time': 3, 'size': 80, 'smoothness': 25, 'soil_dryness': 15,
+            'max_harvest': 5, 'natural_gift_power': 60, 'firmness': 'super-hard', 'natural_gift_type': 'water',
+            'item': 'chesto-berry', 'flavors': {'spicy': 0, 'dry': 10}
+        },
+        {
+            'name': 'pecha', 'growth_time': 3, 'size': 40, 'smoothness': 25, 'soil_dryness': 15,
+            'max_harvest': 5, 'natural_gift_power': 60, 'firmness': 'very-soft', 'natural_gift_type': 'electric',
+            'item': 'pecha-berry', 'flavors': {'spicy': 0, 'dry': 0}
+        },
+        {
+            'name': 'wiki', 'growth_time': 5, 'size': 115, 'smoothness': 20, 'soil_dryness': 10,
+            'max_harvest': 5, 'natural_gift_power': 60, 'firmness': 'hard', 'natural_gift_type': 'rock',
+            'item': 'wiki-berry', 'flavors': {'spicy': 0, 'dry': 15}
+        },
+        {
+            'name': 'rowap', 'growth_time': 24, 'size': 52, 'smoothness': 60, 'soil_dryness': 7,
+            'max_harvest': 5, 'natural_gift_power': 100, 'firmness': 'very-soft', 'natural_gift_type': 'dark',
+            'item': 'rowap-berry', 'flavors': {'spicy': 10, 'dry': 0}
+        },
+        {
+            'name': 'ganlon', 'growth_time': 24, 'size': 33, 'smoothness': 60, 'soil_dryness': 7,
+            'max_harvest': 5, 'natural_gift_power': 100, 'firmness': 'very-hard', 'natural_gift_type': 'ice',
+            'item': 'ganlon-berry', 'flavors': {'spicy': 0, 'dry': 30}
+        }
+    ]
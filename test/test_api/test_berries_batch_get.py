@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+from app.clients.poke_api import UpstreamResponse, poke_api_client
+from app.core.exceptions import PokeAPIException
+from app.utils.cache import TTLCache
+
+
+def test_batch_get_normalizes_deduplicates_and_reports_errors(client, mock_berry_data):
+    """
+    Test that names are normalized and deduplicated, each is fetched once and missing berries are reported
+    per item.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    async def get_berry_details(name):
+        if name == "unknown":
+            raise PokeAPIException("Error calling PokeAPI: Client error '404 Not Found' for url\nhttps://...", 404)
+        return mock_berry_data['berry_details'][name]
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_berry_details', side_effect=get_berry_details) as mock:
+        response = client.post("/v1/berries:batchGet", json={"names": ["Cheri", " cheri ", "unknown", "pecha"]})
+
+    assert response.status_code == 200
+    berries = response.json()["berries"]
+    assert [item["name"] for item in berries] == ["cheri", "unknown", "pecha"]
+    assert berries[0]["berry"]["growth_time"] == 3
+    assert berries[0]["error"] is None
+    assert berries[0]["status"] is None
+    assert berries[1] == {"name": "unknown", "berry": None, "error": "Berry unknown not found", "status": 404}
+    assert sorted(call.args[0] for call in mock.call_args_list) == ["cheri", "pecha", "unknown"]
+
+
+def test_batch_get_rejects_invalid_names_without_fetching(client):
+    """
+    Test that names that are not PokeAPI slugs are reported per item and never reach the PokeAPI.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    names = ["berry-2/../berry-3", "berry-1?x=1", "../berry"]
+    with patch('app.clients.poke_api.PokeAPIClient.get_berry_details') as mock:
+        response = client.post("/v1/berries:batchGet", json={"names": names})
+
+    assert response.status_code == 200
+    berries = response.json()["berries"]
+    assert [item["status"] for item in berries] == [400, 400, 400]
+    assert berries[0]["error"] == "Invalid berry name: berry-2/../berry-3"
+    assert mock.call_count == 0
+
+
+def test_batch_get_reports_upstream_failures_and_bad_payloads_per_item(client, mock_berry_data):
+    """
+    Test that a PokeAPI failure and a payload that cannot be projected fail only their own item.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    async def get_berry_details(name):
+        if name == "oran":
+            raise PokeAPIException("Error calling PokeAPI: 503\nhttps://pokeapi.co/api/v2/berry/oran", 503)
+        if name == "pecha":
+            return {"flavors": [{"potency": 10}]}
+        return mock_berry_data['berry_details'][name]
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_berry_details', side_effect=get_berry_details):
+        response = client.post("/v1/berries:batchGet", json={"names": ["cheri", "oran", "pecha"]})
+
+    assert response.status_code == 200
+    berries = response.json()["berries"]
+    assert berries[0]["berry"]["name"] == "cheri"
+    assert berries[1] == {"name": "oran", "berry": None, "error": "Error fetching berry oran", "status": 502}
+    assert berries[2] == {
+        "name": "pecha", "berry": None, "error": "Unexpected PokeAPI payload for berry pecha", "status": 502
+    }
+
+
+def test_batch_get_serves_cached_berries_without_fetching(client):
+    """
+    Test that berries with a fresh cache entry are not fetched again.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    cache = TTLCache(maxsize=8, ttl=60)
+    with patch.object(poke_api_client, 'cache', cache):
+        cache.set("berry/cheri", UpstreamResponse({"name": "cheri", "growth_time": 3}))
+
+        with patch('app.clients.poke_api.PokeAPIClient.get_berry_details') as mock:
+            response = client.post("/v1/berries:batchGet", json={"names": ["cheri"]})
+
+    assert response.status_code == 200
+    assert response.json()["berries"][0]["berry"]["name"] == "cheri"
+    assert mock.call_count == 0
+
+
+def test_batch_get_rejects_empty_and_oversized_batches(client):
+    """
+    Test that an empty batch and a batch above the size limit are rejected.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    assert client.post("/v1/berries:batchGet", json={"names": []}).status_code == 422
+    assert client.post("/v1/berries:batchGet", json={"names": ["cheri"] * 1000}).status_code == 422
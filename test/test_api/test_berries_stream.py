@@ -0,0 +1,95 @@
+import json
+from unittest.mock import patch
+
+from app.core.exceptions import PokeAPIException
+
+
+def test_stream_berries_emits_records_then_stats(client, mock_berry_data):
+    """
+    Test that the stream has one line per berry, an error line per failed berry and the statistics last.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    async def get_berry_details(name):
+        if name == "pecha":
+            raise PokeAPIException("Error fetching berry pecha")
+        return mock_berry_data['berry_details'][name]
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        with patch('app.clients.poke_api.PokeAPIClient.get_berry_details', side_effect=get_berry_details):
+            mock_get_berries.return_value = mock_berry_data['berries']
+
+            response = client.get("/v1/berries/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    berries = [line for line in lines if line["type"] == "berry"]
+    assert sorted(berry["name"] for berry in berries) == ["cheri", "chesto"]
+    assert all(berry["growth_time"] == 3 for berry in berries)
+    assert [line for line in lines if line["type"] == "error"] == [
+        {"type": "error", "name": "pecha", "error": "Error fetching berry pecha"}
+    ]
+
+    stats = lines[-1]
+    assert stats["type"] == "stats"
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["mean_growth_time"] == 3.0
+    assert stats["frequency_growth_time"] == [{"growth_time": 3, "frequency": 2}]
+
+
+def test_stream_berries_reports_unexpected_payloads_and_finishes(client, mock_berry_data):
+    """
+    Test that a berry whose payload cannot be projected gets an error line and the stream still ends with
+    the statistics.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    async def get_berry_details(name):
+        if name == "pecha":
+            return {"flavors": [{"potency": 10}]}
+        return mock_berry_data['berry_details'][name]
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        with patch('app.clients.poke_api.PokeAPIClient.get_berry_details', side_effect=get_berry_details):
+            mock_get_berries.return_value = mock_berry_data['berries']
+
+            response = client.get("/v1/berries/stream")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line for line in lines if line["type"] == "error"] == [
+        {"type": "error", "name": "pecha", "error": "Unexpected PokeAPI payload for berry pecha"}
+    ]
+    assert lines[-1]["type"] == "stats"
+    assert (lines[-1]["count"], lines[-1]["errors"]) == (2, 1)
+
+
+def test_stream_berries_list_error(client):
+    """
+    Test that a failure to list the berries is reported with a 500 status before streaming starts.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        mock_get_berries.side_effect = PokeAPIException("PokeAPI is unavailable")
+
+        response = client.get("/v1/berries/stream")
+
+    assert response.status_code == 500
+    assert "PokeAPI is unavailable" in response.json()["error"]
@@ -0,0 +1,182 @@
+from unittest.mock import patch
+
+from app.services.berry_service import berry_service
+
+
+def test_get_berry_field_stats_success(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that the statistics of several berry fields are returned in one response.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch.object(berry_service, 'berries', mock_berry_records):
+            response = client.get("/v1/berryStats", params={"fields": "growth_time,size"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 6
+    assert set(data["fields"]) == {"growth_time", "size"}
+    assert data["fields"]["growth_time"]["median"] == 4.0
+    assert data["fields"]["size"]["max"] == 115.0
+    assert data["fields"]["growth_time"]["frequency"] == [
+        {"value": 3, "frequency": 3},
+        {"value": 5, "frequency": 1},
+        {"value": 24, "frequency": 2}
+    ]
+
+
+def test_get_berry_field_stats_invalid_field(client):
+    """
+    Test that an unknown field is rejected with a 400 response.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    response = client.get("/v1/berryStats", params={"fields": "growth_time,color"})
+
+    assert response.status_code == 400
+    assert "color" in response.json()["error"]
+
+
+def test_get_berry_field_stats_with_filters(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that filters restrict the berries the statistics are calculated from.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch.object(berry_service, 'berries', mock_berry_records):
+            response = client.get(
+                "/v1/berryStats",
+                params={"fields": "size", "filter": ["firmness!=soft", "growth_time<24"]}
+            )
+            no_match = client.get("/v1/berryStats", params={"filter": "growth_time>100"})
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 3
+    assert response.json()["fields"]["size"]["min"] == 40.0
+    assert no_match.status_code == 404
+
+
+def test_get_berry_group_stats_success(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that growth time statistics are returned for each firmness.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch.object(berry_service, 'berries', mock_berry_records):
+            response = client.get("/v1/berryStats/groupBy/firmness")
+
+    assert response.status_code == 200
+    groups = {group["group"]: group for group in response.json()["groups"]}
+    assert set(groups) == {"hard", "soft", "super-hard", "very-hard", "very-soft"}
+    assert groups["very-soft"]["berries_names"] == ["pecha", "rowap"]
+    assert groups["very-soft"]["median_growth_time"] == 13.5
+
+
+def test_get_berry_group_stats_gzip(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that grouped statistics are served gzip-compressed when the client accepts it.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch.object(berry_service, 'berries', mock_berry_records):
+            plain = client.get("/v1/berryStats/groupBy/firmness", headers={"Accept-Encoding": "identity"})
+            gzipped = client.get("/v1/berryStats/groupBy/firmness", headers={"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.json() == plain.json()
+
+
+def test_get_berry_group_stats_invalid_dimension(client):
+    """
+    Test that an unknown dimension is rejected with a 400 response.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    response = client.get("/v1/berryStats/groupBy/color")
+
+    assert response.status_code == 400
+
+
+def test_get_berry_field_stats_quantiles_and_histogram(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that requested quantiles, the interquartile range and histogram bins are returned for every field.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch.object(berry_service, 'berries', mock_berry_records):
+            response = client.get(
+                "/v1/berryStats", params={"fields": "growth_time", "quantiles": "p10,0.9,iqr", "bins": 2}
+            )
+
+    assert response.status_code == 200
+    growth_time = response.json()["fields"]["growth_time"]
+    assert growth_time["quantiles"] == {"p10": 3.0, "p90": 24.0}
+    assert growth_time["iqr"] == 16.25
+    assert growth_time["histogram"] == [
+        {"start": 3.0, "end": 13.0, "count": 4},
+        {"start": 14.0, "end": 24.0, "count": 2}
+    ]
+
+
+def test_get_berry_field_stats_invalid_quantile(client):
+    """
+    Test that a quantile outside of 0 to 100 percent is rejected with a 400 response.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    response = client.get("/v1/berryStats", params={"quantiles": "p150"})
+
+    assert response.status_code == 400
+    assert "p150" in response.json()["error"]
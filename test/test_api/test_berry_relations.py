@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from app.services.berry_service import berry_service
+from app.services.relation_service import CrawlResult, relation_service
+
+RESOURCES = {
+    "berry-flavor/spicy": {"name": "spicy", "contest_type": {"name": "cool"},
+                           "names": [{"name": "Spicy", "language": {"name": "en"}}]},
+    "berry-firmness/very-soft": {"name": "very-soft", "names": [{"name": "Very Soft", "language": {"name": "en"}}]},
+    "item/pecha-berry": {"name": "pecha-berry", "cost": 80},
+    "item/rowap-berry": {"name": "rowap-berry", "cost": 200}
+}
+
+
+def test_get_berry_flavor_and_firmness_stats(client, mock_berry_stats, mock_berry_records):
+    """
+    Test that the flavor and firmness aggregates share one crawl of the linked resources per snapshot and
+    report the upstream calls deduplication saved.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+        mock_berry_records: Mock projected berry records.
+
+    Returns:
+        None
+    """
+    crawl = CrawlResult(RESOURCES, references=24, fetched=14, errors=0)
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats, \
+            patch.object(berry_service, 'berries', mock_berry_records), \
+            patch.object(relation_service, 'crawl', return_value=crawl) as mock_crawl:
+        mock_stats.return_value = mock_berry_stats
+        flavors = client.get("/v1/berryStats/flavors")
+        firmness = client.get("/v1/berryStats/firmness")
+
+    assert flavors.status_code == firmness.status_code == 200
+    assert mock_crawl.await_count == 1
+    assert flavors.json()["crawl"] == {"references": 24, "fetched": 14, "saved": 10, "errors": 0}
+    spicy = next(flavor for flavor in flavors.json()["flavors"] if flavor["flavor"] == "spicy")
+    assert spicy["contest_type"] == "cool"
+    assert (spicy["berries"], spicy["min_potency"], spicy["max_potency"]) == (2, 10.0, 10.0)
+    very_soft = next(group for group in firmness.json()["firmness"] if group["firmness"] == "very-soft")
+    assert very_soft["display_name"] == "Very Soft"
+    assert very_soft["berries_names"] == ["pecha", "rowap"]
+    assert (very_soft["min_item_cost"], very_soft["max_item_cost"]) == (80.0, 200.0)
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+from app.api.v1.endpoints.berry_stats import encode_model
+from app.utils.compression import compress
 from app.core.exceptions import ServiceError
 
 
@@ -63,3 +65,105 @@ def test_get_berry_stats_error(client):
 
         assert response.status_code == 500
         assert response.json()["error"] == "Error test"
+
+
+def test_get_berry_stats_reports_snapshot_age(client, mock_berry_stats):
+    """
+    Test that the endpoint reports the age of the snapshot it served.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+
+        client.get("/v1/allBerryStats")
+        response = client.get("/v1/allBerryStats")
+
+        assert response.status_code == 200
+        assert response.headers["X-Snapshot-Age"] == "0"
+        assert mock_stats.call_count == 1
+
+
+def test_get_berry_stats_conditional_request(client, mock_berry_stats):
+    """
+    Test that a request with the current ETag in If-None-Match gets an empty 304 response.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+
+        response = client.get("/v1/allBerryStats")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+        not_modified = client.get("/v1/allBerryStats", headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == etag
+
+
+def test_get_berry_stats_encodes_body_once_per_snapshot(client, mock_berry_stats):
+    """
+    Test that the response body is validated and encoded once and then reused.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch(
+                'app.api.v1.endpoints.berry_stats.encode_model',
+                wraps=encode_model
+        ) as mock_encode:
+            first = client.get("/v1/allBerryStats")
+            second = client.get("/v1/allBerryStats")
+
+            assert first.content == second.content
+            assert first.json()["frequency_growth_time"] == [{"growth_time": 3, "frequency": 3}]
+            assert mock_encode.call_count == 1
+
+
+def test_get_berry_stats_compresses_once_per_snapshot(client, mock_berry_stats):
+    """
+    Test that gzip and brotli variants are negotiated from Accept-Encoding, have their own ETag and are
+    compressed once per snapshot.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_stats: Mock berry statistics returned by the BerryService.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = mock_berry_stats
+        with patch('app.api.v1.endpoints.berry_stats.compress', wraps=compress) as mock_compress:
+            identity = client.get("/v1/allBerryStats", headers={"Accept-Encoding": "identity"})
+            gzipped = client.get("/v1/allBerryStats", headers={"Accept-Encoding": "gzip"})
+            client.get("/v1/allBerryStats", headers={"Accept-Encoding": "gzip"})
+            preferred = client.get("/v1/allBerryStats", headers={"Accept-Encoding": "gzip;q=0.5, br"})
+
+            assert mock_compress.call_count == 2
+
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert preferred.headers["Content-Encoding"] == "br"
+    assert identity.headers["Vary"] == gzipped.headers["Vary"] == "Accept-Encoding"
+    assert gzipped.json() == preferred.json() == identity.json()
+    assert len({identity.headers["ETag"], gzipped.headers["ETag"], preferred.headers["ETag"]}) == 3
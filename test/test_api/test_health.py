@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+from app.services.snapshot_service import snapshot_service
+
+STATS = {
+    "berries_names": ["cheri"],
+    "min_growth_time": 3.0,
+    "median_growth_time": 3.0,
+    "max_growth_time": 3.0,
+    "variance_growth_time": 0.0,
+    "mean_growth_time": 3.0,
+    "frequency_growth_time": [{"growth_time": 3, "frequency": 1}]
+}
+
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def test_ready_reports_warming_until_snapshot_is_built(client):
+    """
+    Test that /ready returns 503 until the stats snapshot exists, while /health is always healthy.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    assert client.get("/health").status_code == 200
+
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming"
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        client.get("/v1/allBerryStats")
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["generation"] == snapshot_service.generation
+
+
+def test_import_stays_within_budget_and_defers_numpy():
+    """
+    Test that importing the application is fast enough for a cold start and does not load NumPy.
+
+    Returns:
+        None
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import app.main\n"
+        "print(time.perf_counter() - start, 'numpy' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    seconds, numpy_loaded = output.split()
+
+    assert numpy_loaded == "False"
+    assert float(seconds) < IMPORT_BUDGET_SECONDS
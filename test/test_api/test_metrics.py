@@ -0,0 +1,74 @@
+import httpx
+import pytest
+
+from app.clients.poke_api import PokeAPIClient
+from app.core.metrics import endpoint_label, registry
+from app.utils.cache import TTLCache
+
+
+def sample(name: str, labels: dict) -> float:
+    """Returns the current value of a metric sample, or 0 if it has not been recorded yet."""
+    return registry.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_exposes_request_latency_by_route(client):
+    """
+    Test that /metrics is in Prometheus text format and labels API requests by route template.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    labels = {"method": "GET", "route": "/v1/berryStats/groupBy/{dimension}", "status": "400"}
+    before = sample("http_request_duration_seconds_count", labels)
+
+    client.get("/v1/berryStats/groupBy/color")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "pokeapi_request_duration_seconds" in response.text
+    assert "cache_hits_total" in response.text
+    assert sample("http_request_duration_seconds_count", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_make_request_records_latency_by_endpoint_and_status():
+    """
+    Test that PokeAPI calls are timed with a templated endpoint and their outcome.
+
+    Returns:
+        None
+    """
+    client = PokeAPIClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 1})))
+    client.base_url = "https://pokeapi.test/api/v2"
+    client.cache = TTLCache(maxsize=8, ttl=60)
+    ok = {"endpoint": "berry/{name}", "status": "ok"}
+    hit = {"endpoint": "berry/{name}", "status": "cache_hit"}
+    ok_before = sample("pokeapi_request_duration_seconds_count", ok)
+    hit_before = sample("pokeapi_request_duration_seconds_count", hit)
+
+    await client.get_berry_details("cheri")
+    await client.get_berry_details("cheri")
+    await client.aclose()
+
+    assert sample("pokeapi_request_duration_seconds_count", ok) == ok_before + 1
+    assert sample("pokeapi_request_duration_seconds_count", hit) == hit_before + 1
+    assert sample("pokeapi_requests_in_flight", {}) == 0
+
+
+def test_endpoint_label():
+    """
+    Test that PokeAPI endpoints are turned into low-cardinality labels.
+
+    Returns:
+        None
+    """
+    assert endpoint_label("berry/cheri") == "berry/{name}"
+    assert endpoint_label("berry?offset=0&limit=100") == "berry"
+    assert endpoint_label("berry-flavor/spicy/") == "berry-flavor/{name}"
+    assert endpoint_label("pokemon/1/encounters") == "pokemon/{name}"
+    assert endpoint_label("junk-a/x") == "other"
+    assert endpoint_label("junk-b?offset=0&limit=100") == "other"
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from app.api.responses import ResourceStatsResponse
+from app.services.resource_stats_service import resource_stats_service
+
+
+def test_get_resource_field_stats_success(client):
+    """
+    Test that the statistics of a field of any PokeAPI resource are returned.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    example = ResourceStatsResponse.Config.json_schema_extra["example"]
+    with patch.object(resource_stats_service, 'get_field_stats', return_value=example) as mock_stats:
+        response = client.get("/v1/stats/pokemon/base_experience")
+
+    assert response.status_code == 200
+    assert response.json()["entries"] == 1302
+    mock_stats.assert_awaited_once_with("pokemon", "base_experience")
+
+
+def test_get_resource_field_stats_invalid_resource(client):
+    """
+    Test that a malformed resource name is rejected with a 400 response before calling the PokeAPI.
+
+    Args:
+        client: The test client used to make requests to the API.
+
+    Returns:
+        None
+    """
+    response = client.get("/v1/stats/Pokemon_1/base_experience")
+
+    assert response.status_code == 400
+    assert "Pokemon_1" in response.json()["error"]
@@ -0,0 +1,97 @@
+import time
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import ProfilingMiddleware, SamplingProfiler
+from app.core.timing import format_server_timing
+
+
+def test_server_timing_reports_phases_of_a_cold_request(client, mock_berry_data):
+    """
+    Test that a request that builds the snapshot reports the listing, detail, compute and serialization
+    phases in its Server-Timing header.
+
+    Args:
+        client: The test client used to make requests to the API.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        with patch('app.clients.poke_api.PokeAPIClient.get_berries_details') as mock_get_details:
+            mock_get_berries.return_value = mock_berry_data['berries']
+            mock_get_details.return_value = list(mock_berry_data['berry_details'].values())
+
+            response = client.get("/v1/allBerryStats")
+
+    assert response.status_code == 200
+    phases = [metric.split(";")[0] for metric in response.headers["server-timing"].split(", ")]
+    for phase in ("snapshot", "list", "details", "project", "compute", "serialize", "total"):
+        assert phase in phases
+
+
+def test_format_server_timing():
+    """
+    Test that spans are formatted in milliseconds, with a call count for repeated spans.
+
+    Returns:
+        None
+    """
+    header = format_server_timing({"list": [0.0125, 1], "pokeapi": [0.5, 3]}, 0.6)
+
+    assert header == 'list;dur=12.50, pokeapi;dur=500.00;desc="3 calls", total;dur=600.00'
+
+
+def test_sampling_profiler_collects_stacks():
+    """
+    Test that the profiler samples the stack of the profiled thread.
+
+    Returns:
+        None
+    """
+    def busy_wait():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+    profiler = SamplingProfiler(interval=0.001).start()
+    busy_wait()
+    profiler.stop()
+
+    assert sum(profiler.samples.values()) > 0
+    assert "busy_wait" in profiler.collapsed()
+
+
+def test_profiling_middleware_writes_profile_on_request(tmp_path):
+    """
+    Test that only requests sent with an X-Profile header are profiled and that the profile is written
+    to the configured directory.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path), interval=0.001)
+
+    @app.get("/slow")
+    async def slow():
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            pass
+        return {}
+
+    test_client = TestClient(app)
+    assert "x-profile-file" not in test_client.get("/slow").headers
+    assert list(tmp_path.iterdir()) == []
+
+    response = test_client.get("/slow", headers={"X-Profile": "1"})
+
+    profile = tmp_path / response.headers["x-profile-file"]
+    assert profile.exists()
+    assert profile.read_text().strip()
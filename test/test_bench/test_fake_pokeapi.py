@@ -0,0 +1,94 @@
+import httpx
+import pytest
+
+from app.clients.poke_api import PokeAPIClient
+from bench.fake_pokeapi import create_app, endpoint_label
+from bench.load import percentile, run_load
+
+FAKE_BASE_URL = "http://fake/api/v2"
+
+
+def build_client(fake) -> PokeAPIClient:
+    """Builds a PokeAPIClient whose requests are answered by the fake PokeAPI."""
+    client = PokeAPIClient(transport=httpx.ASGITransport(app=fake))
+    client.base_url = FAKE_BASE_URL
+    client.cache = None
+    client.hedge_enabled = False
+    return client
+
+
+@pytest.mark.asyncio
+async def test_client_crawls_fake_catalog():
+    """
+    Test that the PokeAPI client lists and fetches every berry of the fake catalog, and that the fake
+    counts the upstream calls.
+
+    Returns:
+        None
+    """
+    fake = create_app(catalog_size=150, base_url=FAKE_BASE_URL)
+    client = build_client(fake)
+    try:
+        berries = await client.get_all_berries()
+        details = await client.get_berries_details([berry["name"] for berry in berries])
+    finally:
+        await client.aclose()
+
+    assert len(berries) == 150
+    assert [detail["name"] for detail in details] == [f"berry-{i}" for i in range(1, 151)]
+    assert all(detail["firmness"]["name"] for detail in details)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake") as upstream:
+        stats = (await upstream.get("/__stats")).json()
+        assert stats["by_endpoint"]["berry/{name}"] == 150
+        assert stats["by_endpoint"]["berry"] == 150 // client.page_size + 1
+        assert (await upstream.post("/__reset")).json() == {"requests": 0}
+        assert (await upstream.get("/__stats")).json()["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fake_injects_errors():
+    """
+    Test that the fake answers with 500 errors at the configured error rate.
+
+    Returns:
+        None
+    """
+    fake = create_app(catalog_size=4, error_rate=1.0)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake") as upstream:
+        response = await upstream.get("/api/v2/berry/berry-1")
+
+    assert response.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_run_load_reports_latency_and_statuses():
+    """
+    Test that the load generator sends the requested number of requests and reports their outcome.
+
+    Returns:
+        None
+    """
+    fake = create_app(catalog_size=4)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake") as client:
+        report = await run_load(client, "/api/v2/berry/berry-1", concurrency=4, total=20)
+
+    assert report.requests == 20
+    assert report.errors == 0
+    assert report.statuses == {"200": 20}
+    assert 0 < report.p50_ms <= report.p95_ms <= report.p99_ms <= report.max_ms
+
+
+def test_percentile_and_endpoint_label():
+    """
+    Test the nearest-rank percentile and the endpoint labels used in upstream call counts.
+
+    Returns:
+        None
+    """
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) == 0
+    assert endpoint_label("/api/v2/berry") == "berry"
+    assert endpoint_label("/api/v2/berry/cheri/") == "berry/{name}"
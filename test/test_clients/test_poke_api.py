@@ -0,0 +1,318 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.poke_api import PokeAPIClient
+from app.core.exceptions import PokeAPIException
+from app.utils.cache import TTLCache
+
+
+def build_client(handler, max_concurrency: int = 4) -> PokeAPIClient:
+    """Builds a PokeAPIClient whose requests are answered by the given handler."""
+    client = PokeAPIClient(transport=httpx.MockTransport(handler))
+    client.base_url = "https://pokeapi.test/api/v2"
+    client.max_concurrency = max_concurrency
+    client.backoff_base = 0
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_all_berries_fetches_remaining_pages_by_offset():
+    """
+    Test that the client reads the count from the first page and requests the other pages by offset.
+
+    Returns:
+        None
+    """
+    names = [f"berry-{i}" for i in range(5)]
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        requested.append(offset)
+        return httpx.Response(200, json={
+            "count": len(names),
+            "next": None,
+            "results": [{"name": name} for name in names[offset:offset + limit]]
+        })
+
+    client = build_client(handler)
+    client.page_size = 2
+    berries = await client.get_all_berries()
+    await client.aclose()
+
+    assert [berry["name"] for berry in berries] == names
+    assert sorted(requested) == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_get_berries_details_is_concurrent_and_bounded():
+    """
+    Test that detail requests run concurrently, never exceed the configured cap and keep their order.
+
+    Returns:
+        None
+    """
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        name = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"name": name, "growth_time": 3})
+
+    names = [f"berry-{i}" for i in range(10)]
+    client = build_client(handler, max_concurrency=3)
+    details = await client.get_berries_details(names)
+    await client.aclose()
+
+    assert [detail["name"] for detail in details] == names
+    assert 1 < peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_get_berry_details_http_error():
+    """
+    Test that an upstream HTTP error is raised as a PokeAPIException.
+
+    Returns:
+        None
+    """
+    client = build_client(lambda request: httpx.Response(404, json={}))
+
+    with pytest.raises(PokeAPIException):
+        await client.get_berry_details("missing")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_make_request_serves_repeated_calls_from_cache():
+    """
+    Test that a repeated request for the same berry is served from the cache.
+
+    Returns:
+        None
+    """
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"name": "cheri", "growth_time": 3})
+
+    client = build_client(handler)
+    client.cache = TTLCache(maxsize=8, ttl=60)
+
+    first = await client.get_berry_details("cheri")
+    second = await client.get_berry_details(" Cheri ")
+    await client.aclose()
+
+    assert first == second
+    assert calls == 1
+    assert client.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_make_request_retries_transient_errors():
+    """
+    Test that 5xx responses are retried and 4xx responses are not.
+
+    Returns:
+        None
+    """
+    calls = {"cheri": 0, "missing": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        calls[name] += 1
+        if name == "missing":
+            return httpx.Response(404, json={})
+        if calls[name] < 3:
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json={"name": name, "growth_time": 3})
+
+    client = build_client(handler)
+    client.retries = 2
+
+    detail = await client.get_berry_details("cheri")
+    with pytest.raises(PokeAPIException):
+        await client.get_berry_details("missing")
+    await client.aclose()
+
+    assert detail["name"] == "cheri"
+    assert calls == {"cheri": 3, "missing": 1}
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_and_serves_stale_data():
+    """
+    Test that an open circuit breaker skips the PokeAPI and serves stale cached data when available.
+
+    Returns:
+        None
+    """
+    calls = 0
+    healthy = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if healthy:
+            return httpx.Response(200, json={"name": "cheri", "growth_time": 3})
+        return httpx.Response(503, json={})
+
+    client = build_client(handler)
+    client.retries = 0
+    client.cache = TTLCache(maxsize=8, ttl=0)
+    client.breaker.failure_threshold = 1
+
+    await client.get_berry_details("cheri")
+    healthy = False
+
+    stale = await client.get_berry_details("cheri")
+    assert stale["name"] == "cheri"
+    assert client.breaker.state == "open"
+
+    calls_before = calls
+    assert (await client.get_berry_details("cheri"))["name"] == "cheri"
+    with pytest.raises(PokeAPIException):
+        await client.get_berry_details("chesto")
+    await client.aclose()
+
+    assert calls == calls_before
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_request_releases_half_open_breaker():
+    """
+    Test that cancelling the trial request of a half-open breaker lets the next request become the trial,
+    instead of leaving the breaker half-open and failing every later request.
+
+    Returns:
+        None
+    """
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/slow"):
+            started.set()
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"name": "cheri"})
+
+    client = build_client(handler)
+    client.hedge_enabled = False
+    client.breaker.failure_threshold = 1
+    client.breaker.reset_timeout = 0
+    client.breaker.record_failure()
+
+    trial = asyncio.create_task(client.get_berry_details("slow"))
+    await started.wait()
+    assert client.breaker.state == "half_open"
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    assert client.breaker.state == "open"
+    assert (await client.get_berry_details("cheri"))["name"] == "cheri"
+    assert client.breaker.state == "closed"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    """
+    Test that a request slower than the hedging threshold is duplicated and the fast response wins.
+
+    Returns:
+        None
+    """
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"name": "cheri", "growth_time": 3})
+
+    client = build_client(handler)
+    client.cache = None
+    client.latency.min_samples = 1
+    client.latency.record(0.01)
+
+    started = asyncio.get_running_loop().time()
+    detail = await client.get_berry_details("cheri")
+    elapsed = asyncio.get_running_loop().time() - started
+    await client.aclose()
+
+    assert detail["name"] == "cheri"
+    assert attempts == 2
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_validators():
+    """
+    Test that an expired cache entry is refreshed with a conditional request and that a 304 answer
+    extends the entry without a new body.
+
+    Returns:
+        None
+    """
+    conditional_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        conditional_headers.append(
+            (request.headers.get("if-none-match"), request.headers.get("if-modified-since"))
+        )
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={"name": "cheri", "growth_time": 3},
+            headers={"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        )
+
+    client = build_client(handler)
+    client.cache = TTLCache(maxsize=8, ttl=0)
+
+    first = await client.get_berry_details("cheri")
+    second = await client.get_berry_details("cheri")
+    await client.aclose()
+
+    assert first == second == {"name": "cheri", "growth_time": 3}
+    assert conditional_headers == [(None, None), ('"v1"', "Tue, 01 Oct 2024 00:00:00 GMT")]
+    assert client.cache.get_stale("berry/cheri").data is first
+
+
+@pytest.mark.asyncio
+async def test_iter_berries_details_yields_in_completion_order():
+    """
+    Test that berry details are yielded as soon as they arrive and failures are yielded as errors.
+
+    Returns:
+        None
+    """
+    async def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        if name == "missing":
+            return httpx.Response(404, json={})
+        if name == "cheri":
+            await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"name": name, "growth_time": 3})
+
+    client = build_client(handler)
+    client.cache = None
+
+    results = [item async for item in client.iter_berries_details(["cheri", "chesto", "missing"])]
+    await client.aclose()
+
+    assert [name for name, _ in results][-1] == "cheri"
+    errors = {name: result for name, result in results if isinstance(result, PokeAPIException)}
+    assert list(errors) == ["missing"]
@@ -0,0 +1,101 @@
+from app.clients.resilience import CircuitBreaker, LatencyTracker, backoff_delay
+
+
+class FakeTimer:
+    """Manually advanced clock for circuit breaker tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """
+    Test that the breaker opens after repeated failures and closes after a successful trial call.
+
+    Returns:
+        None
+    """
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, timer=timer)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    timer.now = 31
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_reopens_when_trial_fails():
+    """
+    Test that a failed trial call opens the breaker again.
+
+    Returns:
+        None
+    """
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, timer=timer)
+    breaker.record_failure()
+
+    timer.now = 31
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_release_lets_next_call_be_the_trial():
+    """
+    Test that releasing an abandoned trial call moves the breaker back to open, ready for a new trial.
+
+    Returns:
+        None
+    """
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, timer=timer)
+    breaker.record_failure()
+    timer.now = 31
+
+    assert breaker.allow_request()
+    breaker.release()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_latency_tracker_threshold():
+    """
+    Test that the hedging threshold is only reported once enough samples are recorded.
+
+    Returns:
+        None
+    """
+    tracker = LatencyTracker(quantile=0.95, min_samples=20)
+    for i in range(1, 20):
+        tracker.record(i / 100)
+    assert tracker.threshold() is None
+
+    tracker.record(0.2)
+    assert tracker.threshold() == 0.19
+
+
+def test_backoff_delay_is_capped():
+    """
+    Test that backoff delays stay within the exponential ceiling and the maximum.
+
+    Returns:
+        None
+    """
+    assert all(0 <= backoff_delay(attempt, 0.1, 0.5) <= min(0.5, 0.1 * 2 ** attempt) for attempt in range(8))
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -106,3 +107,57 @@ def test_calculate_statistics(berry_service, growth_times, expected):
 
     for key, value in expected.items():
         assert pytest.approx(result[key]) == value
+
+
+@pytest.mark.asyncio
+async def test_get_all_berry_stats_coalesces_concurrent_calls(berry_service, mock_berry_data):
+    """
+    Test that concurrent callers share a single crawl of the PokeAPI.
+
+    Args:
+        berry_service: The instance of the BerryService being tested.
+        mock_berry_data: Mock data used for testing the berry statistics.
+
+    Returns:
+        None
+    """
+    async def slow_get_all_berries():
+        await asyncio.sleep(0.01)
+        return mock_berry_data['berries']
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        with patch('app.clients.poke_api.PokeAPIClient.get_berry_details') as mock_get_details:
+            mock_get_berries.side_effect = slow_get_all_berries
+            mock_get_details.side_effect = lambda name: mock_berry_data['berry_details'][name]
+
+            results = await asyncio.gather(*(berry_service.get_all_berry_stats() for _ in range(5)))
+
+            assert mock_get_berries.call_count == 1
+            assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_get_all_berry_stats_coalesced_calls_share_error(berry_service):
+    """
+    Test that concurrent callers all receive the error of the shared computation.
+
+    Args:
+        berry_service: The instance of the BerryService being tested.
+
+    Returns:
+        None
+    """
+    async def failing_get_all_berries():
+        await asyncio.sleep(0.01)
+        raise Exception("API Error")
+
+    with patch('app.clients.poke_api.PokeAPIClient.get_all_berries') as mock_get_berries:
+        mock_get_berries.side_effect = failing_get_all_berries
+
+        results = await asyncio.gather(
+            *(berry_service.get_all_berry_stats() for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert mock_get_berries.call_count == 1
+        assert all(isinstance(result, ServiceError) for result in results)
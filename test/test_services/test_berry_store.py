@@ -0,0 +1,85 @@
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.services.berry_store import BerryFilter, BerryStore, parse_filter
+
+
+@pytest.fixture
+def berry_store(mock_berry_records):
+    return BerryStore(mock_berry_records)
+
+
+def selected_names(store: BerryStore, filters) -> list:
+    """Returns the names of the berries matching the filters."""
+    mask = store.mask(filters)
+    return [name for name, selected in zip(store.names, mask) if selected]
+
+
+def test_berry_store_indexes(berry_store):
+    """
+    Test that the name and category indexes point at the right rows.
+
+    Args:
+        berry_store: The BerryStore being tested.
+
+    Returns:
+        None
+    """
+    assert berry_store.row(" Wiki ") == 3
+    assert berry_store.row("unknown") is None
+    assert berry_store.categories["firmness"] == ["hard", "soft", "super-hard", "very-hard", "very-soft"]
+    assert berry_store.category_index["firmness"]["very-soft"].tolist() == [2, 4]
+
+
+@pytest.mark.parametrize("expressions,expected", [
+    ([], ["cheri", "chesto", "pecha", "wiki", "rowap", "ganlon"]),
+    (["firmness=very-soft"], ["pecha", "rowap"]),
+    (["firmness=very-soft", "growth_time>5"], ["rowap"]),
+    (["firmness!=very-soft", "size<=52"], ["cheri", "ganlon"]),
+    (["natural_gift_type=grass"], [])
+])
+def test_berry_store_mask(berry_store, expressions, expected):
+    """
+    Test that filters combine into the expected selection of berries.
+
+    Args:
+        berry_store: The BerryStore being tested.
+        expressions: The filter expressions to apply.
+        expected: The names of the berries expected to match.
+
+    Returns:
+        None
+    """
+    filters = [parse_filter(expression) for expression in expressions]
+
+    assert selected_names(berry_store, filters) == expected
+
+
+def test_berry_store_matrix_selects_masked_rows(berry_store):
+    """
+    Test that the matrix has one column per field and only the masked rows.
+
+    Args:
+        berry_store: The BerryStore being tested.
+
+    Returns:
+        None
+    """
+    mask = berry_store.mask([BerryFilter("growth_time", ">", 5.0)])
+
+    assert berry_store.matrix(["growth_time", "size"], mask).tolist() == [[24, 52], [24, 33]]
+
+
+@pytest.mark.parametrize("expression", ["color=red", "growth_time>fast", "firmness>hard", "growth_time"])
+def test_parse_filter_rejects_invalid_expressions(expression):
+    """
+    Test that malformed filters are rejected with a ValidationException.
+
+    Args:
+        expression: The invalid filter expression.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValidationException):
+        parse_filter(expression)
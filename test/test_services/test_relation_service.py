@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.poke_api import PokeAPIClient
+from app.services.berry_service import project_berry
+from app.services.relation_service import RelationService, berry_links
+from app.services.snapshot_service import StatsSnapshot
+from bench.fake_pokeapi import FakeCatalog, create_app
+
+FAKE_BASE_URL = "http://fake/api/v2"
+
+
+async def upstream_calls(fake) -> dict:
+    """Returns the number of requests the fake PokeAPI received for each endpoint."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake), base_url="http://fake") as upstream:
+        return (await upstream.get("/__stats")).json()["by_endpoint"]
+
+
+def build_service(fake) -> RelationService:
+    """Builds a RelationService whose PokeAPI requests are answered by the fake PokeAPI."""
+    client = PokeAPIClient(transport=httpx.ASGITransport(app=fake))
+    client.base_url = FAKE_BASE_URL
+    client.cache = None
+    client.hedge_enabled = False
+    service = RelationService()
+    service.client = client
+    return service
+
+
+def test_berry_links():
+    """
+    Test that a projected berry links to its firmness, each of its flavors and its item.
+
+    Returns:
+        None
+    """
+    berry = {"name": "cheri", "firmness": "soft", "flavors": {"spicy": 10, "dry": 0}, "item": "cheri-berry"}
+
+    assert berry_links(berry) == [
+        "berry-firmness/soft", "berry-flavor/spicy", "berry-flavor/dry", "item/cheri-berry"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crawl_fetches_each_distinct_resource_once():
+    """
+    Test that the crawl requests every distinct linked resource exactly once and reports the calls saved.
+
+    Returns:
+        None
+    """
+    fake = create_app(catalog_size=64, base_url=FAKE_BASE_URL)
+    berries = [project_berry(berry) for berry in FakeCatalog(64, base_url=FAKE_BASE_URL).berries]
+    service = build_service(fake)
+
+    result = await service.crawl(link for berry in berries for link in berry_links(berry))
+    await service.client.aclose()
+    calls = await upstream_calls(fake)
+
+    assert result.summary() == {"references": 64 * 7, "fetched": 74, "saved": 64 * 7 - 74, "errors": 0}
+    assert calls == {"berry-firmness/{name}": 5, "berry-flavor/{name}": 5, "item/{name}": 64}
+
+
+@pytest.mark.asyncio
+async def test_get_aggregates_crawls_once_per_snapshot():
+    """
+    Test that concurrent requests for the aggregates of a snapshot share one crawl, and that the flavor and
+    firmness aggregates are built from the resolved resources.
+
+    Returns:
+        None
+    """
+    fake = create_app(catalog_size=16, base_url=FAKE_BASE_URL)
+    catalog = FakeCatalog(16, base_url=FAKE_BASE_URL)
+    berries = [project_berry(berry) for berry in catalog.berries]
+    snapshot = StatsSnapshot(stats={}, built_at=0.0, berries=berries)
+    service = build_service(fake)
+
+    first, second = await asyncio.gather(service.get_aggregates(snapshot), service.get_aggregates(snapshot))
+    await service.client.aclose()
+    calls = await upstream_calls(fake)
+
+    assert first is second
+    assert calls["berry-flavor/{name}"] == 5
+    spicy = next(flavor for flavor in first["flavors"]["flavors"] if flavor["flavor"] == "spicy")
+    assert (spicy["display_name"], spicy["contest_type"]) == ("Spicy", "cool")
+    assert spicy["berries"] == sum(1 for berry in berries if berry["flavors"]["spicy"])
+    firmness = first["firmness"]["firmness"]
+    assert sum(len(group["berries_names"]) for group in firmness) == 16
+    costs = [catalog.linked["item"][berry["item"]]["cost"] for berry in berries]
+    assert min(group["min_item_cost"] for group in firmness) == min(costs)
@@ -0,0 +1,176 @@
+import httpx
+import pytest
+
+from app.clients.poke_api import PokeAPIClient
+from app.core.exceptions import NotFoundError, ValidationException
+from app.services.resource_stats_service import ResourceStatsService, extract_values, numeric_skeleton
+from app.utils.cache import TTLCache
+
+POKEMON = {
+    "bulbasaur": {"base_experience": 64, "stats": [{"base_stat": 45}, {"base_stat": 49}]},
+    "ivysaur": {"base_experience": 142, "stats": [{"base_stat": 60}, {"base_stat": 62}]},
+    "venusaur": {"base_experience": None, "stats": [{"base_stat": 80}, {"base_stat": 82}]}
+}
+
+
+def build_service(requested: list) -> ResourceStatsService:
+    """Builds a ResourceStatsService whose PokeAPI requests are answered from POKEMON and recorded."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/v2/")
+        requested.append(path)
+        if path == "pokemon":
+            return httpx.Response(200, json={
+                "count": len(POKEMON) + 1,
+                "results": [{"name": name} for name in [*POKEMON, "missingno"]]
+            })
+        name = path.split("/", 1)[1] if path.startswith("pokemon/") else None
+        if name in POKEMON:
+            return httpx.Response(200, json=POKEMON[name])
+        return httpx.Response(404)
+
+    client = PokeAPIClient(transport=httpx.MockTransport(handler))
+    client.base_url = "https://pokeapi.test/api/v2"
+    client.cache = TTLCache(maxsize=64, ttl=60)
+    client.hedge_enabled = False
+    service = ResourceStatsService()
+    service.client = client
+    service.cache = TTLCache(maxsize=8, ttl=60)
+    service.crawls = TTLCache(maxsize=2, ttl=60)
+    return service
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("base_experience", [64]),
+    ("stats.base_stat", [45, 49]),
+    ("stats.1.base_stat", [49]),
+    ("stats.5.base_stat", []),
+    ("name", []),
+    ("height", [])
+])
+def test_extract_values_follows_dotted_paths(path, expected):
+    """
+    Test that dotted paths index objects and lists, fan out over lists and keep only numbers.
+
+    Args:
+        path: The dotted field path.
+        expected: The values expected at the path.
+
+    Returns:
+        None
+    """
+    payload = {"name": "bulbasaur", **POKEMON["bulbasaur"]}
+
+    assert extract_values(payload, path) == expected
+    assert extract_values(numeric_skeleton(payload), path) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_field_stats_aggregates_every_entry_and_caches_the_result():
+    """
+    Test that every entry is fetched once, entries without a value or that failed are counted, and a second
+    request is served from the result cache.
+
+    Returns:
+        None
+    """
+    requested = []
+    service = build_service(requested)
+
+    stats = await service.get_field_stats("pokemon", "base_experience")
+    calls = len(requested)
+    again = await service.get_field_stats("pokemon", "base_experience")
+    await service.client.aclose()
+
+    assert stats == again
+    assert len(requested) == calls == 1 + len(POKEMON) + 1
+    assert (stats["entries"], stats["count"], stats["missing"], stats["errors"]) == (4, 2, 1, 1)
+    assert (stats["min"], stats["max"], stats["median"]) == (64.0, 142.0, 103.0)
+    assert stats["frequency"] == [{"value": 64, "frequency": 1}, {"value": 142, "frequency": 1}]
+
+
+@pytest.mark.asyncio
+async def test_get_field_stats_reuses_the_crawl_for_another_field():
+    """
+    Test that a second field of the same resource is computed from the kept crawl, without calling the
+    PokeAPI, and that the entries are not stored in the shared PokeAPI response cache.
+
+    Returns:
+        None
+    """
+    requested = []
+    service = build_service(requested)
+
+    await service.get_field_stats("pokemon", "base_experience")
+    before = len(requested)
+    stats = await service.get_field_stats("pokemon", "stats.base_stat")
+    await service.client.aclose()
+
+    assert stats["count"] == 6
+    assert stats["max"] == 82.0
+    assert requested[before:] == []
+    assert all(f"pokemon/{name}" not in service.client.cache for name in POKEMON)
+
+
+@pytest.mark.asyncio
+async def test_get_field_stats_rejects_large_resources_after_the_first_page():
+    """
+    Test that a resource larger than the limit is rejected before its other pages and entries are fetched.
+
+    Returns:
+        None
+    """
+    requested = []
+    service = build_service(requested)
+    service.max_entries = 2
+
+    for _ in range(3):
+        with pytest.raises(ValidationException):
+            await service.get_field_stats("pokemon", "height")
+    await service.client.aclose()
+
+    assert requested == ["pokemon"]
+
+
+@pytest.mark.asyncio
+async def test_get_field_stats_caches_missing_resources_and_fields():
+    """
+    Test that an unknown resource is rejected without calling the PokeAPI, and that repeating a request
+    for a field without values does not call the PokeAPI again.
+
+    Returns:
+        None
+    """
+    requested = []
+    service = build_service(requested)
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            await service.get_field_stats("digimon", "level")
+        with pytest.raises(NotFoundError):
+            await service.get_field_stats("pokemon", "nope")
+    await service.client.aclose()
+
+    assert "digimon" not in requested
+    assert requested.count("pokemon") == 1
+    assert len(requested) == 1 + len(POKEMON) + 1
+
+
+@pytest.mark.asyncio
+async def test_get_field_stats_rejects_bad_requests():
+    """
+    Test that malformed names, unknown resources and fields without values are rejected.
+
+    Returns:
+        None
+    """
+    service = build_service([])
+
+    with pytest.raises(ValidationException):
+        await service.get_field_stats("../pokemon", "base_experience")
+    with pytest.raises(ValidationException):
+        await service.get_field_stats("pokemon", "stats..base_stat")
+    with pytest.raises(NotFoundError):
+        await service.get_field_stats("digimon", "level")
+    with pytest.raises(NotFoundError):
+        await service.get_field_stats("pokemon", "name")
+    await service.client.aclose()
@@ -0,0 +1,266 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.exceptions import ServiceError
+from app.services.snapshot_service import SnapshotService
+
+STATS = {
+    "berries_names": ["cheri"],
+    "min_growth_time": 3.0,
+    "median_growth_time": 3.0,
+    "max_growth_time": 3.0,
+    "variance_growth_time": 0.0,
+    "mean_growth_time": 3.0,
+    "frequency_growth_time": [{"growth_time": 3, "frequency": 1}]
+}
+
+
+@pytest.fixture
+def snapshot_service():
+    return SnapshotService(refresh_interval=3600)
+
+
+@pytest.mark.asyncio
+async def test_get_builds_snapshot_once(snapshot_service):
+    """
+    Test that the first read builds the snapshot and later reads reuse it.
+
+    Args:
+        snapshot_service: The instance of the SnapshotService being tested.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+
+        first = await snapshot_service.get()
+        second = await snapshot_service.get()
+
+        assert first is second
+        assert first.stats == STATS
+        assert mock_stats.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_publish_one_snapshot(tmp_path):
+    """
+    Test that concurrent reads on a cold worker share one build, one generation and one file write.
+
+    Args:
+        tmp_path: A temporary directory for the snapshot file.
+
+    Returns:
+        None
+    """
+    async def get_all_berry_stats():
+        await asyncio.sleep(0.01)
+        return STATS
+
+    service = SnapshotService(refresh_interval=3600, path=str(tmp_path / "snapshot.bin"))
+    try:
+        with patch('app.services.berry_service.BerryService.get_all_berry_stats', side_effect=get_all_berry_stats), \
+                patch.object(service, 'save') as mock_save:
+            snapshots = await asyncio.gather(*(service.get() for _ in range(50)))
+
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert service.generation == 1
+        assert mock_save.call_count == 1
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_last_good_snapshot(snapshot_service):
+    """
+    Test that a failed background refresh keeps serving the previous snapshot.
+
+    Args:
+        snapshot_service: The instance of the SnapshotService being tested.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        await snapshot_service.start()
+
+        mock_stats.side_effect = ServiceError("PokeAPI down")
+        await snapshot_service._safe_refresh()
+        await snapshot_service.stop()
+
+        assert snapshot_service.current.stats == STATS
+        assert snapshot_service.last_error == "PokeAPI down"
+
+
+@pytest.mark.asyncio
+async def test_start_serves_saved_snapshot_before_revalidating(tmp_path):
+    """
+    Test that a new service serves the snapshot saved on disk without waiting for the PokeAPI.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "snapshot.bin")
+    berries = [{"name": "cheri", "growth_time": 3}]
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        with patch('app.services.berry_service.berry_service.berries', berries):
+            await SnapshotService(refresh_interval=3600, path=path).refresh()
+
+    warm_service = SnapshotService(refresh_interval=3600, path=path)
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.side_effect = ServiceError("PokeAPI down")
+        await warm_service.start()
+
+        assert warm_service.current.stats == STATS
+        assert warm_service.current.berries == berries
+        await warm_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_only_publisher_fetches_and_workers_follow_new_generations(tmp_path):
+    """
+    Test that, of several workers sharing a snapshot file, only the lock holder calls the PokeAPI and the
+    others load each generation it publishes.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "snapshot.bin")
+    publisher = SnapshotService(refresh_interval=3600, path=path, poll_interval=3600)
+    follower = SnapshotService(refresh_interval=3600, path=path, poll_interval=3600)
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        await publisher.start()
+        await follower.start()
+
+        assert publisher.is_publisher
+        assert not follower.is_publisher
+        assert (await follower.get()).stats == STATS
+        assert follower.generation == publisher.generation == 1
+        assert not follower.sync()
+
+        mock_stats.return_value = {**STATS, "berries_names": ["cheri", "chesto"]}
+        await publisher.refresh()
+
+        assert follower.sync()
+        assert follower.generation == 2
+        assert follower.current.stats["berries_names"] == ["cheri", "chesto"]
+        assert mock_stats.call_count == 2
+
+        await follower.stop()
+        await publisher.stop()
+
+
+@pytest.mark.asyncio
+async def test_worker_takes_over_publishing_when_publisher_stops(tmp_path):
+    """
+    Test that another worker becomes the publisher once the lock is released, continuing the generations.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "snapshot.bin")
+    publisher = SnapshotService(refresh_interval=3600, path=path, poll_interval=3600)
+    follower = SnapshotService(refresh_interval=3600, path=path, poll_interval=3600)
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        await publisher.start()
+        await follower.start()
+        await publisher.stop()
+
+        assert follower._acquire_publisher_lock()
+        await follower.refresh()
+
+        assert follower.generation == 2
+        await follower.stop()
+
+
+@pytest.mark.asyncio
+async def test_worker_without_published_snapshot_does_not_fetch(tmp_path):
+    """
+    Test that a worker that does not hold the lock never calls the PokeAPI, and reports an error when no
+    snapshot is published in time.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "snapshot.bin")
+    publisher = SnapshotService(path=path)
+    assert publisher._acquire_publisher_lock()
+    follower = SnapshotService(path=path, poll_interval=0.01, wait_timeout=0.05)
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        with pytest.raises(ServiceError):
+            await follower.get()
+
+        assert mock_stats.call_count == 0
+    await publisher.stop()
+
+
+@pytest.mark.asyncio
+async def test_start_without_waiting_builds_snapshot_in_background(snapshot_service):
+    """
+    Test that start(wait=False) returns before the initial build, which then runs in the background task.
+
+    Args:
+        snapshot_service: The instance of the SnapshotService being tested.
+
+    Returns:
+        None
+    """
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        await snapshot_service.start(wait=False)
+
+        assert snapshot_service.current is None
+        await asyncio.sleep(0.01)
+
+        assert snapshot_service.current.stats == STATS
+        assert mock_stats.call_count == 1
+        await snapshot_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_unwritable_snapshot_path_falls_back_to_memory(tmp_path):
+    """
+    Test that a snapshot path whose lock file cannot be created does not prevent startup, and that
+    snapshots are then kept in memory.
+
+    Args:
+        tmp_path: A temporary directory, in which a regular file blocks the snapshot directory.
+
+    Returns:
+        None
+    """
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    service = SnapshotService(refresh_interval=3600, path=str(blocker / "dir" / "snapshot.bin"))
+
+    with patch('app.services.berry_service.BerryService.get_all_berry_stats') as mock_stats:
+        mock_stats.return_value = STATS
+        await service.start(wait=False)
+        snapshot = await service.get()
+        await service.stop()
+
+    assert service.path is None
+    assert service.is_publisher
+    assert snapshot.stats == STATS
@@ -0,0 +1,209 @@
+import numpy as np
+import pytest
+
+from app.core.exceptions import ServiceError
+from app.services.stats_service import StatsService, StreamingStats
+
+
+@pytest.fixture
+def stats_service():
+    return StatsService()
+
+
+@pytest.mark.parametrize("data", [
+    [3],
+    [2, 3, 4],
+    [24, 2, 15, 15, 8, 3, 3, 18, 12, 5],
+    [5, 1, 1, 9]
+])
+def test_calculate_statistics_matches_numpy(stats_service, data):
+    """
+    Test that the statistics match the NumPy reference implementation.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+        data: The values to calculate statistics for.
+
+    Returns:
+        None
+    """
+    result = stats_service.calculate_statistics(data)
+
+    assert result['min'] == float(np.min(data))
+    assert result['max'] == float(np.max(data))
+    assert result['median'] == float(np.median(data))
+    assert pytest.approx(result['mean']) == float(np.mean(data))
+    assert pytest.approx(result['variance']) == float(np.var(data))
+    assert result['frequency'] == [
+        {"growth_time": value, "frequency": data.count(value)} for value in sorted(set(data))
+    ]
+
+
+def test_calculate_statistics_empty_data(stats_service):
+    """
+    Test that an empty list raises a ServiceError.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ServiceError):
+        stats_service.calculate_statistics([])
+
+
+def test_streaming_stats_merge_matches_single_pass():
+    """
+    Test that merging partial aggregators gives the same result as aggregating all values at once.
+
+    Returns:
+        None
+    """
+    data = [24, 2, 15, 15, 8, 3, 3, 18, 12, 5, 2]
+
+    left = StreamingStats().update(data[:4])
+    right = StreamingStats()
+    for value in data[4:]:
+        right.add(value)
+    merged = left.merge(right).to_dict()
+    expected = StreamingStats().update(data).to_dict()
+
+    for key in ('min', 'max', 'median', 'frequency'):
+        assert merged[key] == expected[key]
+    assert pytest.approx(merged['mean']) == expected['mean']
+    assert pytest.approx(merged['variance']) == expected['variance']
+
+
+def test_calculate_matrix_statistics_matches_per_column(stats_service):
+    """
+    Test that the vectorized matrix statistics match the statistics of each column on its own.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+
+    Returns:
+        None
+    """
+    matrix = np.array([[3, 20], [3, 80], [5, 115], [24, 52], [24, 33]])
+
+    results = stats_service.calculate_matrix_statistics(matrix)
+
+    for column, result in enumerate(results):
+        expected = stats_service.calculate_statistics(matrix[:, column].tolist())
+        for key in ('min', 'max', 'median'):
+            assert result[key] == expected[key]
+        assert pytest.approx(result['mean']) == expected['mean']
+        assert pytest.approx(result['variance']) == expected['variance']
+        assert result['frequency'] == [
+            {"value": item["growth_time"], "frequency": item["frequency"]} for item in expected['frequency']
+        ]
+
+
+@pytest.mark.parametrize("matrix", [
+    np.array([[3, 20], [3, 80], [5, 115], [24, 52], [24, 33]]),
+    np.array([[3, 4, 1], [5, 4, 2], [4, 6, 2], [8, 5, 1]]),
+    np.array([[-2, 7], [0, 7], [-5, 9]]),
+    np.array([[0.5, 2.0], [1.5, 3.0]]),
+    np.array([[1, 10 ** 6], [2, 0]])
+])
+def test_calculate_column_medians_matches_numpy(stats_service, matrix):
+    """
+    Test that the medians read from the combined histogram match ``np.median`` for odd and even row counts,
+    negative values, floats and widely spread integers.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+        matrix: The matrix whose column medians are calculated.
+
+    Returns:
+        None
+    """
+    assert stats_service.calculate_column_medians(matrix).tolist() == np.median(matrix, axis=0).tolist()
+
+
+def test_calculate_grouped_statistics_matches_per_group(stats_service):
+    """
+    Test that the grouped statistics match the statistics of each group on its own.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+
+    Returns:
+        None
+    """
+    codes = np.array([2, 0, 2, 2, 0, 2])
+    values = np.array([3, 24, 5, 3, 2, 18])
+
+    results = stats_service.calculate_grouped_statistics(codes, values, 3)
+
+    assert results[1] is None
+    for code in (0, 2):
+        expected = stats_service.calculate_statistics(values[codes == code].tolist())
+        assert results[code]['count'] == int((codes == code).sum())
+        for key in ('min', 'max', 'median', 'frequency'):
+            assert results[code][key] == expected[key]
+        assert pytest.approx(results[code]['mean']) == expected['mean']
+        assert pytest.approx(results[code]['variance']) == expected['variance']
+
+
+@pytest.mark.parametrize("values", [
+    [7],
+    [3, 3, 3, 5, 24, 24],
+    list(range(-10, 90, 7)),
+    [1, 10 ** 9],
+    [1.5, 2.0, 9.25]
+])
+def test_calculate_quantiles_matches_numpy(stats_service, values):
+    """
+    Test that quantiles from the cumulative histogram, and from the fallback paths, match np.quantile.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+        values: The values to calculate quantiles for.
+
+    Returns:
+        None
+    """
+    quantiles = [0, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1]
+
+    result = stats_service.calculate_quantiles(np.array(values), quantiles)
+
+    assert result == pytest.approx(np.quantile(values, quantiles).tolist())
+
+
+def test_calculate_quantiles_rejects_invalid_input(stats_service):
+    """
+    Test that quantiles outside of 0 to 1 and empty data are rejected.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        stats_service.calculate_quantiles(np.array([1, 2]), [1.5])
+    with pytest.raises(ValueError):
+        stats_service.calculate_quantiles(np.array([], dtype=np.int64), [0.5])
+
+
+def test_calculate_histogram_uses_whole_number_bins(stats_service):
+    """
+    Test that integer values are counted into bins of a whole number of values covering their range.
+
+    Args:
+        stats_service: The instance of the StatsService being tested.
+
+    Returns:
+        None
+    """
+    result = stats_service.calculate_histogram(np.array([2, 3, 3, 5, 8, 24, 24]), 4)
+
+    assert result == [
+        {"start": 2, "end": 7, "count": 4},
+        {"start": 8, "end": 13, "count": 1},
+        {"start": 14, "end": 19, "count": 0},
+        {"start": 20, "end": 24, "count": 2}
+    ]
+    assert sum(item["count"] for item in stats_service.calculate_histogram(np.array([1.0, 2.5, 4.0]), 2)) == 3
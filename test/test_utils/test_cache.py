@@ -0,0 +1,82 @@
+import pytest
+
+from app.utils.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for cache expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expires_entries_after_ttl():
+    """
+    Test that entries are served while fresh, counted as misses once expired and still readable as stale.
+
+    Returns:
+        None
+    """
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=10, timer=timer)
+    cache.set("berry/cheri", {"name": "cheri"})
+
+    assert cache.get("berry/cheri") == {"name": "cheri"}
+
+    timer.now = 11
+    assert cache.get("berry/cheri") is None
+    assert cache.get_stale("berry/cheri") == {"name": "cheri"}
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Test that the least recently used entry is evicted when the cache is full.
+
+    Returns:
+        None
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_cache_rejects_invalid_size():
+    """
+    Test that a non-positive maxsize is rejected.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0, ttl=60)
+
+
+def test_cache_touch_extends_expired_entry():
+    """
+    Test that touching an expired entry makes it fresh again with the same value.
+
+    Returns:
+        None
+    """
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=10, timer=timer)
+    cache.set("berry/cheri", {"name": "cheri"})
+
+    timer.now = 11
+    assert cache.touch("berry/cheri")
+    assert not cache.touch("berry/chesto")
+    assert cache.get("berry/cheri") == {"name": "cheri"}
+
+    timer.now = 22
+    assert "berry/cheri" not in cache
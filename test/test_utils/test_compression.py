@@ -0,0 +1,40 @@
+import gzip
+
+import pytest
+
+from app.utils.compression import AVAILABLE_ENCODINGS, compress
+
+
+@pytest.mark.parametrize("encoding", AVAILABLE_ENCODINGS)
+def test_compress_round_trip(encoding):
+    """
+    Test that every available content coding can be decoded back to the original body.
+
+    Args:
+        encoding: The content coding.
+
+    Returns:
+        None
+    """
+    body = b'{"berries_names":["cheri","chesto"]}' * 20
+    compressed = compress(body, encoding)
+
+    if encoding == "gzip":
+        assert gzip.decompress(compressed) == body
+        assert compressed == compress(body, encoding)
+    elif encoding == "br":
+        brotli = pytest.importorskip("brotli")
+        assert brotli.decompress(compressed) == body
+    else:
+        assert compressed is body
+
+
+def test_compress_rejects_unknown_encoding():
+    """
+    Test that an unsupported content coding is rejected.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        compress(b"{}", "deflate")
@@ -0,0 +1,48 @@
+import pytest
+
+from app.utils.http import etag_matches, negotiate_encoding
+
+
+@pytest.mark.parametrize("if_none_match,expected", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ('*', True),
+    ('"xyz"', False)
+])
+def test_etag_matches(if_none_match, expected):
+    """
+    Test If-None-Match matching against a strong entity tag.
+
+    Args:
+        if_none_match: The If-None-Match header value.
+        expected: Whether the header should match.
+
+    Returns:
+        None
+    """
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+@pytest.mark.parametrize("accept_encoding,expected", [
+    (None, "identity"),
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("*", "br"),
+    ("br;q=0, *;q=0.1", "gzip"),
+    ("deflate", "identity")
+])
+def test_negotiate_encoding(accept_encoding, expected):
+    """
+    Test the choice of a content coding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: The Accept-Encoding header value.
+        expected: The coding that should be chosen.
+
+    Returns:
+        None
+    """
+    assert negotiate_encoding(accept_encoding, ("br", "gzip", "identity")) == expected
@@ -0,0 +1,60 @@
+from app.utils.snapshot_file import read_snapshot_file, read_snapshot_generation, write_snapshot_file
+
+
+def test_snapshot_file_round_trip(tmp_path):
+    """
+    Test that the sections written to a snapshot file are read back unchanged.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "nested" / "snapshot.bin")
+    write_snapshot_file(path, 1700000000.5, b'{"a":1}', b"", b"[1,2,3]")
+
+    contents = read_snapshot_file(path)
+
+    assert contents.built_at == 1700000000.5
+    assert contents.sections == (b'{"a":1}', b"", b"[1,2,3]")
+
+
+def test_snapshot_file_rejects_missing_and_corrupt_files(tmp_path):
+    """
+    Test that missing, empty and truncated snapshot files are ignored.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "snapshot.bin"
+    assert read_snapshot_file(str(path)) is None
+
+    path.write_bytes(b"")
+    assert read_snapshot_file(str(path)) is None
+
+    write_snapshot_file(str(path), 0.0, b"payload")
+    path.write_bytes(path.read_bytes()[:-1])
+    assert read_snapshot_file(str(path)) is None
+
+
+def test_snapshot_file_generation(tmp_path):
+    """
+    Test that the generation counter is stored in the header and can be read without the sections.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        None
+    """
+    path = str(tmp_path / "snapshot.bin")
+    assert read_snapshot_generation(path) is None
+
+    write_snapshot_file(path, 0.0, b"payload", generation=7)
+
+    assert read_snapshot_generation(path) == 7
+    assert read_snapshot_file(path).generation == 7